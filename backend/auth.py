@@ -1,8 +1,8 @@
 """API key authentication middleware for Cloud Run deployment.
 
 Protects /api/* routes with X-Council-Key header validation.
-Skips auth for /health, /, explicitly enabled direct Tailscale ingress, and when
-COUNCIL_API_KEY is not set (local dev).
+Skips auth for /health, /, OPTIONS preflights, explicitly enabled direct Tailscale
+ingress, and when COUNCIL_API_KEY is not set (local dev).
 """
 
 import ipaddress
@@ -67,8 +67,13 @@ class ApiKeyMiddleware(BaseHTTPMiddleware):
         if not COUNCIL_API_KEY:
             return await call_next(request)
 
+        # CORS preflights carry no credentials; let CORSMiddleware/routing answer
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
         # Public paths — always allowed
-        if request.url.path in _PUBLIC_PATHS:
+        path = request.url.path
+        if path in _PUBLIC_PATHS:
             return await call_next(request)
 
         # Tailscale IPs — authenticated at network layer only when this service
@@ -85,18 +90,20 @@ class ApiKeyMiddleware(BaseHTTPMiddleware):
             logger.warning(
                 "Missing X-Council-Key header from %s %s",
                 request.method,
-                request.url.path,
+                path,
             )
             return JSONResponse(
                 status_code=401,
                 content={"detail": "Missing X-Council-Key header"},
             )
 
-        if not secrets.compare_digest(provided_key, COUNCIL_API_KEY):
+        # Compare bytes: compare_digest rejects non-ASCII str operands with
+        # TypeError, and header values are client-controlled.
+        if not secrets.compare_digest(provided_key.encode(), COUNCIL_API_KEY.encode()):
             logger.warning(
                 "Invalid API key from %s %s",
                 request.method,
-                request.url.path,
+                path,
             )
             return JSONResponse(
                 status_code=403,
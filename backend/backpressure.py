@@ -0,0 +1,162 @@
+"""AIMD concurrency limiter for provider clients.
+
+The permit count grows additively while a provider answers quickly and shrinks
+multiplicatively on 429/5xx or connection failures, so council fan-out backs off
+a degraded provider instead of piling retries onto it.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+
+logger = logging.getLogger("llm-council.backpressure")
+
+# Status codes treated as overload signals (multiplicative decrease).
+_OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Throttle when fewer than this fraction of the provider's request quota remains.
+_LOW_REMAINING_FRACTION = 0.1
+# Upper bound on a header-driven pause; daily quota resets must not stall a worker.
+MAX_THROTTLE_SECONDS = 60.0
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    """Parse a delay header value such as ``"2"``, ``"1.5"`` or ``"3s"``."""
+    if not value:
+        return None
+    try:
+        seconds = float(value.strip().removesuffix("s"))
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def _parse_int(value: str | None) -> int | None:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+class AimdLimiter:
+    """In-process concurrency limit adjusted by additive-increase/multiplicative-decrease.
+
+    Use as ``async with limiter:`` around one provider request, then report the
+    outcome with ``record()`` (or ``on_error()`` for transport failures) before
+    the block exits.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        c_min: int = 1,
+        c_max: int = 32,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        target_ms: float = 1500.0,
+        name: str = "provider",
+    ) -> None:
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.target_ms = target_ms
+        self.name = name
+        self._limit = float(min(max(initial, c_min), c_max))
+        self._in_flight = 0
+        # Created on first use in each event loop, like the pooled HTTP clients:
+        # asyncio primitives bind to the loop that first waits on them.
+        self._cond: asyncio.Condition | None = None
+        self._cond_loop: asyncio.AbstractEventLoop | None = None
+        self._paused_until = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current number of permits."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            # Permits held on a previous loop can never be released on this one.
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+            self._in_flight = 0
+        return self._cond
+
+    async def acquire(self) -> None:
+        # Honour provider-advertised throttling before taking a permit.
+        while (delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        # Return the permit before awaiting anything, so a cancellation delivered
+        # while waiting for the lock cannot leak it; the wake-up is shielded too.
+        self._in_flight -= 1
+        await asyncio.shield(self._notify_waiters(self._condition()))
+
+    @staticmethod
+    async def _notify_waiters(cond: asyncio.Condition) -> None:
+        async with cond:
+            cond.notify_all()
+
+    async def __aenter__(self) -> "AimdLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+    def record(self, latency_ms: float, status: int) -> None:
+        """Adjust the limit from one completed response.
+
+        ``latency_ms`` is whatever the caller compares against ``target_ms``;
+        streaming callers report time to response headers, since total stream
+        time mostly reflects output length rather than provider load.
+        """
+        if status in _OVERLOAD_STATUSES:
+            self.on_error()
+        elif status < 400 and latency_ms <= self.target_ms:
+            self._limit = min(float(self.c_max), self._limit + self.alpha)
+
+    def on_error(self) -> None:
+        """Multiplicative decrease after an overload or connection failure."""
+        previous = self.limit
+        self._limit = max(float(self.c_min), self._limit * self.beta)
+        if self.limit != previous:
+            logger.info("%s concurrency limit %d -> %d", self.name, previous, self.limit)
+
+    def throttle_until(self, deadline: float) -> None:
+        """Block new acquisitions until ``deadline`` (``time.monotonic()`` clock)."""
+        deadline = min(deadline, time.monotonic() + MAX_THROTTLE_SECONDS)
+        if deadline > self._paused_until:
+            self._paused_until = deadline
+            logger.info(
+                "%s throttled for %.1fs by rate-limit headers",
+                self.name,
+                deadline - time.monotonic(),
+            )
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Throttle proactively from ``retry-after``/``x-ratelimit-*`` response headers."""
+        retry_after = _parse_seconds(headers.get("retry-after"))
+        if retry_after is not None:
+            self.throttle_until(time.monotonic() + retry_after)
+            return
+
+        remaining = _parse_int(headers.get("x-ratelimit-remaining-requests"))
+        quota = _parse_int(headers.get("x-ratelimit-limit-requests"))
+        reset = _parse_seconds(headers.get("x-ratelimit-reset-requests"))
+        if remaining is None or not quota or reset is None:
+            return
+        if remaining < quota * _LOW_REMAINING_FRACTION:
+            self.throttle_until(time.monotonic() + reset)
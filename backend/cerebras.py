@@ -2,10 +2,16 @@
 
 import asyncio
 import logging
+import os
+import time
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+from . import json_codec
+from .backpressure import AimdLimiter
+from .http_clients import get_client, phase_timeout
 from .secrets import CEREBRAS_API_KEY
 
 # Cerebras API base URL
@@ -13,6 +19,24 @@ CEREBRAS_API_URL = "https://api.cerebras.ai/v1"
 logger = logging.getLogger("llm-council.cerebras")
 
 
+# Built on first request and cached per key value, so a key missing at import
+# (or swapped in tests) never bakes "Bearer None" into the headers. Callers
+# check the key is configured before building them.
+@lru_cache(maxsize=4)
+def _cerebras_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+
+
+# Caps in-flight Cerebras requests per process so council fan-out plus retries
+# queue locally instead of tripping provider 429s. The cap adapts (AIMD) to
+# observed latency and overload responses.
+CEREBRAS_MAX_CONCURRENCY = int(os.getenv("CEREBRAS_MAX_CONCURRENCY", "8"))
+_CEREBRAS_LIMITER = AimdLimiter(initial=CEREBRAS_MAX_CONCURRENCY, name="cerebras")
+
+
 async def query_cerebras_model(
     model_id: str,
     messages: list[dict[str, str]],
@@ -37,42 +61,117 @@ async def query_cerebras_model(
         logger.error("CEREBRAS_API_KEY not configured")
         return None
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            response = await client.post(
-                f"{CEREBRAS_API_URL}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {CEREBRAS_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": model_id,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                }
+    # Long completions stream so text is assembled as it arrives instead of
+    # buffering the whole body and decoding it in one pass.
+    use_streaming = max_tokens > 4096
+    payload: dict[str, Any] = {
+        "model": model_id,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    if use_streaming:
+        payload["stream"] = True
+    request_kwargs: dict[str, Any] = {
+        "headers": _cerebras_headers(CEREBRAS_API_KEY),
+        "content": json_codec.dumps(payload),
+        "timeout": phase_timeout(timeout),
+    }
+    url = f"{CEREBRAS_API_URL}/chat/completions"
+
+    try:
+        async with _CEREBRAS_LIMITER:
+            started = time.perf_counter()
+            try:
+                if use_streaming:
+                    async with get_client("cerebras").stream(
+                        "POST", url, **request_kwargs
+                    ) as response:
+                        # Time to headers: the additive increase tracks provider
+                        # responsiveness, not how long the completion streams.
+                        _CEREBRAS_LIMITER.record(
+                            (time.perf_counter() - started) * 1000, response.status_code
+                        )
+                        _CEREBRAS_LIMITER.observe_headers(response.headers)
+                        response.raise_for_status()
+                        data = await _parse_streaming_response(response)
+                    # GLM 4.7 may return 'reasoning' instead of 'content' for short outputs
+                    text = data["content"] or data["reasoning"]
+                    return {
+                        "content": text,
+                        "usage": data["usage"],
+                        "model": model_id,
+                        "provider": "cerebras"
+                    }
+
+                response = await get_client("cerebras").post(url, **request_kwargs)
+            except httpx.TransportError:
+                _CEREBRAS_LIMITER.on_error()
+                raise
+            _CEREBRAS_LIMITER.record(
+                (time.perf_counter() - started) * 1000, response.status_code
             )
-            response.raise_for_status()
-            data = response.json()
-
-            msg = data["choices"][0]["message"]
-            # GLM 4.7 may return 'reasoning' instead of 'content' for short outputs
-            text = msg.get("content") or msg.get("reasoning") or ""
-            return {
-                "content": text,
-                "usage": data.get("usage", {}),
-                "model": model_id,
-                "provider": "cerebras"
-            }
-        except httpx.HTTPStatusError as e:
-            logger.warning("HTTP error querying Cerebras %s: %s", model_id, e.response.status_code)
-            return None
-        except httpx.RequestError as e:
-            logger.warning("Request error querying Cerebras %s: %s", model_id, e)
-            return None
-        except Exception as e:
-            logger.warning("Error querying Cerebras %s: %s", model_id, e)
-            return None
+            _CEREBRAS_LIMITER.observe_headers(response.headers)
+        response.raise_for_status()
+        data = json_codec.loads(response.content)
+
+        msg = data["choices"][0]["message"]
+        # GLM 4.7 may return 'reasoning' instead of 'content' for short outputs
+        text = msg.get("content") or msg.get("reasoning") or ""
+        return {
+            "content": text,
+            "usage": data.get("usage", {}),
+            "model": model_id,
+            "provider": "cerebras"
+        }
+    except httpx.HTTPStatusError as e:
+        logger.warning("HTTP error querying Cerebras %s: %s", model_id, e.response.status_code)
+        return None
+    except httpx.RequestError as e:
+        logger.warning("Request error querying Cerebras %s: %s", model_id, e)
+        return None
+    except Exception as e:
+        logger.warning("Error querying Cerebras %s: %s", model_id, e)
+        return None
+
+
+async def _parse_streaming_response(response: Any) -> dict[str, Any]:
+    """Assemble OpenAI-compatible Cerebras SSE chunks into content/reasoning/usage."""
+    content_parts: list[str] = []
+    reasoning_parts: list[str] = []
+    usage: dict[str, Any] = {}
+
+    async for line in response.aiter_lines():
+        if not line.startswith("data: "):
+            continue
+
+        payload = line.removeprefix("data: ").strip()
+        if payload == "[DONE]":
+            break
+
+        try:
+            chunk = json_codec.loads(payload)
+        except ValueError:
+            continue
+
+        if isinstance(chunk.get("usage"), dict):
+            usage = chunk["usage"]
+
+        choices = chunk.get("choices") or []
+        if not choices:
+            continue
+
+        delta = choices[0].get("delta") or {}
+        if delta.get("content"):
+            content_parts.append(delta["content"])
+        if delta.get("reasoning"):
+            reasoning_parts.append(delta["reasoning"])
+
+    return {
+        "content": "".join(content_parts),
+        "reasoning": "".join(reasoning_parts),
+        "usage": usage,
+    }
 
 
 async def query_cerebras_models_parallel(
@@ -93,16 +192,17 @@ async def query_cerebras_models_parallel(
     Returns:
         Dict mapping model_id to response (or None on error)
     """
-    async def query_single(model_id: str) -> tuple[str, dict[str, Any] | None]:
-        result = await query_cerebras_model(
-            model_id, messages, max_tokens, temperature
-        )
-        return model_id, result
-
-    tasks = [query_single(model_id) for model_id in model_ids]
-    results = await asyncio.gather(*tasks)
-
-    return dict(results)
+    results = await asyncio.gather(
+        *(
+            query_cerebras_model(model_id, messages, max_tokens, temperature)
+            for model_id in model_ids
+        ),
+        return_exceptions=True,
+    )
+    return {
+        model_id: None if isinstance(result, BaseException) else result
+        for model_id, result in zip(model_ids, results)
+    }
 
 
 async def list_cerebras_models() -> list[dict[str, Any]]:
@@ -116,17 +216,15 @@ async def list_cerebras_models() -> list[dict[str, Any]]:
         logger.error("CEREBRAS_API_KEY not configured")
         return []
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{CEREBRAS_API_URL}/models",
-                headers={
-                    "Authorization": f"Bearer {CEREBRAS_API_KEY}",
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
-        except Exception as e:
-            logger.warning("Error listing Cerebras models: %s", e)
-            return []
+    try:
+        response = await get_client("cerebras").get(
+            f"{CEREBRAS_API_URL}/models",
+            headers=_cerebras_headers(CEREBRAS_API_KEY),
+            timeout=phase_timeout(30.0),
+        )
+        response.raise_for_status()
+        data = json_codec.loads(response.content)
+        return data.get("data", [])
+    except Exception as e:
+        logger.warning("Error listing Cerebras models: %s", e)
+        return []
@@ -1,7 +1,9 @@
 """Configuration for the LLM Council."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 from .model_registry import load_registry
 
@@ -19,15 +21,34 @@ CONVERSATIONS_DIR = DATA_DIR / "conversations"
 CACHE_DIR = DATA_DIR / "cache"
 JOBS_DIR = DATA_DIR / "jobs"
 
-# Create directories if they don't exist
-CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
-JOBS_DIR.mkdir(parents=True, exist_ok=True)
+
+def ensure_dirs() -> None:
+    """Create data directories; called once from application startup, not on import."""
+    for directory in (CONVERSATIONS_DIR, CACHE_DIR, JOBS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+
 
 # Caching settings
 CACHE_TTL_SECONDS = 86400  # 24 hours
 CACHE_FILE = CACHE_DIR / "models.json"
 
+# Persist Stage 1 responses on disk so repeated queries (replays, eval runs)
+# survive restarts and are shared between workers. Off by default: responses
+# may contain sensitive content.
+RESPONSE_CACHE_DIR = CACHE_DIR / "responses"
+PERSIST_RESPONSE_CACHE = os.getenv("PERSIST_RESPONSE_CACHE", "").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+# Stage 1 straggler cut-off, off by default. With STAGE1_QUORUM set, once that
+# many council seats have answered, seats still running STAGE1_SOFT_DEADLINE
+# seconds after Stage 1 started are cancelled and recorded as quorum_cutoff.
+STAGE1_QUORUM = int(os.getenv("STAGE1_QUORUM", "0")) or None
+STAGE1_SOFT_DEADLINE = float(os.getenv("STAGE1_SOFT_DEADLINE", "60"))
+
 # Server configuration
 # Cloud Run sets PORT env var; BACKEND_PORT is our custom override; 8800 is default
 BACKEND_PORT = int(os.getenv("PORT", os.getenv("BACKEND_PORT", "8800")))
@@ -74,70 +95,75 @@ COMPACT_COUNCIL_MODELS = list(MODEL_REGISTRY.compact_roster)
 DEFAULT_CHAIRMAN_MODEL = MODEL_REGISTRY.chairman_logical_id
 
 # Override via environment
-COUNCIL_MODELS = (
-    os.getenv("COUNCIL_MODELS", "").split(",")
-    if os.getenv("COUNCIL_MODELS")
-    else DEFAULT_COUNCIL_MODELS
-)
+_council_models_env = os.getenv("COUNCIL_MODELS", "")
+COUNCIL_MODELS = [
+    model.strip() for model in _council_models_env.split(",") if model.strip()
+] or DEFAULT_COUNCIL_MODELS
 CHAIRMAN_MODEL = os.getenv("CHAIRMAN_MODEL", "") or DEFAULT_CHAIRMAN_MODEL
 
-# Model providers - which models go to which API
-CEREBRAS_MODEL_IDS = [
+# Model providers - which models go to which API.
+# Frozensets: the is_*_model checks below run on every dispatch.
+CEREBRAS_MODEL_IDS = frozenset({
     "zai-glm-4.6",
     "zai-glm-4.7",
     "llama3.1-8b",
     "llama-3.3-70b",
     "qwen-3-32b",
     "gpt-oss-120b",
-]
+})
 
-FIREWORKS_MODEL_IDS = [model.logical_id for model in MODEL_REGISTRY.models if model.preferred_route.provider == "fireworks"]
+FIREWORKS_MODEL_IDS = frozenset(model.logical_id for model in MODEL_REGISTRY.models if model.preferred_route.provider == "fireworks")
 
-MOONSHOT_MODEL_IDS = [
+MOONSHOT_MODEL_IDS = frozenset({
     "moonshot/kimi-k2.5",
     "kimi-k2.5",
-]
+})
 
-XAI_MODEL_IDS = [model.logical_id for model in MODEL_REGISTRY.models if model.preferred_route.provider == "xai"]
+XAI_MODEL_IDS = frozenset(model.logical_id for model in MODEL_REGISTRY.models if model.preferred_route.provider == "xai")
 
 # Gemini models routed to Google's Gemini Direct API.
 # NOTE: google/gemini-3.1-pro-preview removed Apr 17 2026 — routing via OpenRouter
 # instead because the GEMINI_API_KEY env var was not configured (literal placeholder),
 # causing HTTP 400 failures. OpenRouter has the exact same model ID available and
 # works out of the box with the existing OPENROUTER_API_KEY.
-GEMINI_DIRECT_MODEL_IDS = [
+GEMINI_DIRECT_MODEL_IDS = frozenset({
     "google/gemini-3-flash",
     "google/gemini-3-flash-preview",
     "google/gemini-3-pro",
     "google/gemini-3-pro-preview",
     "google/gemini-2.0-flash",
-]
+})
 
 # Claude models routed to Anthropic-on-Vertex as primary provider.
-VERTEX_ANTHROPIC_MODEL_MAP = {
+# Routing maps below are read-only views: they sit on the dispatch hot path and
+# are shared by every request, so nothing may mutate them after import.
+VERTEX_ANTHROPIC_MODEL_MAP = MappingProxyType({
     model.logical_id: route.provider_model_id
     for model in MODEL_REGISTRY.models
     for route in model.routes
     if route.provider == "vertex"
-}
+})
 VERTEX_ANTHROPIC_MODEL_IDS = list(VERTEX_ANTHROPIC_MODEL_MAP.keys())
 VERTEX_ANTHROPIC_PROVIDER_MODEL_IDS = frozenset(VERTEX_ANTHROPIC_MODEL_MAP.values())
 
 # OpenRouter fallback model ID mapping (council ID -> OpenRouter ID)
-OPENROUTER_FALLBACK_MAP = {
+OPENROUTER_FALLBACK_MAP = MappingProxyType({
     model.logical_id: route.provider_model_id
     for model in MODEL_REGISTRY.models
     for route in model.routes
     if route.provider == "openrouter"
-}
+})
 
 # OpenAI models (disabled - Codex OAuth uses Responses API, not Chat Completions)
-OPENAI_MODEL_IDS = []
+OPENAI_MODEL_IDS: frozenset[str] = frozenset()
 
 # Model name aliases for convenience (used in /council command)
-MODEL_ALIASES = {
+MODEL_ALIASES = MappingProxyType({
     alias: model.logical_id for model in MODEL_REGISTRY.models for alias in model.aliases
-}
+})
+_MODEL_ALIASES_LOWER = MappingProxyType(
+    {alias.lower(): model_id for alias, model_id in MODEL_ALIASES.items()}
+)
 
 # Evaluator priority list — models best at critical evaluation
 # Stage 2 uses top 3 from this list that are present in the active council
@@ -147,6 +173,8 @@ EVALUATOR_PRIORITY = list(MODEL_REGISTRY.evaluator_priority)
 # Strong models are concise; weaker models need more tokens for same quality
 TIERED_TRUNCATION = {tier: [model.logical_id for model in MODEL_REGISTRY.models if model.tier == tier] for tier in MODEL_REGISTRY.truncation_limits}
 
+_MODEL_TIERS = {model_id: tier for tier, models in TIERED_TRUNCATION.items() for model_id in models}
+
 TRUNCATION_LIMITS = dict(MODEL_REGISTRY.truncation_limits)
 
 # Default truncation limit when model tier is unknown
@@ -183,6 +211,27 @@ def is_vertex_anthropic_model(model_id: str) -> bool:
     return model_id in VERTEX_ANTHROPIC_MODEL_MAP
 
 
+# Direct provider per model ID, built once so routing needs a single lookup.
+# Later entries win, so the loop runs from lowest to highest routing priority.
+_DIRECT_PROVIDER_BY_MODEL = MappingProxyType({
+    model_id: provider
+    for provider, model_ids in (
+        ("vertex", VERTEX_ANTHROPIC_MODEL_MAP),
+        ("gemini", GEMINI_DIRECT_MODEL_IDS),
+        ("xai", XAI_MODEL_IDS),
+        ("moonshot", MOONSHOT_MODEL_IDS),
+        ("cerebras", CEREBRAS_MODEL_IDS),
+        ("fireworks", FIREWORKS_MODEL_IDS),
+    )
+    for model_id in model_ids
+})
+
+
+def get_direct_provider(model_id: str) -> str | None:
+    """Return the direct (non-OpenRouter) provider for a model ID, if any."""
+    return _DIRECT_PROVIDER_BY_MODEL.get(model_id)
+
+
 def requires_vertex_anthropic(model_id: str) -> bool:
     """Return whether fallback away from Vertex is disabled for this model."""
     return REQUIRE_VERTEX_ANTHROPIC and is_vertex_anthropic_model(model_id)
@@ -214,10 +263,7 @@ def is_openai_model(model_id: str) -> bool:
 
 def get_model_tier(model_id: str) -> str:
     """Get the truncation tier for a model (strong/medium/weak)."""
-    for tier, models in TIERED_TRUNCATION.items():
-        if model_id in models:
-            return tier
-    return "weak"  # Default to most generous for unknown models
+    return _MODEL_TIERS.get(model_id, "weak")  # Default to most generous for unknown models
 
 
 def calculate_max_response_chars(model_id: str, num_models: int) -> int:
@@ -255,7 +301,11 @@ def get_model_reasoning_effort(model_id: str) -> str | None:
     return MODEL_REASONING_EFFORT.get(model_id)
 
 
+@lru_cache(maxsize=256)
 def resolve_model_alias(alias: str) -> str:
-    """Convert a model alias to its full model ID."""
-    alias_lower = alias.lower().strip()
-    return MODEL_ALIASES.get(alias_lower, alias)
+    """Convert a model alias to its full model ID.
+
+    Cached: the alias maps are immutable for the process lifetime and users
+    repeat the same few aliases.
+    """
+    return _MODEL_ALIASES_LOWER.get(alias.lower().strip(), alias)
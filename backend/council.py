@@ -12,23 +12,66 @@ from collections.abc import AsyncGenerator, Awaitable, Callable
 from dataclasses import asdict, replace
 from typing import Any, Literal
 
+from . import config, response_cache
 from .execution_planning import (
     ExecutionPlan,
     PlanOperation,
     build_execution_plan,
     curate_responses,
 )
-from .model_registry import load_registry
+from .model_registry import current_registry
 from .parallel_intelligence import EvidenceBundle
 
 logger = logging.getLogger("llm-council.council")
 
+# Stage 2 ranking parsing (compiled once; used for every evaluator response).
+_FINAL_RANKING_MARKER = "FINAL RANKING:"
+_NUMBERED_RESPONSE_RE = re.compile(r"\d+\.\s*(Response [A-Z])")
+_RESPONSE_LABEL_RE = re.compile(r"Response [A-Z]")
+# Anonymized response labels ("Response A", "Response B", ...), built once.
+_RESPONSE_LABELS = tuple(f"Response {chr(65 + i)}" for i in range(26))
+
+
+def _label_models(results: list[dict[str, Any]]) -> dict[str, str]:
+    """Map anonymized labels to the model of each result, in order."""
+    if len(results) > len(_RESPONSE_LABELS):
+        labels: Any = (f"Response {chr(65 + i)}" for i in range(len(results)))
+    else:
+        labels = _RESPONSE_LABELS
+    return {label: result["model"] for label, result in zip(labels, results)}
+
+
 CouncilStage = Literal["stage1", "stage2", "stage3"]
 OperationExecutor = Callable[
     [CouncilStage, PlanOperation], Awaitable[dict[str, Any] | None]
 ]
 
 
+# Static tail of every Stage 2 ranking prompt; only the responses block varies.
+_RANKING_INSTRUCTIONS = """Your task:
+1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
+2. Then, at the very end of your response, provide a final ranking.
+
+IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
+- Start with the line "FINAL RANKING:" (all caps, with colon)
+- Then list the responses from best to worst as a numbered list
+- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
+- Do not add any other text or explanations in the ranking section
+
+Example of the correct format for your ENTIRE response:
+
+Response A provides good detail on X but misses Y...
+Response B is accurate but lacks depth on Z...
+Response C offers the most comprehensive answer...
+
+FINAL RANKING:
+1. Response C
+2. Response A
+3. Response B
+
+Now provide your evaluation and ranking:"""
+
+
 def execution_plan_metadata(plan: ExecutionPlan) -> dict[str, Any]:
     """Return public, secret-free execution provenance."""
     operations = (*plan.stage1, *plan.evaluators, plan.chairman)
@@ -98,6 +141,12 @@ def _get_cached_response(model_id: str | Any, prompt: str) -> dict[str, Any] | N
             return response
         else:
             del _stage1_cache[key]
+    if config.PERSIST_RESPONSE_CACHE:
+        response = response_cache.load(key, CACHE_TTL_SECONDS)
+        if response is not None:
+            logger.info("Stage 1 disk cache hit")
+            _stage1_cache[key] = (response, time.time())
+            return response
     return None
 
 
@@ -124,6 +173,9 @@ def _cache_response(model_id: str | Any, prompt: str, response: dict[str, Any]):
     key = _get_cache_key(model_id, prompt)
     _stage1_cache[key] = (response, time.time())
     _sweep_stage1_cache()
+    # Only successful answers are worth replaying across processes.
+    if config.PERSIST_RESPONSE_CACHE and response.get("content"):
+        response_cache.store(key, response)
 
 
 def _bounded_text(value: object, limit: int = 500) -> str | None:
@@ -216,7 +268,7 @@ def _project_stage1_result(
     }
 
 
-def _order_stage1_results(
+def order_stage1_results(
     results: list[dict[str, Any]], plan: ExecutionPlan
 ) -> list[dict[str, Any]]:
     """Order terminal Stage 1 projections by the immutable captured seat order."""
@@ -228,9 +280,12 @@ async def _execute_operation(
     stage: CouncilStage,
     operation: PlanOperation,
     operation_executor: OperationExecutor | None,
+    on_delta: Callable[[str], None] | None = None,
 ) -> dict[str, Any] | None:
     if operation_executor is not None:
         return await operation_executor(stage, operation)
+    if on_delta is not None:
+        return await _dispatcher().execute(operation, on_delta=on_delta)
     return await _dispatcher().execute(operation)
 
 
@@ -238,6 +293,7 @@ async def _execute_stage1_operation(
     operation: PlanOperation,
     cache_prompt: str,
     operation_executor: OperationExecutor | None = None,
+    on_delta: Callable[[str], None] | None = None,
 ) -> dict[str, Any]:
     """Resolve one planned Stage 1 seat through the shared normalized cache path."""
     if operation_executor is not None:
@@ -245,12 +301,64 @@ async def _execute_stage1_operation(
         return _project_stage1_result(operation.logical_id, response or {}, operation)
     cached = _get_cached_response(operation, cache_prompt)
     if cached is None:
-        cached = await _execute_operation("stage1", operation, None)
+        cached = await _execute_operation("stage1", operation, None, on_delta)
         cached = cached or {}
         _cache_response(operation, cache_prompt, cached)
     return _project_stage1_result(operation.logical_id, cached, operation)
 
 
+# Terminal result recorded for Stage 1 seats cancelled after quorum was met.
+_QUORUM_CUTOFF: dict[str, Any] = {
+    "terminal_status": "failed",
+    "failure_reason": "quorum_cutoff",
+    "error": {"code": "quorum_cutoff", "message": "Cancelled after council quorum was met"},
+}
+
+
+async def _collect_with_quorum(
+    labels: list[str],
+    coros: list[Awaitable[Any]],
+    succeeded: Callable[[Any], bool],
+    quorum: int | None,
+    soft_deadline: float | None,
+) -> list[Any]:
+    """Await ``coros`` concurrently, cutting off stragglers once quorum is met.
+
+    Results keep input order. Without a quorum (or when it covers every
+    coroutine) this is a plain gather; otherwise coroutines still running
+    ``soft_deadline`` seconds after start, once ``quorum`` of them succeeded,
+    are cancelled and yield None.
+    """
+    if quorum is None or quorum >= len(coros):
+        return list(await asyncio.gather(*coros))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (soft_deadline or 0.0)
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    pending = set(tasks)
+    answered = 0
+    try:
+        while pending:
+            timeout = max(0.0, deadline - loop.time()) if answered >= quorum else None
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            answered += sum(succeeded(task.result()) for task in done)
+    finally:
+        for task in pending:
+            task.cancel()
+    if pending:
+        logger.warning(
+            "Quorum %d/%d reached; cancelled stragglers: %s",
+            answered,
+            len(tasks),
+            [label for label, task in zip(labels, tasks) if task in pending],
+        )
+    return [None if task in pending else task.result() for task in tasks]
+
+
 def _truncate_for_prompt(
     text: str, max_chars: int = MAX_RESPONSE_CHARS_FOR_PROMPT
 ) -> str:
@@ -296,7 +404,7 @@ def get_evaluator_models(council_models: list[str]) -> list[str]:
 def _registry_evaluator_effort(model_id: str) -> str | None:
     """Resolve evaluator effort with the same generic fallback as execution plans."""
     try:
-        reasoning = load_registry().model(model_id).reasoning
+        reasoning = current_registry().model(model_id).reasoning
     except KeyError:
         return None
     effort = reasoning.get("evaluator") or reasoning.get("member") or reasoning.get("default")
@@ -350,11 +458,7 @@ def select_top_responses(
         # Not enough responses for full curation, return all
         return stage1_results
 
-    global_label_to_model = {
-        f"Response {chr(65 + index)}": result["model"]
-        for index, result in enumerate(stage1_results)
-    }
-    aggregate_rankings = calculate_aggregate_rankings(stage2_results, global_label_to_model)
+    aggregate_rankings = calculate_aggregate_rankings(stage2_results, _label_models(stage1_results))
     by_model = {result["model"]: result for result in stage1_results}
 
     if not aggregate_rankings:
@@ -409,6 +513,8 @@ from .cerebras import query_cerebras_model
 from .config import (
     CHAIRMAN_MODEL,
     COUNCIL_MODELS,
+    STAGE1_QUORUM,
+    STAGE1_SOFT_DEADLINE,
     calculate_max_response_chars,
 )
 from .fireworks_client import query_fireworks_model
@@ -494,6 +600,9 @@ async def query_models_parallel(
     max_tokens: int = 32768,
     temperature: float = 0.7,
     per_model_timeout: float = PER_MODEL_TIMEOUT_SECONDS,
+    *,
+    quorum: int | None = None,
+    soft_deadline: float | None = None,
 ) -> dict[str, dict[str, Any] | None]:
     """
     Query multiple models via their respective providers in parallel.
@@ -501,6 +610,11 @@ async def query_models_parallel(
     Each model has an individual timeout (per_model_timeout). If a model
     exceeds the timeout, it returns None and other models continue.
     This prevents a single dead provider from blocking the entire council.
+
+    When ``quorum`` is set, stragglers still running once ``quorum`` models
+    have answered and ``soft_deadline`` seconds have elapsed are cancelled
+    and reported as None, so one slow model cannot hold the council to its
+    full timeout.
     """
 
     async def _query_with_timeout(
@@ -523,10 +637,17 @@ async def query_models_parallel(
             return model_id, None
 
     # Query all models in parallel with individual timeouts
-    tasks = [_query_with_timeout(m) for m in model_ids]
-    task_results = await asyncio.gather(*tasks)
-
-    return dict(task_results)
+    task_results = await _collect_with_quorum(
+        model_ids,
+        [_query_with_timeout(m) for m in model_ids],
+        lambda item: item[1] is not None,
+        quorum,
+        soft_deadline,
+    )
+    return {
+        model_id: item[1] if item is not None else None
+        for model_id, item in zip(model_ids, task_results)
+    }
 
 
 async def query_models_with_retries(
@@ -536,6 +657,9 @@ async def query_models_with_retries(
     temperature: float = 0.7,
     max_retries: int = 2,
     backoff_base: float = 1.5,
+    *,
+    quorum: int | None = None,
+    soft_deadline: float | None = None,
 ) -> dict[str, dict[str, Any] | None]:
     """
     Query models in parallel with automatic retries for failures.
@@ -551,17 +675,23 @@ async def query_models_with_retries(
         temperature: Sampling temperature
         max_retries: Number of retry attempts (default 2)
         backoff_base: Base delay in seconds, doubled each retry
+        quorum: Stop waiting on stragglers once this many models answered;
+            retries are skipped when the quorum is already met
+        soft_deadline: Seconds to keep waiting on stragglers after quorum
 
     Returns:
         Dict mapping model_id to response (or None if all attempts failed)
     """
     # First pass: query all models in parallel
-    results = await query_models_parallel(model_ids, messages, max_tokens, temperature)
+    results = await query_models_parallel(
+        model_ids, messages, max_tokens, temperature,
+        quorum=quorum, soft_deadline=soft_deadline,
+    )
 
     for attempt in range(max_retries):
         # Find models that failed
         failed = [m for m in model_ids if results.get(m) is None]
-        if not failed:
+        if not failed or (quorum is not None and len(model_ids) - len(failed) >= quorum):
             break
 
         wait = backoff_base * (2**attempt)
@@ -597,6 +727,116 @@ async def query_models_with_retries(
     return results
 
 
+def _stage1_messages(
+    user_query: str, evidence_bundle: EvidenceBundle | None
+) -> list[dict[str, str]]:
+    if evidence_bundle is None:
+        return [{"role": "user", "content": user_query}]
+    return [
+        {"role": "user", "content": user_query},
+        {"role": "system", "content": evidence_bundle.message()},
+    ]
+
+
+def _stage1_operations(
+    execution_plan: ExecutionPlan, messages: list[dict[str, str]]
+) -> list[PlanOperation]:
+    """Bind the Stage 1 prompt to every planned seat."""
+    return [
+        replace(op, messages=tuple((m["role"], m["content"]) for m in messages))
+        for op in execution_plan.stage1
+    ]
+
+
+async def stage1_iter_events(
+    user_query: str,
+    execution_plan: ExecutionPlan,
+    evidence_bundle: EvidenceBundle | None = None,
+    *,
+    operation_executor: OperationExecutor | None = None,
+    quorum: int | None = None,
+    soft_deadline: float | None = None,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Stage 1 for streaming callers: yield SSE-ready events as seats progress.
+
+    Seats run concurrently exactly as in ``stage1_collect_responses``. Events
+    are ``{"type": "stage1_token", "model", "delta"}`` for visible text from
+    providers that stream it, and ``{"type": "stage1_partial", "data"}`` with
+    each seat's final projection in completion order; callers that need the
+    captured seat order should pass the collected ``data`` through
+    ``order_stage1_results``. A seat's final result supersedes its tokens.
+    Seats still running when the consumer stops iterating are cancelled.
+
+    ``quorum``/``soft_deadline`` behave as in ``stage1_collect_responses``; a
+    seat cut off that way is reported as a ``stage1_partial`` carrying the
+    quorum_cutoff failure.
+    """
+    messages = _stage1_messages(user_query, evidence_bundle)
+    cache_prompt = user_query + ("\n" + evidence_bundle.message() if evidence_bundle else "")
+    # Token events and finished tasks share one queue so they arrive in order.
+    events: asyncio.Queue[dict[str, Any] | asyncio.Task[dict[str, Any]]] = asyncio.Queue()
+    operations = _stage1_operations(execution_plan, messages)
+    tasks = [
+        asyncio.create_task(
+            _execute_stage1_operation(
+                operation,
+                cache_prompt,
+                operation_executor,
+                on_delta=lambda delta, model=operation.logical_id: events.put_nowait(
+                    {"type": "stage1_token", "model": model, "delta": delta}
+                ),
+            )
+        )
+        for operation in operations
+    ]
+    for task in tasks:
+        task.add_done_callback(events.put_nowait)
+    logger.info("Stage 1: streaming %d model responses", len(tasks))
+    if quorum is not None and quorum >= len(tasks):
+        quorum = None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (soft_deadline or 0.0)
+    reported: set[asyncio.Task[dict[str, Any]]] = set()
+    answered = 0
+    try:
+        while len(reported) < len(tasks):
+            timeout = (
+                max(0.0, deadline - loop.time())
+                if quorum is not None and answered >= quorum
+                else None
+            )
+            try:
+                event = await asyncio.wait_for(events.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if not isinstance(event, asyncio.Task):
+                yield event
+                continue
+            reported.add(event)
+            result = event.result()
+            answered += bool(result.get("response"))
+            yield {"type": "stage1_partial", "data": result}
+        cut_off = []
+        for operation, task in zip(operations, tasks):
+            if task in reported:
+                continue
+            if task.done() and not task.cancelled():
+                # Finished just as the deadline passed; its event was not read yet.
+                result = task.result()
+            else:
+                task.cancel()
+                cut_off.append(operation.logical_id)
+                result = _project_stage1_result(operation.logical_id, _QUORUM_CUTOFF, operation)
+            yield {"type": "stage1_partial", "data": result}
+        if cut_off:
+            logger.warning(
+                "Quorum %d/%d reached; cancelled stragglers: %s", answered, len(tasks), cut_off
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def stage1_collect_responses(
     user_query: str,
     council_models: list[str] | None = None,
@@ -604,6 +844,8 @@ async def stage1_collect_responses(
     evidence_bundle: EvidenceBundle | None = None,
     *,
     operation_executor: OperationExecutor | None = None,
+    quorum: int | None = None,
+    soft_deadline: float | None = None,
 ) -> list[dict[str, Any]]:
     """
     Stage 1: Collect individual responses from all council models.
@@ -614,31 +856,46 @@ async def stage1_collect_responses(
     Args:
         user_query: The user's question
         council_models: Optional override for council models
+        quorum: Stop waiting on slow models once this many have answered
+            (default: wait for every model up to its own timeout)
+        soft_deadline: Seconds after the start of the stage that stragglers
+            are still awaited once the quorum is met
 
     Returns:
         List of dicts with 'model', 'response', 'usage' keys
     """
     models = [operation.logical_id for operation in execution_plan.stage1] if execution_plan else (council_models or COUNCIL_MODELS)
-    messages = [{"role": "user", "content": user_query}]
-    if evidence_bundle is not None:
-        messages.append({"role": "system", "content": evidence_bundle.message()})
+    messages = _stage1_messages(user_query, evidence_bundle)
     cache_prompt = user_query + ("\n" + evidence_bundle.message() if evidence_bundle else "")
 
     logger.info("Stage 1: querying %d models with retries", len(models))
 
     if execution_plan:
-        operations = [
-            replace(op, messages=tuple((m["role"], m["content"]) for m in messages))
-            for op in execution_plan.stage1
+        operations = _stage1_operations(execution_plan, messages)
+        seat_results = await _collect_with_quorum(
+            models,
+            [
+                _execute_stage1_operation(operation, cache_prompt, operation_executor)
+                for operation in operations
+            ],
+            lambda result: bool(result.get("response")),
+            quorum,
+            soft_deadline,
+        )
+        stage1_results = [
+            result if result is not None
+            else _project_stage1_result(operation.logical_id, _QUORUM_CUTOFF, operation)
+            for operation, result in zip(operations, seat_results)
         ]
-        stage1_results = list(await asyncio.gather(*[
-            _execute_stage1_operation(operation, cache_prompt, operation_executor)
-            for operation in operations
-        ]))
     else:
         cached = {model: _get_cached_response(model, cache_prompt) for model in models}
         to_query = [model for model, response in cached.items() if response is None]
-        responses = await query_models_with_retries(to_query, messages) if to_query else {}
+        if quorum is not None:
+            # Cache hits already count toward the quorum.
+            quorum = max(0, quorum - (len(models) - len(to_query)))
+        responses = await query_models_with_retries(
+            to_query, messages, quorum=quorum, soft_deadline=soft_deadline
+        ) if to_query else {}
         for model, response in responses.items():
             if response is not None:
                 _cache_response(model, cache_prompt, response)
@@ -650,7 +907,7 @@ async def stage1_collect_responses(
                 stage1_results.append(_project_stage1_result(model, response))
 
     if execution_plan:
-        stage1_results = _order_stage1_results(stage1_results, execution_plan)
+        stage1_results = order_stage1_results(stage1_results, execution_plan)
 
     logger.info(
         "Stage 1 complete: %d/%d models responded", len(stage1_results), len(models)
@@ -688,19 +945,23 @@ async def stage2_collect_rankings(
 
     logger.info("Stage 2: using %d evaluator models: %s", len(evaluators), evaluators)
 
-    # Create anonymized labels for responses (Response A, Response B, etc.)
-    labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
-
-    # Create mapping from label to model name
-    label_to_model = {
-        f"Response {label}": result["model"]
-        for label, result in zip(labels, stage1_results, strict=False)
-    }
+    # Map anonymized labels (Response A, Response B, etc.) to model names
+    label_to_model = _label_models(stage1_results)
 
     # Build evaluator-specific prompts with self-exclusion and randomized order
     evaluator_tasks = []
 
     planned_evaluators = {op.logical_id: op for op in execution_plan.evaluators} if execution_plan else {}
+
+    # Dynamic truncation based on model tier and council size. It does not
+    # depend on the evaluator, so truncate each response once, not per evaluator.
+    num_models = len(models)
+    truncated_responses = {
+        id(result): _truncate_for_prompt(
+            result["response"], calculate_max_response_chars(result["model"], num_models)
+        )
+        for result in stage1_results
+    }
     for evaluator in evaluators:
         # Self-exclusion: remove evaluator's own response
         filtered_results = filter_responses_for_evaluator(evaluator, stage1_results)
@@ -708,54 +969,21 @@ async def stage2_collect_rankings(
         # Randomize order for this evaluator
         shuffled_results = shuffle_responses_for_evaluator(filtered_results)
 
-        # Create new labels for shuffled responses
-        shuffled_labels = [chr(65 + i) for i in range(len(shuffled_results))]
+        # Label mapping for this evaluator's shuffled order
+        evaluator_label_to_model = _label_models(shuffled_results)
 
-        # Update label mapping for this evaluator
-        evaluator_label_to_model = {
-            f"Response {label}": result["model"]
-            for label, result in zip(shuffled_labels, shuffled_results, strict=False)
-        }
-
-        # Dynamic truncation based on model tier and council size
-        num_models = len(models)
         responses_text = "\n\n".join(
-            [
-                f"Response {label}:\n{_truncate_for_prompt(result['response'], calculate_max_response_chars(result['model'], num_models))}"
-                for label, result in zip(shuffled_labels, shuffled_results, strict=False)
-            ]
+            f"{label}:\n{truncated_responses[id(result)]}"
+            for label, result in zip(evaluator_label_to_model, shuffled_results)
         )
 
-        ranking_prompt = f"""You are evaluating different responses to the following question:
-
-Question: {user_query}
-
-Here are the responses from different models (anonymized):
-
-{responses_text}
-
-Your task:
-1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
-2. Then, at the very end of your response, provide a final ranking.
-
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list the responses from best to worst as a numbered list
-- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any other text or explanations in the ranking section
-
-Example of the correct format for your ENTIRE response:
-
-Response A provides good detail on X but misses Y...
-Response B is accurate but lacks depth on Z...
-Response C offers the most comprehensive answer...
-
-FINAL RANKING:
-1. Response C
-2. Response A
-3. Response B
-
-Now provide your evaluation and ranking:"""
+        ranking_prompt = (
+            "You are evaluating different responses to the following question:\n\n"
+            f"Question: {user_query}\n\n"
+            "Here are the responses from different models (anonymized):\n\n"
+            f"{responses_text}\n\n"
+            f"{_RANKING_INSTRUCTIONS}"
+        )
 
         messages = [{"role": "user", "content": ranking_prompt}]
 
@@ -822,6 +1050,7 @@ async def stage3_synthesize_final(
     execution_plan: ExecutionPlan | None = None,
     *,
     operation_executor: OperationExecutor | None = None,
+    aggregate_rankings: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """
     Stage 3: Chairman synthesizes final response.
@@ -831,6 +1060,8 @@ async def stage3_synthesize_final(
         stage1_results: Individual model responses from Stage 1
         stage2_results: Rankings from Stage 2
         chairman_model: Optional override for chairman model
+        aggregate_rankings: Rankings the caller already aggregated from
+            stage2_results; recomputed when omitted
 
     Returns:
         Dict with 'model', 'response', 'usage' keys
@@ -840,9 +1071,11 @@ async def stage3_synthesize_final(
     # Curate top 5 responses for the chairman (prevents context explosion with 9 models)
     # Top 3 by consensus + 1 wildcard (high disagreement) + 1 diversity pick
     if execution_plan:
-        global_labels = {f"Response {chr(65 + index)}": result["model"] for index, result in enumerate(stage1_results)}
-        aggregate = calculate_aggregate_rankings(stage2_results, global_labels)
-        curated_results = curate_responses(execution_plan, stage1_results, aggregate)
+        if aggregate_rankings is None:
+            aggregate_rankings = calculate_aggregate_rankings(
+                stage2_results, _label_models(stage1_results)
+            )
+        curated_results = curate_responses(execution_plan, stage1_results, aggregate_rankings)
     else:
         curated_results = select_top_responses(stage1_results, stage2_results)
 
@@ -854,10 +1087,8 @@ async def stage3_synthesize_final(
 
     # Build comprehensive context for chairman (truncate long responses to prevent context explosion)
     stage1_text = "\n\n".join(
-        [
-            f"Model: {result['model']}\nResponse: {_truncate_for_prompt(result['response'])}"
-            for result in curated_results
-        ]
+        f"Model: {result['model']}\nResponse: {_truncate_for_prompt(result['response'])}"
+        for result in curated_results
     )
 
     # Compress Stage 2 evaluations to 2-3 sentence summaries
@@ -938,31 +1169,26 @@ def parse_ranking_from_text(ranking_text: str) -> list[str]:
     Returns:
         List of response labels in ranked order
     """
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r"\d+\.\s*Response [A-Z]", ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                result = []
-                for m in numbered_matches:
-                    match = re.search(r"Response [A-Z]", m)
-                    if match:
-                        result.append(match.group())
-                return result
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r"Response [A-Z]", ranking_section)
-            return matches
+    # Look for "FINAL RANKING:" section; keep only the text up to any repeat.
+    _, marker, after_marker = ranking_text.partition(_FINAL_RANKING_MARKER)
+    if marker:
+        ranking_section = after_marker.partition(_FINAL_RANKING_MARKER)[0]
+        # Try to extract numbered list format (e.g., "1. Response A"); the
+        # capture group yields just the "Response X" part.
+        numbered_matches = _NUMBERED_RESPONSE_RE.findall(ranking_section)
+        if numbered_matches:
+            return numbered_matches
+
+        # Fallback: Extract all "Response X" patterns in order
+        return _RESPONSE_LABEL_RE.findall(ranking_section)
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r"Response [A-Z]", ranking_text)
-    return matches
+    return _RESPONSE_LABEL_RE.findall(ranking_text)
+
+
+def _stage2_is_degenerate(successful_stage1: list[dict[str, Any]]) -> bool:
+    """Whether peer ranking has nothing to decide: one answer, or all identical."""
+    return len({result["response"] for result in successful_stage1}) < 2
 
 
 def calculate_aggregate_rankings(
@@ -984,14 +1210,15 @@ def calculate_aggregate_rankings(
     for ranking in stage2_results:
         evaluator_label_to_model = ranking.get("label_to_model") or label_to_model
 
-        # Use already-parsed ranking when present, otherwise parse structured text.
-        parsed_ranking = ranking.get("parsed_ranking") or parse_ranking_from_text(
-            ranking.get("ranking", "")
-        )
+        # Use the ranking stage 2 already parsed (even if empty); only parse
+        # text for results produced without it.
+        parsed_ranking = ranking.get("parsed_ranking")
+        if parsed_ranking is None:
+            parsed_ranking = parse_ranking_from_text(ranking.get("ranking", ""))
 
         for position, label in enumerate(parsed_ranking, start=1):
-            if label in evaluator_label_to_model:
-                model_name = evaluator_label_to_model[label]
+            model_name = evaluator_label_to_model.get(label)
+            if model_name is not None:
                 model_positions[model_name].append(position)
 
     # Calculate average position for each model
@@ -1037,7 +1264,7 @@ async def run_full_council(
     Returns:
         Tuple of (stage1_results, stage2_results, stage3_result, metadata)
     """
-    plan = execution_plan or build_execution_plan(load_registry(), {
+    plan = execution_plan or build_execution_plan(current_registry(), {
         "query": user_query,
         "compact": compact,
         "models": council_models,
@@ -1054,8 +1281,15 @@ async def run_full_council(
 
     # Stage 1: Collect individual responses
     if operation_executor is None:
+        # Only pass the opt-in quorum when configured, so patched legacy stage
+        # hooks keep receiving the positional call they were written for.
+        quorum_kwargs = (
+            {"quorum": STAGE1_QUORUM, "soft_deadline": STAGE1_SOFT_DEADLINE}
+            if STAGE1_QUORUM is not None
+            else {}
+        )
         stage1_results = await stage1_collect_responses(
-            user_query, council_models, plan, evidence_bundle
+            user_query, council_models, plan, evidence_bundle, **quorum_kwargs
         )
     else:
         stage1_results = await stage1_collect_responses(
@@ -1087,7 +1321,8 @@ async def run_full_council(
              "compact": compact, "execution_plan": execution_plan_metadata(plan)},
         )
 
-    if final_only:
+    stage2_skipped = not final_only and _stage2_is_degenerate(successful_stage1)
+    if final_only or stage2_skipped:
         # Skip Stage 2, just synthesize from Stage 1
         stage3_kwargs = (
             {"operation_executor": operation_executor} if operation_executor else {}
@@ -1095,7 +1330,10 @@ async def run_full_council(
         stage3_result = await stage3_synthesize_final(
             user_query, successful_stage1, [], chairman_model, plan, **stage3_kwargs
         )
-        metadata = {"aggregate_rankings": [], "label_to_model": {}, "final_only": True, "compact": compact, "execution_plan": execution_plan_metadata(plan)}
+        metadata = {"aggregate_rankings": [], "label_to_model": {}, "final_only": final_only, "compact": compact, "execution_plan": execution_plan_metadata(plan)}
+        if stage2_skipped:
+            logger.info("Skipping Stage 2: fewer than two distinct Stage 1 responses")
+            metadata["stage2_skipped"] = True
         return stage1_results, [], stage3_result, metadata
 
     # Stage 2: Collect rankings
@@ -1120,6 +1358,7 @@ async def run_full_council(
         stage2_results,
         chairman_model,
         plan,
+        aggregate_rankings=aggregate_rankings,
         **stage2_kwargs,
     )
 
@@ -1202,7 +1441,7 @@ async def stream_council(
         {"event": "synthesis", "model": "...", "response": "..."}
         {"event": "complete", "stage1": [...], "stage2": [...], "stage3": {...}, "metadata": {...}}
     """
-    plan = execution_plan or build_execution_plan(load_registry(), {
+    plan = execution_plan or build_execution_plan(current_registry(), {
         "query": user_query, "models": council_models, "chairman": chairman_model, "mode": "stream"
     })
     models = [operation.logical_id for operation in plan.stage1]
@@ -1213,9 +1452,7 @@ async def stream_council(
     logger.info("Stream Stage 1: querying %d models", len(models))
 
     stage1_results: list[dict[str, Any]] = []
-    stage1_messages = [{"role": "user", "content": user_query}]
-    if evidence_bundle is not None:
-        stage1_messages.append({"role": "system", "content": evidence_bundle.message()})
+    stage1_messages = _stage1_messages(user_query, evidence_bundle)
     cache_prompt = user_query + ("\n" + evidence_bundle.message() if evidence_bundle else "")
     tasks = {
         asyncio.create_task(_execute_stage1_operation(
@@ -1278,7 +1515,7 @@ async def stream_council(
         }
         yield {
             "event": "complete",
-            "stage1": _order_stage1_results(stage1_results, plan),
+            "stage1": order_stage1_results(stage1_results, plan),
             "stage2": [],
             "stage3": failure,
             "metadata": {"label_to_model": {}, "aggregate_rankings": [],
@@ -1290,8 +1527,11 @@ async def stream_council(
     stage2_results: list[dict[str, Any]] = []
     label_to_model: dict[str, str] = {}
     aggregate_rankings: list[dict[str, Any]] = []
+    stage2_skipped = not final_only and _stage2_is_degenerate(successful_stage1)
+    if stage2_skipped:
+        logger.info("Stream: skipping Stage 2, fewer than two distinct Stage 1 responses")
 
-    if not final_only:
+    if not (final_only or stage2_skipped):
         evaluators = [operation.logical_id for operation in plan.evaluators]
         yield {"event": "stage_start", "stage": 2, "models": evaluators}
         logger.info(
@@ -1337,10 +1577,11 @@ async def stream_council(
     logger.info("Stream Stage 3: chairman %s synthesizing", chairman)
 
     stage3_result = await stage3_synthesize_final(
-        user_query, successful_stage1, stage2_results, chairman, plan
+        user_query, successful_stage1, stage2_results, chairman, plan,
+        aggregate_rankings=aggregate_rankings,
     )
 
-    stage1_results = _order_stage1_results(stage1_results, plan)
+    stage1_results = order_stage1_results(stage1_results, plan)
     yield {
         "event": "synthesis",
         "model": stage3_result.get("model", chairman),
@@ -1355,6 +1596,8 @@ async def stream_council(
         "final_only": final_only,
         "execution_plan": execution_plan_metadata(plan),
     }
+    if stage2_skipped:
+        metadata["stage2_skipped"] = True
 
     yield {
         "event": "complete",
@@ -1365,6 +1608,9 @@ async def stream_council(
     }
 
 
+TITLE_SHORTCUT_MAX_CHARS = 50
+
+
 async def generate_conversation_title(user_query: str) -> str:
     """
     Generate a short title for a conversation based on the first user message.
@@ -1375,6 +1621,11 @@ async def generate_conversation_title(user_query: str) -> str:
     Returns:
         A short title (3-5 words)
     """
+    # A short single-line question is already a usable title; skip the LLM call.
+    query = user_query.strip()
+    if query and len(query) <= TITLE_SHORTCUT_MAX_CHARS and "\n" not in query:
+        return query.rstrip(".?!").strip("\"'") or "New Conversation"
+
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
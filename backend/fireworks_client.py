@@ -7,16 +7,53 @@ Legacy explicit Fireworks GLM/Kimi IDs remain available.
 """
 
 import asyncio
-import json
+import logging
+import os
+from collections.abc import AsyncIterator, Callable
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+from . import json_codec
+from .http_clients import get_client, phase_timeout
 from .secrets import FIREWORKS_API_KEY
 
+logger = logging.getLogger("llm-council.fireworks")
+
 FIREWORKS_API_URL = "https://api.fireworks.ai/inference/v1"
+# Parsed once: httpx skips URL parsing for a prebuilt httpx.URL.
+_FIREWORKS_CHAT_URL = httpx.URL(f"{FIREWORKS_API_URL}/chat/completions")
 SPARSE_VISIBLE_CONTENT_THRESHOLD = 50
 
+
+# Headers are built per key on first use; callers bail out earlier when the key
+# is unset.
+@lru_cache(maxsize=4)
+def _fireworks_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+
+
+# Process-wide cap on in-flight Fireworks requests so bursts of council runs
+# queue here instead of opening a connection per request.
+FIREWORKS_MAX_CONCURRENCY = int(os.getenv("FIREWORKS_MAX_CONCURRENCY", "16"))
+# (semaphore, loop it belongs to). Like the pooled clients, rebuilt when a caller
+# runs on another loop: asyncio primitives bind to the first loop that waits on
+# them, and benchmark/CLI entry points call asyncio.run repeatedly.
+_fireworks_sem: tuple[asyncio.Semaphore, asyncio.AbstractEventLoop] | None = None
+
+
+def _fireworks_semaphore() -> asyncio.Semaphore:
+    """Return the in-flight request cap for the running event loop."""
+    global _fireworks_sem
+    loop = asyncio.get_running_loop()
+    if _fireworks_sem is None or _fireworks_sem[1] is not loop:
+        _fireworks_sem = (asyncio.Semaphore(FIREWORKS_MAX_CONCURRENCY), loop)
+    return _fireworks_sem[0]
+
 # Model ID mapping: council ID -> Fireworks model ID
 # Fireworks uses accounts/fireworks/models/<name> format
 # GLM-5.1 uses "glm-5p1" slug on Fireworks (not "glm-5.1")
@@ -47,6 +84,7 @@ async def query_fireworks_model(
     temperature: float = 0.7,
     timeout: float = 900.0,
     reasoning_effort: str | None = None,
+    on_delta: Callable[[str], None] | None = None,
 ) -> dict[str, Any] | None:
     """
     Query a model via Fireworks AI's OpenAI-compatible API.
@@ -56,26 +94,26 @@ async def query_fireworks_model(
         messages: Chat messages in OpenAI format
         max_tokens: Maximum output tokens
         temperature: Sampling temperature
-        timeout: Request timeout in seconds
+        timeout: Read timeout in seconds (connect/write fail fast)
         reasoning_effort: Optional reasoning effort for Fireworks models that support it
+        on_delta: Called with each visible content delta; forces a streamed request
 
     Returns:
         Dict with 'content', 'usage', 'model', 'provider' keys, or None on error
     """
-    import logging
-
-    logger = logging.getLogger("llm-council.fireworks")
-
     if not FIREWORKS_API_KEY:
         logger.error("FIREWORKS_API_KEY not configured")
         return None
 
     fireworks_model = get_fireworks_model_id(model_id)
 
-    use_streaming = max_tokens > 4096
+    use_streaming = max_tokens > 4096 or on_delta is not None
     logger.info(
-        f"Querying Fireworks {model_id} -> {fireworks_model} "
-        f"(max_tokens={max_tokens}, stream={use_streaming})"
+        "Querying Fireworks %s -> %s (max_tokens=%d, stream=%s)",
+        model_id,
+        fireworks_model,
+        max_tokens,
+        use_streaming,
     )
 
     payload: dict[str, Any] = {
@@ -89,58 +127,23 @@ async def query_fireworks_model(
     if use_streaming:
         payload["stream"] = True
 
-    headers = {
-        "Authorization": f"Bearer {FIREWORKS_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            if use_streaming:
-                async with client.stream(
-                    "POST",
-                    f"{FIREWORKS_API_URL}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                ) as response:
-                    response.raise_for_status()
-                    data = await _parse_streaming_response(response)
-
-                text = _merge_sparse_reasoning(
-                    data["visible_content"],
-                    data["reasoning_content"],
-                    ordered_text=data["ordered_content"],
-                )
-                result = {
-                    "content": text,
-                    "usage": data.get("usage", {}),
-                    "model": model_id,
-                    "provider": "fireworks",
-                }
-                if data.get("finish_reason") is not None:
-                    result["finish_reason"] = data["finish_reason"]
-                if data.get("native_finish_reason") is not None:
-                    result["native_finish_reason"] = data["native_finish_reason"]
-                logger.info(
-                    f"Fireworks {model_id} streamed: {len(text)} chars "
-                    f"(reasoning: {len(data['reasoning_content'])} chars)"
-                )
-                return result
-
-            response = await client.post(
-                f"{FIREWORKS_API_URL}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            msg = data["choices"][0]["message"]
-            text = msg.get("content") or ""
-            reasoning = msg.get("reasoning_content") or ""
-            text = _merge_sparse_reasoning(text, reasoning)
-            logger.info(
-                f"Fireworks {model_id} responded: {len(text)} chars (reasoning: {len(reasoning)} chars)"
+    client = get_client("fireworks")
+    try:
+        if use_streaming:
+            async with _fireworks_semaphore(), client.stream(
+                "POST",
+                _FIREWORKS_CHAT_URL,
+                headers=_fireworks_headers(FIREWORKS_API_KEY),
+                content=json_codec.dumps(payload),
+                timeout=phase_timeout(timeout),
+            ) as response:
+                response.raise_for_status()
+                data = await _parse_streaming_response(response, on_delta)
+
+            text = _merge_sparse_reasoning(
+                data["visible_content"],
+                data["reasoning_content"],
+                ordered_text=data["ordered_content"],
             )
             result = {
                 "content": text,
@@ -148,21 +151,68 @@ async def query_fireworks_model(
                 "model": model_id,
                 "provider": "fireworks",
             }
-            choice = data.get("choices", [{}])[0]
-            if choice.get("finish_reason") is not None:
-                result["finish_reason"] = choice.get("finish_reason")
-            if choice.get("native_finish_reason") is not None:
-                result["native_finish_reason"] = choice.get("native_finish_reason")
+            if data.get("finish_reason") is not None:
+                result["finish_reason"] = data["finish_reason"]
+            if data.get("native_finish_reason") is not None:
+                result["native_finish_reason"] = data["native_finish_reason"]
+            logger.info(
+                "Fireworks %s streamed: %d chars (reasoning: %d chars)",
+                model_id,
+                len(text),
+                len(data["reasoning_content"]),
+            )
             return result
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"HTTP error querying Fireworks {model_id}: "
-                f"{e.response.status_code} - {e.response.text[:200]}"
+
+        async with _fireworks_semaphore():
+            response = await client.post(
+                _FIREWORKS_CHAT_URL,
+                headers=_fireworks_headers(FIREWORKS_API_KEY),
+                content=json_codec.dumps(payload),
+                timeout=phase_timeout(timeout),
             )
-            return None
-        except Exception as e:
-            logger.error(f"Error querying Fireworks {model_id}: {e}", exc_info=True)
-            return None
+        response.raise_for_status()
+        data = json_codec.loads(response.content)
+
+        msg = data["choices"][0]["message"]
+        text = msg.get("content") or ""
+        reasoning = msg.get("reasoning_content") or ""
+        text = _merge_sparse_reasoning(text, reasoning)
+        logger.info(
+            "Fireworks %s responded: %d chars (reasoning: %d chars)",
+            model_id,
+            len(text),
+            len(reasoning),
+        )
+        result = {
+            "content": text,
+            "usage": data.get("usage", {}),
+            "model": model_id,
+            "provider": "fireworks",
+        }
+        choice = data.get("choices", [{}])[0]
+        if choice.get("finish_reason") is not None:
+            result["finish_reason"] = choice.get("finish_reason")
+        if choice.get("native_finish_reason") is not None:
+            result["native_finish_reason"] = choice.get("native_finish_reason")
+        return result
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            "HTTP error querying Fireworks %s: %s", model_id, e.response.status_code
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fireworks %s error body: %s", model_id, _body_preview(e.response))
+        return None
+    except Exception as e:
+        logger.error("Error querying Fireworks %s: %s", model_id, e, exc_info=True)
+        return None
+
+
+def _body_preview(response: httpx.Response, limit: int = 200) -> str:
+    """Decode at most ``limit`` bytes of an error body; streamed bodies are unread."""
+    try:
+        return response.content[:limit].decode(errors="replace")
+    except httpx.ResponseNotRead:
+        return "<streamed body not read>"
 
 
 def _merge_sparse_reasoning(
@@ -178,15 +228,8 @@ def _merge_sparse_reasoning(
     return text
 
 
-async def _parse_streaming_response(response: Any) -> dict[str, Any]:
-    """Parse OpenAI-compatible Fireworks SSE chat completion chunks."""
-    visible_parts: list[str] = []
-    reasoning_parts: list[str] = []
-    ordered_parts: list[str] = []
-    usage: dict[str, Any] = {}
-    finish_reason: str | None = None
-    native_finish_reason: str | None = None
-
+async def _iter_sse_chunks(response: Any) -> AsyncIterator[dict[str, Any]]:
+    """Yield decoded OpenAI-compatible SSE chunks until ``[DONE]``."""
     async for line in response.aiter_lines():
         if not line:
             continue
@@ -199,10 +242,23 @@ async def _parse_streaming_response(response: Any) -> dict[str, Any]:
             break
 
         try:
-            chunk = json.loads(payload)
-        except json.JSONDecodeError:
+            yield json_codec.loads(payload)
+        except ValueError:
             continue
 
+
+async def _parse_streaming_response(
+    response: Any, on_delta: Callable[[str], None] | None = None
+) -> dict[str, Any]:
+    """Parse OpenAI-compatible Fireworks SSE chat completion chunks."""
+    visible_parts: list[str] = []
+    reasoning_parts: list[str] = []
+    ordered_parts: list[str] = []
+    usage: dict[str, Any] = {}
+    finish_reason: str | None = None
+    native_finish_reason: str | None = None
+
+    async for chunk in _iter_sse_chunks(response):
         if isinstance(chunk.get("usage"), dict):
             usage = chunk["usage"]
 
@@ -220,6 +276,8 @@ async def _parse_streaming_response(response: Any) -> dict[str, Any]:
         if content:
             visible_parts.append(content)
             ordered_parts.append(content)
+            if on_delta is not None:
+                on_delta(content)
         if choice.get("finish_reason") is not None:
             finish_reason = choice.get("finish_reason")
         if choice.get("native_finish_reason") is not None:
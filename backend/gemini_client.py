@@ -1,15 +1,28 @@
 """Google Gemini API client for direct queries."""
 
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+from . import json_codec
+from .http_clients import get_client, phase_timeout
 from .secrets import GEMINI_API_KEY
 
 logger = logging.getLogger("llm-council.gemini")
 
 GEMINI_BASE = "https://generativelanguage.googleapis.com/v1beta"
+_GENERATE_URL_TEMPLATE = GEMINI_BASE + "/models/{model}:generateContent"
+_STREAM_URL_TEMPLATE = GEMINI_BASE + "/models/{model}:streamGenerateContent?alt=sse"
+
+
+# Only built once GEMINI_API_KEY is known to be set, then reused per key.
+@lru_cache(maxsize=4)
+def _gemini_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({"Content-Type": "application/json", "x-goog-api-key": api_key})
+
 
 GEMINI_MODEL_MAP = {
     "google/gemini-3-flash": "gemini-3.0-flash",
@@ -21,21 +34,63 @@ GEMINI_MODEL_MAP = {
 
 
 def get_gemini_model_id(council_model_id: str) -> str:
-    return GEMINI_MODEL_MAP.get(
-        council_model_id, council_model_id.replace("google/", "")
-    )
+    return GEMINI_MODEL_MAP.get(council_model_id) or council_model_id.removeprefix("google/")
 
 
-def convert_messages_to_gemini(messages: list[dict[str, str]]) -> list[dict[str, Any]]:
+def _split_messages(
+    messages: list[dict[str, str]],
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Convert to Gemini contents and pull out the first system prompt in one pass."""
     contents = []
+    system_text = None
     for msg in messages:
         role = msg.get("role", "user")
+        if role == "system":
+            if system_text is None:
+                system_text = msg.get("content", "")
+            continue
         if role == "assistant":
             role = "model"
-        elif role == "system":
-            continue
         contents.append({"role": role, "parts": [{"text": msg.get("content", "")}]})
-    return contents
+    return contents, system_text
+
+
+def convert_messages_to_gemini(messages: list[dict[str, str]]) -> list[dict[str, Any]]:
+    return _split_messages(messages)[0]
+
+
+def _candidate_text(data: dict[str, Any]) -> str | None:
+    """Text of the first candidate, or None when the response carries none."""
+    candidates = data.get("candidates", [])
+    if not candidates:
+        return None
+    parts = candidates[0].get("content", {}).get("parts", [])
+    return "".join(p.get("text", "") for p in parts)
+
+
+async def _read_stream(
+    response: Any, on_delta: Callable[[str], None]
+) -> tuple[str | None, dict[str, Any]]:
+    """Assemble a ``streamGenerateContent`` SSE body, forwarding each text delta."""
+    text_parts: list[str] = []
+    saw_candidate = False
+    usage_meta: dict[str, Any] = {}
+    async for line in response.aiter_lines():
+        if not line.startswith("data: "):
+            continue
+        try:
+            data = json_codec.loads(line.removeprefix("data: "))
+        except ValueError:
+            continue
+        usage_meta = data.get("usageMetadata", usage_meta)
+        delta = _candidate_text(data)
+        if delta is None:
+            continue
+        saw_candidate = True
+        if delta:
+            text_parts.append(delta)
+            on_delta(delta)
+    return ("".join(text_parts) if saw_candidate else None), usage_meta
 
 
 async def query_gemini_model(
@@ -44,19 +99,15 @@ async def query_gemini_model(
     max_tokens: int = 32768,
     temperature: float = 0.7,
     timeout: float = 900.0,
+    on_delta: Callable[[str], None] | None = None,
 ) -> dict[str, Any] | None:
+    """Query Gemini; with ``on_delta`` the answer is streamed and each text delta forwarded."""
     if not GEMINI_API_KEY:
         logger.error("GEMINI_API_KEY not configured")
         return None
 
     gemini_model = get_gemini_model_id(model_id)
-    contents = convert_messages_to_gemini(messages)
-
-    system_text = None
-    for msg in messages:
-        if msg.get("role") == "system":
-            system_text = msg.get("content", "")
-            break
+    contents, system_text = _split_messages(messages)
 
     payload: dict[str, Any] = {
         "contents": contents,
@@ -65,44 +116,50 @@ async def query_gemini_model(
     if system_text:
         payload["systemInstruction"] = {"parts": [{"text": system_text}]}
 
-    url = f"{GEMINI_BASE}/models/{gemini_model}:generateContent"
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
+    client = get_client("gemini")
+    try:
+        if on_delta is not None:
+            async with client.stream(
+                "POST",
+                _STREAM_URL_TEMPLATE.format(model=gemini_model),
+                headers=_gemini_headers(GEMINI_API_KEY),
+                content=json_codec.dumps(payload),
+                timeout=phase_timeout(timeout),
+            ) as response:
+                response.raise_for_status()
+                text, usage_meta = await _read_stream(response, on_delta)
+        else:
             response = await client.post(
-                url,
-                headers={"Content-Type": "application/json", "x-goog-api-key": GEMINI_API_KEY},
-                json=payload,
+                _GENERATE_URL_TEMPLATE.format(model=gemini_model),
+                headers=_gemini_headers(GEMINI_API_KEY),
+                content=json_codec.dumps(payload),
+                timeout=phase_timeout(timeout),
             )
             response.raise_for_status()
-            data = response.json()
-
-            candidates = data.get("candidates", [])
-            if not candidates:
-                logger.warning("Gemini %s returned no candidates", model_id)
-                return None
-
-            parts = candidates[0].get("content", {}).get("parts", [])
-            text = "".join(p.get("text", "") for p in parts)
-            usage_meta = data.get("usageMetadata", {})
-
-            return {
-                "content": text,
-                "usage": {
-                    "prompt_tokens": usage_meta.get("promptTokenCount", 0),
-                    "completion_tokens": usage_meta.get("candidatesTokenCount", 0),
-                    "total_tokens": usage_meta.get("totalTokenCount", 0),
-                },
-                "model": model_id,
-                "provider": "gemini",
-            }
-        except httpx.HTTPStatusError as e:
-            logger.warning(
-                "HTTP error querying Gemini %s: %s",
-                model_id,
-                e.response.status_code,
-            )
-            return None
-        except Exception as e:
-            logger.warning("Error querying Gemini %s: %s", model_id, e)
+            data = json_codec.loads(response.content)
+            text, usage_meta = _candidate_text(data), data.get("usageMetadata", {})
+
+        if text is None:
+            logger.warning("Gemini %s returned no candidates", model_id)
             return None
+
+        return {
+            "content": text,
+            "usage": {
+                "prompt_tokens": usage_meta.get("promptTokenCount", 0),
+                "completion_tokens": usage_meta.get("candidatesTokenCount", 0),
+                "total_tokens": usage_meta.get("totalTokenCount", 0),
+            },
+            "model": model_id,
+            "provider": "gemini",
+        }
+    except httpx.HTTPStatusError as e:
+        logger.warning(
+            "HTTP error querying Gemini %s: %s",
+            model_id,
+            e.response.status_code,
+        )
+        return None
+    except Exception as e:
+        logger.warning("Error querying Gemini %s: %s", model_id, e)
+        return None
@@ -0,0 +1,107 @@
+"""Shared pooled httpx clients for provider traffic.
+
+Provider modules previously opened a fresh ``httpx.AsyncClient`` per call, which
+paid a TCP+TLS handshake for every council seat. Clients here are created lazily
+per logical pool name, reused across calls, and closed from the FastAPI lifespan.
+"""
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+
+import httpx
+
+try:  # pragma: no cover - depends on optional dependency
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger("llm-council.http")
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+# Phase bounds that do not scale with generation length: a host that cannot
+# accept a connection or a request body within these is treated as down.
+CONNECT_TIMEOUT_SECONDS = 5.0
+WRITE_TIMEOUT_SECONDS = 30.0
+POOL_TIMEOUT_SECONDS = 5.0
+WARMUP_TIMEOUT_SECONDS = 5.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60,
+)
+
+# Pool name -> (client, event loop it was opened on). httpx connection pools are
+# bound to the loop that created them, so a client is rebuilt if a caller runs on
+# a different loop (tests, CLI entry points that call asyncio.run repeatedly).
+_CLIENTS: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop | None]] = {}
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def phase_timeout(read_seconds: float) -> httpx.Timeout:
+    """Timeout whose long budget applies only to reading the (slow) model output."""
+    return httpx.Timeout(
+        read_seconds,
+        connect=CONNECT_TIMEOUT_SECONDS,
+        write=WRITE_TIMEOUT_SECONDS,
+        pool=POOL_TIMEOUT_SECONDS,
+    )
+
+
+def get_client(name: str) -> httpx.AsyncClient:
+    """Return the shared client for a pool name, creating it on first use."""
+    loop = _running_loop()
+    entry = _CLIENTS.get(name)
+    if entry is not None:
+        client, owner = entry
+        if not client.is_closed and owner is loop:
+            return client
+    # HTTP/2 is negotiated via ALPN, so hosts without h2 support transparently
+    # stay on HTTP/1.1 over the same pooled client. Accept-Encoding is left to
+    # httpx: gzip/deflate always, plus br when brotli (perf extra) is installed,
+    # so large JSON bodies such as model lists arrive compressed.
+    client = httpx.AsyncClient(
+        timeout=phase_timeout(DEFAULT_TIMEOUT_SECONDS),
+        limits=DEFAULT_LIMITS,
+        http2=HTTP2_AVAILABLE,
+    )
+    _CLIENTS[name] = (client, loop)
+    return client
+
+
+async def warm_clients(origins: Mapping[str, str]) -> None:
+    """Open one keep-alive connection per pool so DNS and TLS are done before traffic.
+
+    ``origins`` maps pool name to a URL on the provider host. Any HTTP response
+    (typically 4xx for an unauthenticated HEAD) leaves the connection pooled;
+    transport failures are logged and otherwise ignored.
+    """
+
+    async def warm(name: str, url: str) -> None:
+        try:
+            await get_client(name).head(url, timeout=WARMUP_TIMEOUT_SECONDS)
+        except httpx.HTTPError as e:
+            logger.info("Connection warm-up for %s failed: %s", name, e)
+
+    await asyncio.gather(*(warm(name, url) for name, url in origins.items()))
+
+
+async def aclose_clients() -> None:
+    """Close every shared client; called once on application shutdown."""
+    clients = [client for client, _loop in _CLIENTS.values()]
+    _CLIENTS.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Error closing shared HTTP client: %s", e)
@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers for provider payloads.
+
+Uses orjson when it is installed (``pip install llm-council[perf]``) and falls
+back to the stdlib ``json`` module otherwise, with the same compact output.
+"""
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - depends on optional dependency
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes, or two-space indented if ``indent``.
+
+    ``sort_keys`` gives a canonical key order, e.g. for bytes that get signed.
+    """
+    if orjson is not None:
+        # Non-str dict keys are coerced like the stdlib does instead of raising.
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys).encode()
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys
+    ).encode()
@@ -1,10 +1,13 @@
 """FastAPI backend for LLM Council with OpenCode integration."""
 
+import atexit
 import contextlib
 import hashlib
 import hmac
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Logging: file + stderr locally, stdout only in Cloud Run (captured by Cloud Logging)
 _handlers: list[logging.Handler] = [logging.StreamHandler()]
@@ -13,24 +16,36 @@ if not os.environ.get("K_SERVICE"):
     with contextlib.suppress(OSError):
         _handlers.append(logging.FileHandler("/tmp/llm-council.log"))
 
+# Stream/file writes happen on a listener thread; event-loop tasks only enqueue,
+# so a burst of provider errors does not serialize on the stderr lock.
+_log_formatter = logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+for _handler in _handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s %(name)s %(levelname)s %(message)s",
-    handlers=_handlers,
+    format="%(message)s",  # final formatting happens in the listener's handlers
+    handlers=[QueueHandler(_log_queue)],
 )
 
 import asyncio
 import json
 import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, StrictBool
 
-from . import storage
+from . import json_codec, storage
 from .auth import ApiKeyMiddleware
 from .config import (
     BACKEND_HOST,
@@ -38,23 +53,28 @@ from .config import (
     CHAIRMAN_MODEL,
     COUNCIL_MODELS,
     REQUIRE_VERTEX_ANTHROPIC,
+    STAGE1_QUORUM,
+    STAGE1_SOFT_DEADLINE,
     VERTEX_ANTHROPIC_MODEL_IDS,
     VERTEX_LOCATION,
     VERTEX_PROJECT_ID,
+    ensure_dirs,
 )
 from .council import (
     calculate_aggregate_rankings,
     execution_plan_metadata,
     generate_conversation_title,
+    order_stage1_results,
     run_full_council,
-    stage1_collect_responses,
+    stage1_iter_events,
     stage2_collect_rankings,
     stage3_synthesize_final,
     stream_council,
 )
 from .execution_planning import build_execution_plan
+from .http_clients import aclose_clients, warm_clients
 from .model_discovery import get_model_discovery
-from .model_registry import PROJECTION_PATHS, load_registry
+from .model_registry import PROJECTION_PATHS, current_registry
 from .opencode_integration import (
     MCP_TOOL_SCHEMA,
     MODEL_ALIASES_HELP,
@@ -63,19 +83,77 @@ from .opencode_integration import (
 from .parallel_intelligence import ParallelMonitor, create_parallel_stage0
 from .tool_context import augment_query_with_tool_context
 from .webhooks import (
+    ASYNC_JOB_WORKERS,
     CouncilAsyncRequest,
     JobStatus,
+    JobWorkerPool,
+    acreate_job,
     cleanup_old_jobs,
-    create_job,
     get_job,
     list_jobs,
-    run_council_async,
 )
 
+
+class CodecJSONResponse(JSONResponse):
+    """JSON response rendered through json_codec (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
+
+
+# Background connection warm-up; referenced so the task is not garbage-collected.
+_warmup_task: asyncio.Task[None] | None = None
+
+
+def _warmup_origins() -> dict[str, str]:
+    """Pool name -> provider host URL for providers configured in this deployment."""
+    from . import fireworks_client, gemini_client, openrouter, xai_client
+
+    origins = {}
+    if openrouter.OPENROUTER_API_KEY:
+        origins["openrouter"] = openrouter.OPENROUTER_API_URL
+    if fireworks_client.FIREWORKS_API_KEY:
+        origins["fireworks"] = fireworks_client.FIREWORKS_API_URL
+    if gemini_client.GEMINI_API_KEY:
+        origins["gemini"] = gemini_client.GEMINI_BASE
+    if xai_client.GROK_API_KEY:
+        origins["xai"] = xai_client.XAI_API_URL
+    return origins
+
+
+_job_pool: JobWorkerPool | None = None
+
+
+def _job_workers() -> JobWorkerPool:
+    """Return the async-job worker pool for the running loop, starting it on first use."""
+    global _job_pool
+    if _job_pool is None or _job_pool.loop is not asyncio.get_running_loop():
+        _job_pool = JobWorkerPool(handle_council_command)
+    return _job_pool
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Start connection warm-up at startup; stop job workers and close clients on shutdown."""
+    global _warmup_task
+    ensure_dirs()
+    # Not awaited: readiness must not wait on provider round-trips.
+    _warmup_task = asyncio.create_task(warm_clients(_warmup_origins()))
+    try:
+        yield
+    finally:
+        _warmup_task.cancel()
+        if _job_pool is not None:
+            await _job_pool.aclose()
+        await aclose_clients()
+
+
 app = FastAPI(
     title="LLM Council API",
     description="Multi-model LLM deliberation system for OpenCode integration",
     version="1.2.0",
+    default_response_class=CodecJSONResponse,
+    lifespan=lifespan,
 )
 
 # API key auth — protects /api/* routes, skips /health and /
@@ -93,6 +171,19 @@ app.add_middleware(
 )
 
 
+def _sse(payload: dict[str, Any]) -> bytes:
+    """Frame one server-sent event as compact UTF-8 JSON."""
+    return b"data: " + json_codec.dumps(payload) + b"\n\n"
+
+
+# Constant stage-transition frames for send_message_stream, encoded once.
+_TOOL_CONTEXT_START = _sse({"type": "tool_context_start"})
+_STAGE1_START = _sse({"type": "stage1_start"})
+_STAGE2_START = _sse({"type": "stage2_start"})
+_STAGE3_START = _sse({"type": "stage3_start"})
+_COMPLETE = _sse({"type": "complete"})
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -175,6 +266,29 @@ class Conversation(BaseModel):
 # ============================================================================
 
 
+# Path -> (st_mtime_ns, decoded value). Health probes hit the packaged projection
+# files on every call; re-read them only when they change on disk. The registry
+# itself comes from model_registry.current_registry().
+_HEALTH_FILE_CACHE: dict[Path, tuple[int, Any]] = {}
+
+
+def _load_cached(path: Path, loader: Callable[[Path], Any]) -> Any:
+    """Return loader(path), reusing the previous result while the file is unchanged."""
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _HEALTH_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    value = loader(path)
+    _HEALTH_FILE_CACHE[path] = (mtime_ns, value)
+    return value
+
+
+def _projection_digest(path: Path) -> str:
+    projection = json.loads(path.read_text(encoding="utf-8"))
+    serialized = json.dumps(projection, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -189,13 +303,11 @@ async def root():
 @app.get("/health")
 async def health():
     """Detailed health check."""
-    registry = load_registry()
+    registry = current_registry()
 
     def packaged_projection_digest(surface: str) -> str:
         projection_path = Path(__file__).parents[1] / PROJECTION_PATHS[surface]
-        projection = json.loads(projection_path.read_text(encoding="utf-8"))
-        serialized = json.dumps(projection, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        return _load_cached(projection_path, _projection_digest)
 
     return {
         "status": "healthy",
@@ -225,6 +337,10 @@ async def health():
             "application_revision": os.getenv("DEPLOY_REVISION") or os.getenv("K_REVISION"),
             "image_digest": os.getenv("APP_IMAGE_DIGEST"),
         },
+        "async_jobs": {
+            "workers": ASYNC_JOB_WORKERS,
+            "queued": _job_pool.depth if _job_pool is not None else 0,
+        },
     }
 
 
@@ -274,9 +390,9 @@ async def get_models(provider: str | None = None, refresh: bool = False):
     discovery = get_model_discovery()
     await discovery.get_all_models(provider, force_refresh=refresh)
     cache_info = discovery.get_cache_info()
-    from .model_registry import derive_projections, load_registry
+    from .model_registry import derive_projections
 
-    models = derive_projections(load_registry())["api"].to_dict()["models"]
+    models = derive_projections(current_registry())["api"].to_dict()["models"]
     if provider:
         models = [model for model in models if model["provider"] == provider.lower()]
 
@@ -303,6 +419,41 @@ async def get_provider_models(provider: str, refresh: bool = False):
 # ============================================================================
 
 
+# Canonical request body -> council run shared by identical concurrent requests.
+_INFLIGHT_COUNCILS: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+
+async def _coalesced_council(request: CouncilRequest) -> dict[str, Any]:
+    """Run one council per distinct in-flight request; duplicates await the same run.
+
+    The run is shielded so a disconnecting caller does not cancel it for the
+    others still waiting on it.
+    """
+    key = request.model_dump_json()
+    task = _INFLIGHT_COUNCILS.get(key)
+    if task is None:
+        task = asyncio.create_task(handle_council_command(
+            query=request.query,
+            final_only=request.final_only,
+            compact=request.compact,
+            models=request.models,
+            chairman=request.chairman,
+            include_details=request.include_details,
+            tool_context=request.tool_context,
+            parallel_mode=request.parallel_mode,
+            parallel_classifier_score=request.parallel_classifier_score,
+            allow_declared_route_failover=request.allow_declared_route_failover,
+            allow_provider_substitution=request.allow_provider_substitution,
+        ))
+        _INFLIGHT_COUNCILS[key] = task
+        task.add_done_callback(lambda _task: _INFLIGHT_COUNCILS.pop(key, None))
+    else:
+        logging.getLogger("llm-council.api").info(
+            "Joining in-flight council run for identical request"
+        )
+    return await asyncio.shield(task)
+
+
 @app.post("/api/council")
 async def council_deliberation(request: CouncilRequest, format: str | None = None):
     """
@@ -325,19 +476,7 @@ async def council_deliberation(request: CouncilRequest, format: str | None = Non
         - timing: Elapsed time
         - config: Models used
     """
-    result = await handle_council_command(
-        query=request.query,
-        final_only=request.final_only,
-        compact=request.compact,
-        models=request.models,
-        chairman=request.chairman,
-        include_details=request.include_details,
-        tool_context=request.tool_context,
-        parallel_mode=request.parallel_mode,
-        parallel_classifier_score=request.parallel_classifier_score,
-        allow_declared_route_failover=request.allow_declared_route_failover,
-        allow_provider_substitution=request.allow_provider_substitution,
-    )
+    result = await _coalesced_council(request)
 
     if format == "markdown-raw":
         from fastapi.responses import PlainTextResponse
@@ -473,7 +612,7 @@ async def council_stream(request: CouncilRequest):
         chairman_model = resolve_model_alias(request.chairman)
 
     execution_plan = build_execution_plan(
-        load_registry(),
+        current_registry(),
         {
             "query": request.query,
             "models": council_models,
@@ -537,10 +676,10 @@ async def council_stream(request: CouncilRequest):
                         elapsed_seconds=elapsed,
                     )
 
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse(event)
         except Exception:
             logging.getLogger("llm-council.api").exception("Council stream failed")
-            yield f"data: {json.dumps({'event': 'error', 'message': 'Council stream failed. Please try again.'})}\n\n"
+            yield _sse({"event": "error", "message": "Council stream failed. Please try again."})
 
     return StreamingResponse(
         event_generator(),
@@ -621,7 +760,7 @@ async def council_async(request: CouncilAsyncRequest):
     # Create job after validating webhook destination. Keep client detail generic;
     # validation errors can include resolved IPs or DNS details.
     try:
-        job_id = create_job(request)
+        job_id = await acreate_job(request)
     except ValueError as exc:
         logging.getLogger("llm-council.api").warning("Rejected async council webhook URL: %s", exc)
         raise HTTPException(
@@ -629,8 +768,8 @@ async def council_async(request: CouncilAsyncRequest):
             detail="Webhook URL rejected: destination not allowed",
         ) from exc
 
-    # Start background task
-    asyncio.create_task(run_council_async(job_id, handle_council_command))
+    # Queue for the bounded worker pool
+    _job_workers().submit(job_id)
 
     return {
         "status": "accepted",
@@ -761,43 +900,54 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     # Add user message
     await storage.add_user_message(conversation_id, request.content)
 
-    augmented_content, tool_context_metadata = await augment_query_with_tool_context(
-        request.content,
-        enabled=request.tool_context,
-    )
-
-    # If this is the first message, generate a title
+    # Title generation only needs the raw query; overlap it with the council run
+    title_task = None
     if is_first_message:
-        title = await generate_conversation_title(request.content)
-        await storage.update_conversation_title(conversation_id, title)
+        title_task = asyncio.create_task(generate_conversation_title(request.content))
 
-    # Determine council models: request.models > conversation.active_models > compact > default
-    council_models = None
-    if request.models:
-        council_models = request.models
-    elif conversation.get("active_models"):
-        council_models = conversation["active_models"]
-    elif request.compact:
-        from backend.config import COMPACT_COUNCIL_MODELS
-        council_models = COMPACT_COUNCIL_MODELS
+    try:
+        augmented_content, tool_context_metadata = await augment_query_with_tool_context(
+            request.content,
+            enabled=request.tool_context,
+        )
+
+        # Determine council models: request.models > conversation.active_models > compact > default
+        council_models = None
+        if request.models:
+            council_models = request.models
+        elif conversation.get("active_models"):
+            council_models = conversation["active_models"]
+        elif request.compact:
+            from backend.config import COMPACT_COUNCIL_MODELS
+            council_models = COMPACT_COUNCIL_MODELS
+
+        # Run the 3-stage council process
+        execution_plan = build_execution_plan(
+            current_registry(),
+            {"query": request.content, "models": council_models, "compact": request.compact},
+        )
+        stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
+            augmented_content,
+            compact=request.compact,
+            council_models=council_models,
+            execution_plan=execution_plan,
+        )
+    except BaseException:
+        # The title is only stored with a successful answer; don't leave the
+        # task (and its LLM call) running unowned.
+        if title_task is not None:
+            title_task.cancel()
+        raise
 
-    # Run the 3-stage council process
-    execution_plan = build_execution_plan(
-        load_registry(),
-        {"query": request.content, "models": council_models, "compact": request.compact},
-    )
-    stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
-        augmented_content,
-        compact=request.compact,
-        council_models=council_models,
-        execution_plan=execution_plan,
-    )
     metadata = {
         **metadata,
         "models": council_models or COUNCIL_MODELS,
         "tool_context": tool_context_metadata,
     }
 
+    if title_task is not None:
+        await storage.update_conversation_title(conversation_id, await title_task)
+
     # Add assistant message with all stages
     await storage.add_assistant_message(
         conversation_id, stage1_results, stage2_results, stage3_result, metadata
@@ -827,19 +977,21 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     is_first_message = len(conversation["messages"]) == 0
 
     async def event_generator():
+        title_task = None
         try:
             # Add user message
             await storage.add_user_message(conversation_id, request.content)
 
-            yield f"data: {json.dumps({'type': 'tool_context_start'})}\n\n"
+            yield _TOOL_CONTEXT_START
             augmented_content, tool_context_metadata = await augment_query_with_tool_context(
                 request.content,
                 enabled=request.tool_context,
             )
-            yield f"data: {json.dumps({'type': 'tool_context_complete', 'metadata': tool_context_metadata})}\n\n"
+            tool_context_complete = _sse(
+                {"type": "tool_context_complete", "metadata": tool_context_metadata}
+            )
 
             # Start title generation in parallel (don't await yet)
-            title_task = None
             if is_first_message:
                 title_task = asyncio.create_task(
                     generate_conversation_title(request.content)
@@ -856,7 +1008,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 council_models = COMPACT_COUNCIL_MODELS
 
             execution_plan = build_execution_plan(
-                load_registry(),
+                current_registry(),
                 {
                     "query": request.content,
                     "models": council_models,
@@ -865,15 +1017,24 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 },
             )
 
-            # Stage 1: Collect responses
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            stage1_results = await stage1_collect_responses(
-                augmented_content, council_models, execution_plan
-            )
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
+            # Stage 1: Collect responses, forwarding tokens and each seat as it finishes.
+            # Events emitted without an await in between are coalesced into
+            # one write.
+            yield tool_context_complete + _STAGE1_START
+            stage1_results = []
+            async for event in stage1_iter_events(
+                augmented_content,
+                execution_plan,
+                quorum=STAGE1_QUORUM,
+                soft_deadline=STAGE1_SOFT_DEADLINE,
+            ):
+                if event["type"] == "stage1_partial":
+                    stage1_results.append(event["data"])
+                yield _sse(event)
+            stage1_results = order_stage1_results(stage1_results, execution_plan)
 
             # Stage 2: Collect rankings
-            yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
+            yield _sse({"type": "stage1_complete", "data": stage1_results}) + _STAGE2_START
             stage2_results, label_to_model = await stage2_collect_rankings(
                 augmented_content,
                 stage1_results,
@@ -891,24 +1052,27 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 "tool_context": tool_context_metadata,
                 "execution_plan": execution_plan_metadata(execution_plan),
             }
-            yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': metadata})}\n\n"
 
             # Stage 3: Synthesize final answer
-            yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
+            yield (
+                _sse({"type": "stage2_complete", "data": stage2_results, "metadata": metadata})
+                + _STAGE3_START
+            )
             stage3_result = await stage3_synthesize_final(
                 augmented_content,
                 stage1_results,
                 stage2_results,
                 execution_plan.chairman.logical_id,
                 execution_plan,
+                aggregate_rankings=aggregate_rankings,
             )
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+            yield _sse({"type": "stage3_complete", "data": stage3_result})
 
             # Wait for title generation if it was started
             if title_task:
                 title = await title_task
                 await storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                yield _sse({"type": "title_complete", "data": {"title": title}})
 
             # Save complete assistant message with metadata
             await storage.add_assistant_message(
@@ -916,12 +1080,16 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             )
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield _COMPLETE
 
         except Exception:
             # Send error event
             logging.getLogger("llm-council.api").exception("Conversation stream failed")
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Conversation stream failed. Please try again.'})}\n\n"
+            yield _sse({"type": "error", "message": "Conversation stream failed. Please try again."})
+        finally:
+            # Failed or disconnected stream: the title is never stored.
+            if title_task is not None and not title_task.done():
+                title_task.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -1,19 +1,56 @@
 """Dynamic model discovery from OpenRouter and Cerebras APIs."""
 
-import json
+import asyncio
+import contextlib
 import logging
+import os
+import tempfile
 import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from . import json_codec
 from .config import CACHE_FILE, CACHE_TTL_SECONDS
+from .http_clients import get_client, phase_timeout
 from .secrets import CEREBRAS_API_KEY, OPENROUTER_API_KEY
 
 logger = logging.getLogger("llm-council.model-discovery")
 
 
+# Cached per key; each fetch checks its key is configured before building these.
+@lru_cache(maxsize=4)
+def _openrouter_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+
+
+@lru_cache(maxsize=4)
+def _cerebras_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({"Authorization": f"Bearer {api_key}"})
+
+
+# OpenRouter model fields kept in the cache and returned to callers.
+_OPENROUTER_FIELDS = ("id", "name", "pricing", "context_length")
+
+# Estimated pricing for Cerebras models (per million tokens). Entries are shared
+# by every fetched model and must not be mutated.
+_CEREBRAS_PRICING = {
+    "llama3.1-8b": {"prompt": "0.0001", "completion": "0.0001"},
+    "llama-3.3-70b": {"prompt": "0.0006", "completion": "0.0006"},
+    "qwen-3-32b": {"prompt": "0.0003", "completion": "0.0003"},
+    "gpt-oss-120b": {"prompt": "0.001", "completion": "0.001"},
+    "zai-glm-4.6": {"prompt": "0.001", "completion": "0.001"},
+    "zai-glm-4.7": {"prompt": "0.001", "completion": "0.001"},
+}
+_DEFAULT_CEREBRAS_PRICING = {"prompt": "0.001", "completion": "0.001"}
+
+
 class ModelDiscovery:
     """Fetch and cache models from multiple providers."""
 
@@ -22,24 +59,45 @@ class ModelDiscovery:
         self.cache_file = Path(CACHE_FILE)
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
         self._cache = self._load_cache()
+        # Provider fetches run concurrently; serialize snapshot+write so the
+        # last file written always holds the newest cache.
+        self._save_lock = asyncio.Lock()
+        # One refresh per provider at a time; callers queued behind it reuse its result.
+        self._fetch_locks = {"openrouter": asyncio.Lock(), "cerebras": asyncio.Lock()}
 
     def _load_cache(self) -> dict[str, Any]:
         """Load models from cache file."""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file) as f:
-                    return json.load(f)
-            except (OSError, json.JSONDecodeError):
+                return json_codec.loads(self.cache_file.read_bytes())
+            except (OSError, ValueError):
                 return {"openrouter": {}, "cerebras": {}}
         return {"openrouter": {}, "cerebras": {}}
 
-    def _save_cache(self) -> None:
-        """Save models to cache file."""
+    async def _save_cache(self) -> None:
+        """Save models to cache file without blocking the event loop.
+
+        Serializes on the loop (so the snapshot is consistent) and writes from a
+        worker thread via temp file + rename, so a crash never leaves a
+        truncated cache behind.
+        """
+        async with self._save_lock:
+            payload = json_codec.dumps(self._cache)
+            try:
+                await asyncio.to_thread(self._write_cache, payload)
+            except OSError as e:
+                logger.warning("Could not save cache: %s", e)
+
+    def _write_cache(self, payload: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
         try:
-            with open(self.cache_file, "w") as f:
-                json.dump(self._cache, f, indent=2)
-        except OSError as e:
-            logger.warning("Could not save cache: %s", e)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.cache_file)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
 
     def _is_cache_valid(self, provider: str) -> bool:
         """Check if cache for a provider is still valid."""
@@ -47,6 +105,21 @@ class ModelDiscovery:
         last_fetch = provider_cache.get("last_fetch", 0)
         return (time.time() - last_fetch) < CACHE_TTL_SECONDS
 
+    async def _cached_or_fetch(
+        self,
+        provider: str,
+        force_refresh: bool,
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        """Serve a provider from cache, or refresh it once for all concurrent callers."""
+        if not force_refresh and self._is_cache_valid(provider):
+            return self._cache.get(provider, {}).get("models", [])
+        async with self._fetch_locks[provider]:
+            # Another caller may have refreshed the cache while this one waited.
+            if not force_refresh and self._is_cache_valid(provider):
+                return self._cache.get(provider, {}).get("models", [])
+            return await fetch()
+
     async def fetch_openrouter_models(self, force_refresh: bool = False) -> list[dict[str, Any]]:
         """
         Fetch models from OpenRouter API.
@@ -55,36 +128,37 @@ class ModelDiscovery:
             force_refresh: If True, bypass cache and fetch fresh data
 
         Returns:
-            List of model objects with id, name, pricing, context_length, etc.
+            List of model objects with id, name, pricing, context_length and provider
         """
-        if not force_refresh and self._is_cache_valid("openrouter"):
-            return self._cache.get("openrouter", {}).get("models", [])
+        return await self._cached_or_fetch(
+            "openrouter", force_refresh, self._fetch_openrouter_models
+        )
 
+    async def _fetch_openrouter_models(self) -> list[dict[str, Any]]:
         if not OPENROUTER_API_KEY:
             logger.error("OPENROUTER_API_KEY not configured")
             return self._cache.get("openrouter", {}).get("models", [])
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    "https://openrouter.ai/api/v1/models",
-                    headers={
-                        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                        "Content-Type": "application/json",
-                    }
-                )
-                response.raise_for_status()
-                models = response.json().get("data", [])
-
-            # Add provider field
-            for model in models:
-                model["provider"] = "openrouter"
+            response = await get_client("openrouter").get(
+                "https://openrouter.ai/api/v1/models",
+                headers=_openrouter_headers(OPENROUTER_API_KEY),
+                timeout=phase_timeout(30.0),
+            )
+            response.raise_for_status()
+            # Keep only the fields callers use; descriptions and provider
+            # metadata would otherwise dominate the cache file.
+            models = [
+                {field: model[field] for field in _OPENROUTER_FIELDS if field in model}
+                | {"provider": "openrouter"}
+                for model in json_codec.loads(response.content).get("data", [])
+            ]
 
             self._cache["openrouter"] = {
                 "last_fetch": time.time(),
                 "models": models
             }
-            self._save_cache()
+            await self._save_cache()
 
             return models
         except Exception as e:
@@ -101,48 +175,36 @@ class ModelDiscovery:
         Returns:
             List of model objects with id, owned_by, etc.
         """
-        if not force_refresh and self._is_cache_valid("cerebras"):
-            return self._cache.get("cerebras", {}).get("models", [])
+        return await self._cached_or_fetch(
+            "cerebras", force_refresh, self._fetch_cerebras_models
+        )
 
+    async def _fetch_cerebras_models(self) -> list[dict[str, Any]]:
         if not CEREBRAS_API_KEY:
             logger.error("CEREBRAS_API_KEY not configured")
             return self._cache.get("cerebras", {}).get("models", [])
 
-        # Estimated pricing for Cerebras models (per million tokens)
-        pricing_map = {
-            "llama3.1-8b": {"prompt": "0.0001", "completion": "0.0001"},
-            "llama-3.3-70b": {"prompt": "0.0006", "completion": "0.0006"},
-            "qwen-3-32b": {"prompt": "0.0003", "completion": "0.0003"},
-            "gpt-oss-120b": {"prompt": "0.001", "completion": "0.001"},
-            "zai-glm-4.6": {"prompt": "0.001", "completion": "0.001"},
-            "zai-glm-4.7": {"prompt": "0.001", "completion": "0.001"},
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    "https://api.cerebras.ai/v1/models",
-                    headers={
-                        "Authorization": f"Bearer {CEREBRAS_API_KEY}",
-                    }
-                )
-                response.raise_for_status()
-                models = response.json().get("data", [])
+            response = await get_client("cerebras").get(
+                "https://api.cerebras.ai/v1/models",
+                headers=_cerebras_headers(CEREBRAS_API_KEY),
+                timeout=phase_timeout(30.0),
+            )
+            response.raise_for_status()
+            models = json_codec.loads(response.content).get("data", [])
 
             # Enhance model data with provider and pricing
             for model in models:
                 model["provider"] = "cerebras"
-                model_id = model.get("id", "")
-                if model_id in pricing_map:
-                    model["pricing"] = pricing_map[model_id]
-                else:
-                    model["pricing"] = {"prompt": "0.001", "completion": "0.001"}
+                model["pricing"] = _CEREBRAS_PRICING.get(
+                    model.get("id", ""), _DEFAULT_CEREBRAS_PRICING
+                )
 
             self._cache["cerebras"] = {
                 "last_fetch": time.time(),
                 "models": models
             }
-            self._save_cache()
+            await self._save_cache()
 
             return models
         except Exception as e:
@@ -169,9 +231,12 @@ class ModelDiscovery:
         elif provider == "cerebras":
             return await self.fetch_cerebras_models(force_refresh)
         else:
-            # Fetch from both providers
-            openrouter_models = await self.fetch_openrouter_models(force_refresh)
-            cerebras_models = await self.fetch_cerebras_models(force_refresh)
+            # Fetch from both providers concurrently; each falls back to its
+            # cached list on error rather than raising.
+            openrouter_models, cerebras_models = await asyncio.gather(
+                self.fetch_openrouter_models(force_refresh),
+                self.fetch_cerebras_models(force_refresh),
+            )
             return openrouter_models + cerebras_models
 
     def get_cache_info(self) -> dict[str, Any]:
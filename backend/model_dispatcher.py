@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
@@ -12,12 +13,14 @@ import httpx
 
 from . import config
 from .execution_planning import PlanOperation, RequestSettings, RetryPolicy, RouteResolution
-from .model_registry import ModelRoute, load_registry
+from .model_registry import ModelRoute, current_registry
 from .provider_errors import XAIInvalidUsageError
+from .resilience import breaker_for
 
 logger = logging.getLogger("llm-council.dispatcher")
 Adapter = Callable[..., Awaitable[dict[str, Any] | None]]
-
+# Adapters that accept ``on_delta`` and stream visible text as it is generated.
+_DELTA_PROVIDERS = frozenset({"fireworks", "gemini"})
 
 class _FrozenAttempt(dict[str, Any]):
     """JSON-compatible immutable, secret-free attempt provenance."""
@@ -63,7 +66,7 @@ class ModelDispatcher:
         require_vertex_anthropic: bool | None = None,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
-        self.registry = load_registry()
+        self.registry = current_registry()
         self.adapters = _default_adapters() | (adapters or {})
         self.require_vertex_anthropic = require_vertex_anthropic
         self.sleep = sleep
@@ -99,13 +102,27 @@ class ModelDispatcher:
             "provider-neutral-dispatch/v2",
         )
 
-    async def execute(self, operation: PlanOperation) -> dict[str, Any] | None:
-        """Execute only captured data; registry and config are never consulted."""
+    async def execute(
+        self,
+        operation: PlanOperation,
+        *,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> dict[str, Any] | None:
+        """Execute only captured data; registry and config are never consulted.
+
+        ``on_delta`` receives visible text deltas from routes whose provider
+        can stream them. Deltas from a failed attempt are not retracted; the
+        returned result is authoritative.
+        """
         routes = (
             operation.routes
             if operation.settings.allow_declared_route_failover
             else operation.routes[:1]
         )
+        # Built once and shared by every route and retry attempt.
+        messages = [
+            {"role": role, "content": content} for role, content in operation.messages
+        ]
         attempted_route_ids: list[str] = []
         attempts: list[_FrozenAttempt] = []
         failure_reason = "empty_response"
@@ -113,13 +130,27 @@ class ModelDispatcher:
         terminal_failure = False
         for route_index, route in enumerate(routes):
             attempted_route_ids.append(route.route_id)
+            breaker = breaker_for(route.route_id)
+            if not breaker.allow():
+                # Route is failing across the process; fail over immediately.
+                failure_reason = "circuit_open"
+                attempts.append(_FrozenAttempt(
+                    route_id=route.route_id,
+                    attempt=1,
+                    status="failed",
+                    reason=failure_reason,
+                ))
+                if route_index == 0:
+                    primary_failure_reason = failure_reason
+                continue
             for attempt in range(operation.retry.max_retries + 1):
                 try:
                     raw = await asyncio.wait_for(
-                        self._invoke_captured(route, operation),
+                        self._invoke_captured(route, operation, messages, on_delta),
                         timeout=operation.retry.timeout_seconds,
                     )
                     if raw and raw.get("content"):
+                        breaker.record(True)
                         attempts.append(_FrozenAttempt(
                             route_id=route.route_id,
                             attempt=attempt + 1,
@@ -154,9 +185,16 @@ class ModelDispatcher:
                     terminal_failure = True
                     break
                 if attempt < operation.retry.max_retries:
-                    await self.sleep(operation.retry.backoff_base_seconds * (2**attempt))
+                    # Jittered so seats retrying the same provider do not re-synchronize.
+                    await self.sleep(
+                        operation.retry.backoff_base_seconds * (2**attempt) * random.uniform(0.5, 1.0)
+                    )
             if terminal_failure:
                 break
+            # One outcome per exhausted route: retries of a seat are correlated.
+            # Empty content is a model-level answer, not an availability failure.
+            if failure_reason != "empty_response":
+                breaker.record(False)
             if route_index == 0:
                 primary_failure_reason = failure_reason
         route = route if terminal_failure else routes[-1]
@@ -251,7 +289,11 @@ class ModelDispatcher:
         return await adapter(route.provider_model_id, request.messages, **kwargs)
 
     async def _invoke_captured(
-        self, route: RouteResolution, operation: PlanOperation
+        self,
+        route: RouteResolution,
+        operation: PlanOperation,
+        messages: list[dict[str, str]],
+        on_delta: Callable[[str], None] | None = None,
     ) -> dict[str, Any] | None:
         adapter = self.adapters.get(route.provider)
         if adapter is None:
@@ -266,9 +308,8 @@ class ModelDispatcher:
             kwargs["allow_provider_substitution"] = (
                 operation.settings.allow_provider_substitution
             )
-        messages = [
-            {"role": role, "content": content} for role, content in operation.messages
-        ]
+        if on_delta is not None and route.provider in _DELTA_PROVIDERS:
+            kwargs["on_delta"] = on_delta
         return await adapter(route.provider_model_id, messages, **kwargs)
 
 
@@ -297,15 +338,7 @@ def _default_adapters() -> dict[str, Adapter]:
 
 
 def _legacy_route(model_id: str, provider: str | None) -> ModelRoute:
-    selected = provider or (
-        "fireworks" if config.is_fireworks_model(model_id)
-        else "cerebras" if config.is_cerebras_model(model_id)
-        else "moonshot" if config.is_moonshot_model(model_id)
-        else "xai" if config.is_xai_model(model_id)
-        else "gemini" if config.is_gemini_direct_model(model_id)
-        else "vertex" if config.is_vertex_anthropic_model(model_id)
-        else "openrouter"
-    )
+    selected = provider or config.get_direct_provider(model_id) or "openrouter"
     provider_id = config.get_openrouter_fallback(model_id) or model_id if selected == "openrouter" else model_id
     return ModelRoute(f"{selected}:{model_id}", selected, provider_id, f"{selected}_adapter")
 
@@ -177,6 +177,19 @@ def load_registry(path: Path = REGISTRY_PATH) -> RegistrySnapshot:
     return RegistrySnapshot.from_dict(json.loads(path.read_text(encoding="utf-8")))
 
 
+# Parsed registry keyed by file mtime; request handlers and dispatchers share it.
+_registry_cache: tuple[int, RegistrySnapshot] | None = None
+
+
+def current_registry() -> RegistrySnapshot:
+    """Return the validated registry, re-reading it only when the file changes."""
+    global _registry_cache
+    mtime_ns = REGISTRY_PATH.stat().st_mtime_ns
+    if _registry_cache is None or _registry_cache[0] != mtime_ns:
+        _registry_cache = (mtime_ns, load_registry())
+    return _registry_cache[1]
+
+
 def resolve_alias(registry: RegistrySnapshot, alias: str) -> str:
     for model in registry.models:
         if alias in model.aliases:
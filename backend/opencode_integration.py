@@ -1,12 +1,13 @@
 """OpenCode integration: /council command formatter and MCP tool support."""
 
 import time
+from itertools import chain
 from typing import Any
 
 from .config import CHAIRMAN_MODEL, COUNCIL_MODELS, resolve_model_alias
 from .council import run_full_council
 from .execution_planning import build_execution_plan
-from .model_registry import load_registry
+from .model_registry import current_registry
 from .parallel_intelligence import create_parallel_stage0
 from .tool_context import augment_query_with_tool_context
 
@@ -47,16 +48,17 @@ def format_council_markdown(
         for result in stage1_results:
             model = result.get("model", "Unknown")
             content = result.get("response", "No response")
-            usage = result.get("usage", {})
-            tokens = usage.get("total_tokens", "N/A")
+            tokens = (result.get("usage") or {}).get("total_tokens", "N/A")
             provider = result.get("provider", "unknown")
 
-            lines.append("<details>")
+            # One f-string per seat instead of four appends; "\n".join below
+            # supplies the separators the individual entries used to get.
             lines.append(
-                f"<summary><strong>{model}</strong> ({provider}, {tokens} tokens)</summary>\n"
+                f"<details>\n"
+                f"<summary><strong>{model}</strong> ({provider}, {tokens} tokens)</summary>\n\n"
+                f"{content}\n\n"
+                f"</details>\n"
             )
-            lines.append(f"{content}\n")
-            lines.append("</details>\n")
 
     # Stage 2: Peer Rankings
     if stage2_results and include_details:
@@ -66,12 +68,10 @@ def format_council_markdown(
         if metadata.get("aggregate_rankings"):
             lines.append("| Rank | Model | Score | Votes |")
             lines.append("|------|-------|-------|-------|")
-            medals = ["1", "2", "3"]
-            for i, ranking in enumerate(metadata["aggregate_rankings"]):
-                rank_display = medals[i] if i < 3 else str(i + 1)
-                lines.append(
-                    f"| {rank_display} | {ranking['model']} | {ranking['average_rank']} | {ranking['rankings_count']} |"
-                )
+            lines.extend(
+                f"| {rank} | {ranking['model']} | {ranking['average_rank']} | {ranking['rankings_count']} |"
+                for rank, ranking in enumerate(metadata["aggregate_rankings"], start=1)
+            )
             lines.append("")
 
         # Expandable evaluations
@@ -81,11 +81,10 @@ def format_council_markdown(
             model = ranking.get("model", "Unknown")
             evaluation = ranking.get("ranking", "No evaluation")
             parsed = ranking.get("parsed_ranking", [])
-            lines.append(f"\n**{model}'s evaluation**:")
+            order = " > ".join(parsed) if parsed else "Could not parse"
             lines.append(
-                f"Ranking: {' > '.join(parsed) if parsed else 'Could not parse'}"
+                f"\n**{model}'s evaluation**:\nRanking: {order}\n\n{evaluation}\n"
             )
-            lines.append(f"\n{evaluation}\n")
         lines.append("</details>\n")
 
     # Stage 3: Chairman's Final Synthesis
@@ -97,8 +96,8 @@ def format_council_markdown(
 
     # Footer with stats
     total_tokens = sum(
-        r.get("usage", {}).get("total_tokens", 0)
-        for r in stage1_results + stage2_results + [stage3_result]
+        (r.get("usage") or {}).get("total_tokens", 0)
+        for r in chain(stage1_results, stage2_results, (stage3_result,))
     )
     lines.append(
         f"*Council completed in {elapsed_seconds:.1f}s using {len(stage1_results)} models | ~{total_tokens:,} tokens*"
@@ -150,7 +149,7 @@ async def handle_council_command(
         query,
         enabled=tool_context,
     )
-    plan = build_execution_plan(load_registry(), {
+    plan = build_execution_plan(current_registry(), {
         "query": query, "models": council_models, "compact": compact,
         "chairman": chairman_model, "mode": "sync",
         "parallel_mode": parallel_mode,
@@ -2,19 +2,46 @@
 
 import asyncio
 import logging
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+from . import json_codec
 from .config import (
     OPENROUTER_API_URL,
     OPENROUTER_MODELS_URL,
     get_model_reasoning_effort,
 )
+from .http_clients import get_client, phase_timeout
 from .secrets import OPENROUTER_API_KEY
 
 logger = logging.getLogger("llm-council.openrouter")
 
+# Model vendors whose native upstream OpenRouter should prefer when reasoning
+# effort is requested (keyed by the "<vendor>/" model ID prefix).
+_NATIVE_REASONING_PROVIDERS = frozenset({"anthropic", "openai"})
+
+
+# Built lazily from the current key (callers return early when it is missing)
+# and cached, shared by the chat and models endpoints' callers.
+@lru_cache(maxsize=4)
+def _chat_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "http://localhost:8800",
+        "X-Title": "LLM Council",
+    })
+
+
+@lru_cache(maxsize=4)
+def _models_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+
 
 async def query_model(
     model: str,
@@ -47,13 +74,6 @@ async def query_model(
         logger.error("OPENROUTER_API_KEY not configured")
         return None
 
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "http://localhost:8800",
-        "X-Title": "LLM Council",
-    }
-
     payload = build_chat_payload(
         model=model,
         messages=messages,
@@ -65,26 +85,28 @@ async def query_model(
     )
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL, headers=headers, json=payload
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            choice = data["choices"][0]
-            message = choice["message"]
-
-            return {
-                "content": message.get("content") or "",
-                "finish_reason": choice.get("finish_reason"),
-                "native_finish_reason": choice.get("native_finish_reason"),
-                "reasoning": message.get("reasoning") or "",
-                "reasoning_details": message.get("reasoning_details"),
-                "usage": data.get("usage", {}),
-                "model": model,
-                "provider": "openrouter",
-            }
+        response = await get_client("openrouter").post(
+            OPENROUTER_API_URL,
+            headers=_chat_headers(OPENROUTER_API_KEY),
+            content=json_codec.dumps(payload),
+            timeout=phase_timeout(timeout),
+        )
+        response.raise_for_status()
+
+        data = json_codec.loads(response.content)
+        choice = data["choices"][0]
+        message = choice["message"]
+
+        return {
+            "content": message.get("content") or "",
+            "finish_reason": choice.get("finish_reason"),
+            "native_finish_reason": choice.get("native_finish_reason"),
+            "reasoning": message.get("reasoning") or "",
+            "reasoning_details": message.get("reasoning_details"),
+            "usage": data.get("usage", {}),
+            "model": model,
+            "provider": "openrouter",
+        }
 
     except httpx.HTTPStatusError as e:
         logger.warning("HTTP error querying OpenRouter %s: %s", model, e.response.status_code)
@@ -130,10 +152,9 @@ def build_chat_payload(
         # while Anthropic native honored xhigh (1320 vs 1145 for high).
         # Upstream-provider substitution is explicit and defaults off so
         # benchmark and production routes cannot silently change providers.
-        if model.startswith("anthropic/"):
-            payload["provider"]["order"] = ["anthropic"]
-        elif model.startswith("openai/"):
-            payload["provider"]["order"] = ["openai"]
+        vendor, separator, _ = model.partition("/")
+        if separator and vendor in _NATIVE_REASONING_PROVIDERS:
+            payload["provider"]["order"] = [vendor]
 
     return payload
 
@@ -156,15 +177,14 @@ async def query_models_parallel(
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-
-    async def query_single(model: str) -> tuple[str, dict[str, Any] | None]:
-        result = await query_model(model, messages, max_tokens, temperature)
-        return model, result
-
-    tasks = [query_single(model) for model in models]
-    results = await asyncio.gather(*tasks)
-
-    return dict(results)
+    results = await asyncio.gather(
+        *(query_model(model, messages, max_tokens, temperature) for model in models),
+        return_exceptions=True,
+    )
+    return {
+        model: None if isinstance(result, BaseException) else result
+        for model, result in zip(models, results)
+    }
 
 
 async def list_openrouter_models() -> list[dict[str, Any]]:
@@ -178,17 +198,12 @@ async def list_openrouter_models() -> list[dict[str, Any]]:
         logger.error("OPENROUTER_API_KEY not configured")
         return []
 
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(OPENROUTER_MODELS_URL, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
+        response = await get_client("openrouter").get(
+            OPENROUTER_MODELS_URL, headers=_models_headers(OPENROUTER_API_KEY), timeout=phase_timeout(30.0)
+        )
+        response.raise_for_status()
+        return json_codec.loads(response.content).get("data", [])
     except Exception as e:
         logger.warning("Error listing OpenRouter models: %s", e)
         return []
@@ -0,0 +1,101 @@
+"""Per-route circuit breakers for dispatcher routes.
+
+A route whose recent calls mostly fail is skipped for a cool-down period, so
+council seats move to their declared fallback routes immediately instead of
+spending their retry budget and timeout on a provider that is down. Breakers are
+keyed by route rather than provider: one aggregator (OpenRouter) carries many
+unrelated models, and one misbehaving model must not bench the others.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+
+logger = logging.getLogger("llm-council.resilience")
+
+
+class CircuitBreaker:
+    """Rolling-window failure-ratio breaker with a single half-open probe window.
+
+    The window holds at most ``window`` outcomes, none older than
+    ``window_seconds``, so failures from long ago stop counting.
+
+    ``allow()`` is False while open. Once the cool-down expires calls are let
+    through again; the first outcome decides whether the breaker closes
+    (success) or re-opens (failure).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 10,
+        failure_ratio: float = 0.5,
+        open_seconds: float = 30.0,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.open_seconds = open_seconds
+        self.window_seconds = window_seconds
+        self._clock = clock
+        # (timestamp, succeeded), oldest first.
+        self._outcomes: deque[tuple[float, bool]] = deque(maxlen=window)
+        self._open_until = 0.0
+        self._half_open = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._clock() < self._open_until
+
+    def allow(self) -> bool:
+        """Whether a call to this provider should be attempted now."""
+        return not self.is_open
+
+    def record(self, succeeded: bool) -> None:
+        """Record one call outcome and trip the breaker if the window is unhealthy."""
+        if self.is_open:
+            # Late results from calls started before the breaker opened.
+            return
+        if self._half_open:
+            self._half_open = False
+            if not succeeded:
+                self._trip()
+                return
+            logger.info("%s circuit closed", self.name)
+        now = self._clock()
+        while self._outcomes and self._outcomes[0][0] <= now - self.window_seconds:
+            self._outcomes.popleft()
+        self._outcomes.append((now, succeeded))
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and failures >= self.failure_ratio * len(self._outcomes)
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        self._open_until = self._clock() + self.open_seconds
+        self._half_open = True
+        self._outcomes.clear()
+        logger.warning("%s circuit open for %.0fs", self.name, self.open_seconds)
+
+
+# Route id -> breaker, shared by every dispatcher in the process.
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(route_id: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a route, creating it on first use."""
+    breaker = _BREAKERS.get(route_id)
+    if breaker is None:
+        breaker = _BREAKERS[route_id] = CircuitBreaker(route_id)
+    return breaker
+
+
+def reset_breakers() -> None:
+    """Forget all breaker state (tests, operational resets)."""
+    _BREAKERS.clear()
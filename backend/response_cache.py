@@ -0,0 +1,49 @@
+"""Disk-backed response cache keyed by content hash.
+
+One JSON file per entry under ``RESPONSE_CACHE_DIR``; the file mtime is the
+entry timestamp, so expiry needs no index and stale files are dropped on read.
+"""
+
+import contextlib
+import logging
+import os
+import tempfile
+import time
+from typing import Any
+
+from . import json_codec
+from .config import RESPONSE_CACHE_DIR
+
+logger = logging.getLogger("llm-council.response-cache")
+
+
+def load(key: str, ttl_seconds: float) -> dict[str, Any] | None:
+    """Return the cached value for ``key`` if present and younger than the TTL."""
+    path = RESPONSE_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return json_codec.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable response cache entry %s: %s", key, e)
+        return None
+
+
+def store(key: str, value: dict[str, Any]) -> None:
+    """Atomically write ``value`` for ``key``; failures are logged, never raised."""
+    try:
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=RESPONSE_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_codec.dumps(value))
+            os.replace(tmp_path, RESPONSE_CACHE_DIR / f"{key}.json")
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError) as e:
+        logger.warning("Could not persist response cache entry %s: %s", key, e)
@@ -11,6 +11,7 @@ import logging
 import os
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 logger = logging.getLogger("llm-council.secrets")
 
@@ -30,24 +31,42 @@ _API_KEY_NAMES = (
 
 def _load_from_env() -> dict:
     """Load API keys from environment variables (Cloud Run / container mode)."""
-    secrets = {}
-    for key in _API_KEY_NAMES:
-        value = os.environ.get(key)
-        if value:
-            secrets[key] = value
-    return secrets
+    env = os.environ
+    return {key: value for key in _API_KEY_NAMES if (value := env.get(key))}
 
 
-def _load_from_bash_secrets() -> dict:
-    """Load API keys from ~/.bash_secrets (local development mode)."""
-    bash_secrets_path = Path.home() / ".bash_secrets"
+def _parse_assignment(line: str) -> tuple[str, str | None] | None:
+    """Parse one ``[export] KEY=VALUE`` line; None for comments and non-assignments.
+
+    The value is None when bash would expand it (``$VAR``, ``$(...)``, backticks
+    outside single quotes), since only a real shell can resolve it.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    key, sep, value = line.removeprefix("export ").partition("=")
+    key = key.strip()
+    if not sep or not key.isidentifier():
+        return None
+    value = value.strip()
+    quote = value[:1]
+    if quote in ("'", '"'):
+        end = value.find(quote, 1)
+        value = value[1:end] if end != -1 else value[1:]
+        if quote == "'":
+            return key, value
+    else:
+        value = value.split(" #", 1)[0].rstrip()
+    if "$" in value or "`" in value:
+        return key, None
+    return key, value
 
-    if not bash_secrets_path.exists():
-        return {}
 
+def _source_bash_secrets(path: Path) -> dict:
+    """Source the file in bash and read the resulting environment."""
     try:
         result = subprocess.run(
-            ["bash", "-c", f"source {bash_secrets_path} && env"],
+            ["bash", "-c", f"source {path} && env"],
             capture_output=True,
             text=True,
             check=True,
@@ -62,6 +81,49 @@ def _load_from_bash_secrets() -> dict:
             key, _, value = line.partition("=")
             if key in _API_KEY_NAMES:
                 secrets[key] = value
+    return secrets
+
+
+def _load_from_bash_secrets() -> dict:
+    """Load API keys from ~/.bash_secrets (local development mode).
+
+    Plain ``export KEY=VALUE`` assignments are parsed in-process. Values that
+    need shell expansion (``$VAR``, ``$(...)``, backticks) are skipped unless
+    SOURCE_BASH_SECRETS is set, which sources the file in a bash subprocess.
+    BASH_SECRETS_PATH overrides the file location; set it empty to skip the
+    file entirely (e.g. in containers that only use env vars).
+    """
+    override = os.environ.get("BASH_SECRETS_PATH")
+    if override == "":
+        return {}
+    bash_secrets_path = Path(override) if override else Path.home() / ".bash_secrets"
+
+    if not bash_secrets_path.is_file():
+        return {}
+
+    if os.getenv("SOURCE_BASH_SECRETS", "").lower() in {"1", "true", "yes", "on"}:
+        return _source_bash_secrets(bash_secrets_path)
+
+    try:
+        text = bash_secrets_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning("Failed to read ~/.bash_secrets: %s", e)
+        return {}
+
+    secrets = {}
+    for line in text.splitlines():
+        parsed = _parse_assignment(line)
+        if parsed is None or parsed[0] not in _API_KEY_NAMES:
+            continue
+        key, value = parsed
+        if value is None:
+            logger.warning(
+                "Skipping %s from ~/.bash_secrets: value needs shell expansion "
+                "(set SOURCE_BASH_SECRETS=1 to source the file)",
+                key,
+            )
+            continue
+        secrets[key] = value
 
     return secrets
 
@@ -97,33 +159,59 @@ def _load_secrets() -> dict:
     return secrets
 
 
-# Initialize secrets on module load
-_secrets: dict = _load_secrets()
+# Loaded on first use so importing this module never reads secrets by itself.
+_secrets: dict | None = None
 
 
-def get_secret(key: str) -> str | None:
-    """Get a secret by key name."""
-    return _secrets.get(key)
+def _get_all() -> dict:
+    """Return all loaded secrets, loading and validating them on first call."""
+    global _secrets
+    if _secrets is None:
+        _secrets = _load_secrets()
+        validate_required_keys()
+    return _secrets
 
 
-# Export API keys as module-level constants for backward compatibility
-OPENROUTER_API_KEY: str | None = _secrets.get("OPENROUTER_API_KEY")
-CEREBRAS_API_KEY: str | None = _secrets.get("CEREBRAS_API_KEY")
-ANTHROPIC_API_KEY: str | None = _secrets.get("ANTHROPIC_API_KEY")
-MOONSHOT_API_KEY: str | None = _secrets.get("MOONSHOT_API_KEY")
-GROK_API_KEY: str | None = _secrets.get("GROK_API_KEY")
-GEMINI_API_KEY: str | None = _secrets.get("GEMINI_API_KEY") or _secrets.get(
-    "GOOGLE_AI_API_KEY"
-)
-FIREWORKS_API_KEY: str | None = _secrets.get("FIREWORKS_API_KEY")
-COUNCIL_API_KEY: str | None = _secrets.get("COUNCIL_API_KEY")
+def get_secret(key: str) -> str | None:
+    """Get a secret by key name."""
+    return _get_all().get(key)
+
+
+# Module-level API key constants kept for backward compatibility, resolved on
+# first access (PEP 562). Each maps to the secret names tried in order.
+_KEY_CONSTANTS: dict[str, tuple[str, ...]] = {
+    "OPENROUTER_API_KEY": ("OPENROUTER_API_KEY",),
+    "CEREBRAS_API_KEY": ("CEREBRAS_API_KEY",),
+    "ANTHROPIC_API_KEY": ("ANTHROPIC_API_KEY",),
+    "MOONSHOT_API_KEY": ("MOONSHOT_API_KEY",),
+    "GROK_API_KEY": ("GROK_API_KEY",),
+    "GEMINI_API_KEY": ("GEMINI_API_KEY", "GOOGLE_AI_API_KEY"),
+    "FIREWORKS_API_KEY": ("FIREWORKS_API_KEY",),
+    "COUNCIL_API_KEY": ("COUNCIL_API_KEY",),
+}
+
+if TYPE_CHECKING:
+    OPENROUTER_API_KEY: str | None
+    CEREBRAS_API_KEY: str | None
+    ANTHROPIC_API_KEY: str | None
+    MOONSHOT_API_KEY: str | None
+    GROK_API_KEY: str | None
+    GEMINI_API_KEY: str | None
+    FIREWORKS_API_KEY: str | None
+    COUNCIL_API_KEY: str | None
+
+
+def __getattr__(name: str) -> str | None:
+    names = _KEY_CONSTANTS.get(name)
+    if names is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    secrets = _get_all()
+    value = next((secrets[key] for key in names if secrets.get(key)), None)
+    globals()[name] = value
+    return value
 
 
 def validate_required_keys() -> None:
     """Validate that minimum required API keys are present."""
-    if not OPENROUTER_API_KEY:
+    if not _get_all().get("OPENROUTER_API_KEY"):
         logger.warning("OPENROUTER_API_KEY not found — OpenRouter fallback disabled")
-
-
-# Validate on import
-validate_required_keys()
@@ -2,13 +2,14 @@
 
 import asyncio
 import contextlib
-import json
 import os
 import re
 import tempfile
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+from . import json_codec
 from .config import CONVERSATIONS_DIR
 
 # Valid conversation ID: UUID format only (prevents path traversal)
@@ -41,12 +42,24 @@ def ensure_data_dir():
     CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# CONVERSATIONS_DIR -> its resolved absolute path string. The directory does not
+# move at runtime, so resolve it once instead of on every path lookup.
+_resolved_dirs: dict[Path, str] = {}
+
+
+def _resolved_conversations_dir() -> str:
+    resolved = _resolved_dirs.get(CONVERSATIONS_DIR)
+    if resolved is None:
+        resolved = _resolved_dirs[CONVERSATIONS_DIR] = str(CONVERSATIONS_DIR.resolve())
+    return resolved
+
+
 def get_conversation_path(conversation_id: str) -> str:
     """Get the file path for a conversation."""
     _validate_conversation_id(conversation_id)
     path = (CONVERSATIONS_DIR / f"{conversation_id}.json").resolve()
     # Double-check resolved path stays under CONVERSATIONS_DIR
-    if not str(path).startswith(str(CONVERSATIONS_DIR.resolve())):
+    if not str(path).startswith(_resolved_conversations_dir()):
         raise ValueError(f"Path traversal detected: {conversation_id!r}")
     return str(path)
 
@@ -74,8 +87,8 @@ def create_conversation(conversation_id: str, active_models: list[str] | None =
 
     # Save to file
     path = get_conversation_path(conversation_id)
-    with open(path, "w") as f:
-        json.dump(conversation, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(json_codec.dumps(conversation, indent=True))
 
     return conversation
 
@@ -95,8 +108,8 @@ def get_conversation(conversation_id: str) -> dict[str, Any] | None:
     if not os.path.exists(path):
         return None
 
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return json_codec.loads(f.read())
 
 
 def save_conversation(conversation: dict[str, Any]):
@@ -113,8 +126,8 @@ def save_conversation(conversation: dict[str, Any]):
     dir_path = os.path.dirname(path)
     fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(conversation, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_codec.dumps(conversation, indent=True))
         os.replace(tmp_path, path)  # Atomic on POSIX
     except BaseException:
         # Clean up temp file on any failure
@@ -136,8 +149,8 @@ def list_conversations() -> list[dict[str, Any]]:
     for filename in os.listdir(CONVERSATIONS_DIR):
         if filename.endswith(".json"):
             path = str(CONVERSATIONS_DIR / filename)
-            with open(path) as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json_codec.loads(f.read())
                 # Return metadata only
                 conversations.append(
                     {
@@ -218,6 +231,8 @@ async def update_conversation_title(conversation_id: str, title: str):
         conversation = get_conversation(conversation_id)
         if conversation is None:
             raise ValueError(f"Conversation {conversation_id} not found")
+        if conversation.get("title") == title:
+            return
 
         conversation["title"] = title
         save_conversation(conversation)
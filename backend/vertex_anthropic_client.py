@@ -128,9 +128,9 @@ def _query_vertex_anthropic_sync(
 
         # Older SDK/provider surfaces may not support thinking/output_config yet.
         fallback_payload = {
-            "model": vertex_model,
-            "max_tokens": min(max_tokens, VERTEX_NON_STREAMING_MAX_TOKENS),
-            "messages": messages,
+            key: value
+            for key, value in payload.items()
+            if key not in {"thinking", "output_config"}
         }
         response = client.messages.create(**fallback_payload)
 
@@ -1,19 +1,28 @@
 """Webhook callback support for async council deliberations."""
 
 import asyncio
+import hashlib
+import heapq
+import hmac
 import ipaddress
 import logging
+import random
 import socket
 import time
 import uuid
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 from pydantic import BaseModel, HttpUrl
 
+from . import json_codec
+from .http_clients import get_client, phase_timeout
+
 logger = logging.getLogger("llm-council.webhooks")
 
 _BLOCKED_IP_NETWORKS = tuple(
@@ -25,6 +34,17 @@ _BLOCKED_IP_NETWORKS = tuple(
 )
 
 
+# Caps on the pause between webhook attempts: our own backoff, and a
+# receiver-requested Retry-After.
+_MAX_BACKOFF_SECONDS = 30.0
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+_WEBHOOK_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "LLM-Council-Webhook/1.0",
+}
+
+
 def _utc_now_iso() -> str:
     """Return a timezone-aware UTC timestamp using the existing trailing-Z format."""
     return datetime.now(UTC).isoformat().replace("+00:00", "Z")
@@ -126,9 +146,22 @@ _VALID_JOB_ID_RE = _re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", _re.IGNORECASE
 )
 
-# In-memory write-through cache
+# In-memory write-through cache, kept in creation order
 _jobs: dict[str, dict[str, Any]] = {}
 
+# Upper bound on jobs held in memory. Beyond it the oldest settled jobs are
+# dropped from memory; their files stay on disk and get_job reloads them on
+# demand, but without the full result (_save_job never persists it), so a
+# later poll only sees the status and result_summary. cleanup_old_jobs still
+# deletes their files. Pending, running and COMPLETED jobs (webhook delivery
+# still in progress) are never evicted.
+MAX_CACHED_JOBS = int(_os.getenv("MAX_CACHED_JOBS", "10000"))
+_SETTLED_STATUSES = frozenset({
+    JobStatus.FAILED,
+    JobStatus.WEBHOOK_SENT,
+    JobStatus.WEBHOOK_FAILED,
+})
+
 
 def _job_path(job_id: str) -> str:
     """Get the file path for a job. Validates ID format."""
@@ -176,18 +209,40 @@ def _load_all_jobs() -> dict[str, dict[str, Any]]:
                     jobs[job["job_id"]] = job
             except Exception as e:
                 logger.warning("Failed to load job %s: %s", filename, e)
-    return jobs
+    return dict(sorted(jobs.items(), key=lambda item: item[1].get("created_at", "")))
+
+
+def _evict_settled_jobs() -> None:
+    """Drop the oldest settled jobs from memory while over MAX_CACHED_JOBS."""
+    excess = len(_jobs) - MAX_CACHED_JOBS
+    if excess <= 0:
+        return
+    settled = (job_id for job_id, job in _jobs.items() if job["status"] in _SETTLED_STATUSES)
+    for job_id in list(islice(settled, excess)):
+        del _jobs[job_id]
 
 
 # Load existing jobs from disk on module import
 _jobs = _load_all_jobs()
+_evict_settled_jobs()
 logger.info("Loaded %d persisted jobs from disk", len(_jobs))
 
 
 def create_job(request: CouncilAsyncRequest) -> str:
     """Create a new async job and return its ID. Persisted to disk."""
     _validate_webhook_url(str(request.webhook_url))
+    return _store_new_job(request)
+
+
+async def acreate_job(request: CouncilAsyncRequest) -> str:
+    """create_job for request handlers: the DNS-resolving URL check runs off the loop."""
+    await asyncio.to_thread(_validate_webhook_url, str(request.webhook_url))
+    return _store_new_job(request)
+
+
+def _store_new_job(request: CouncilAsyncRequest) -> str:
     job_id = str(uuid.uuid4())
+    created = datetime.now(UTC)
     job = {
         "job_id": job_id,
         "status": JobStatus.PENDING,
@@ -202,7 +257,8 @@ def create_job(request: CouncilAsyncRequest) -> str:
         "metadata": request.metadata,
         "parallel_mode": request.parallel_mode,
         "parallel_classifier_score": request.parallel_classifier_score,
-        "created_at": _utc_now_iso(),
+        "created_at": created.isoformat().replace("+00:00", "Z"),
+        "created_ts": created.timestamp(),
         "started_at": None,
         "completed_at": None,
         "error": None,
@@ -210,6 +266,7 @@ def create_job(request: CouncilAsyncRequest) -> str:
     }
     _jobs[job_id] = job
     _save_job(job)
+    _evict_settled_jobs()
     return job_id
 
 
@@ -221,16 +278,17 @@ def get_job(job_id: str) -> dict[str, Any] | None:
         job = _load_job(job_id)
         if job:
             _jobs[job_id] = job
+            _evict_settled_jobs()
     return job
 
 
 def list_jobs(limit: int = 50, status: JobStatus | None = None) -> list[JobInfo]:
     """List recent jobs, optionally filtered by status."""
-    jobs = list(_jobs.values())
+    jobs = _jobs.values()
     if status:
-        jobs = [j for j in jobs if j["status"] == status]
-    # Sort by created_at descending
-    jobs.sort(key=lambda x: x["created_at"], reverse=True)
+        jobs = (j for j in jobs if j["status"] == status)
+    # Newest first; selects the top `limit` without sorting every stored job.
+    recent = heapq.nlargest(limit, jobs, key=itemgetter("created_at"))
     return [
         JobInfo(
             job_id=j["job_id"],
@@ -243,7 +301,7 @@ def list_jobs(limit: int = 50, status: JobStatus | None = None) -> list[JobInfo]
             error=j["error"],
             result_summary=j.get("result_summary"),
         )
-        for j in jobs[:limit]
+        for j in recent
     ]
 
 
@@ -254,6 +312,27 @@ def update_job(job_id: str, **updates):
         _save_job(_jobs[job_id])
 
 
+def _is_permanent_failure(status: int) -> bool:
+    """Client errors that a retry cannot fix; 408 and 429 are transient."""
+    return 400 <= status < 500 and status not in (408, 429)
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Seconds to wait before the next delivery attempt.
+
+    Honours a numeric Retry-After on 429/503 (capped), otherwise exponential
+    backoff with jitter so jobs finishing together do not retry in lockstep.
+    """
+    if response is not None and response.status_code in (429, 503):
+        try:
+            retry_after = float(response.headers.get("retry-after", ""))
+        except ValueError:
+            pass
+        else:
+            return min(max(retry_after, 0.0), _MAX_RETRY_AFTER_SECONDS)
+    return min(2**attempt, _MAX_BACKOFF_SECONDS) * (0.5 + random.random())
+
+
 async def send_webhook(
     webhook_url: str,
     payload: dict[str, Any],
@@ -277,54 +356,51 @@ async def send_webhook(
     Raises:
         ValueError: If webhook_url targets a private/internal IP (SSRF protection)
     """
-    # SSRF protection: block private/internal IPs
-    _validate_webhook_url(webhook_url)
-
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "LLM-Council-Webhook/1.0",
-    }
-
-    # Serialize payload once — sign and send the exact same bytes
-    import json as json_module
+    # SSRF protection: block private/internal IPs. The check does a blocking
+    # getaddrinfo, so run it in a worker thread rather than on the event loop.
+    await asyncio.to_thread(_validate_webhook_url, webhook_url)
 
-    payload_bytes = json_module.dumps(
-        payload, sort_keys=True, ensure_ascii=False
-    ).encode()
+    # Serialize payload once — sign and send the exact same bytes on every attempt
+    payload_bytes = json_codec.dumps(payload, sort_keys=True)
 
-    # Add HMAC signature if secret provided
+    headers = _WEBHOOK_HEADERS
     if secret:
-        import hashlib
-        import hmac
-
         signature = hmac.new(secret.encode(), payload_bytes, hashlib.sha256).hexdigest()
-        headers["X-Webhook-Signature"] = f"sha256={signature}"
-
-    async with httpx.AsyncClient() as client:
-        for attempt in range(retries):
-            try:
-                response = await client.post(
-                    webhook_url,
-                    content=payload_bytes,
-                    headers=headers,
-                    timeout=timeout,
-                )
-                if response.status_code < 300:
-                    return True
-                logger.warning(
-                    "Webhook attempt %d failed: HTTP %d",
-                    attempt + 1,
-                    response.status_code,
-                )
-            except httpx.TimeoutException:
-                logger.warning("Webhook attempt %d timed out", attempt + 1)
-            except Exception as e:
-                logger.warning("Webhook attempt %d error: %s", attempt + 1, e)
-
-            # Exponential backoff
-            if attempt < retries - 1:
-                await asyncio.sleep(2**attempt)
+        headers = {**_WEBHOOK_HEADERS, "X-Webhook-Signature": f"sha256={signature}"}
 
+    # Retries reuse the pooled client's keep-alive connection to the receiver.
+    client = get_client("webhooks")
+    failures: list[str] = []
+    for attempt in range(retries):
+        response = None
+        try:
+            response = await client.post(
+                webhook_url,
+                content=payload_bytes,
+                headers=headers,
+                timeout=phase_timeout(timeout),
+            )
+            if response.status_code < 300:
+                return True
+            failures.append(f"HTTP {response.status_code}")
+            if _is_permanent_failure(response.status_code):
+                break
+        except httpx.TimeoutException:
+            failures.append("timeout")
+        except Exception as e:
+            failures.append(type(e).__name__)
+        logger.debug("Webhook attempt %d failed: %s", attempt + 1, failures[-1])
+
+        if attempt < retries - 1:
+            await asyncio.sleep(_retry_delay(attempt, response))
+
+    # One record per failed delivery rather than one per attempt.
+    logger.warning(
+        "Webhook delivery to %s failed after %d attempt(s): %s",
+        urlparse(webhook_url).hostname,
+        len(failures),
+        ", ".join(failures),
+    )
     return False
 
 
@@ -341,9 +417,8 @@ async def run_council_async(
     if not job:
         return
 
-    update_job(
-        job_id, status=JobStatus.RUNNING, started_at=_utc_now_iso()
-    )
+    started_at = _utc_now_iso()
+    update_job(job_id, status=JobStatus.RUNNING, started_at=started_at)
 
     try:
         # Run the actual council deliberation
@@ -357,13 +432,24 @@ async def run_council_async(
             parallel_classifier_score=job.get("parallel_classifier_score"),
         )
 
-        update_job(
-            job_id,
-            status=JobStatus.COMPLETED,
-            completed_at=_utc_now_iso(),
-            result=result,
-            result_summary=f"Council completed with {len(result.get('stage1', {}))} models",
-        )
+        completed_at = _utc_now_iso()
+        completed = {
+            "completed_at": completed_at,
+            "result": result,
+            "result_summary": f"Council completed with {len(result.get('stage1', {}))} models",
+        }
+
+        if job.get("webhook_secret_configured") and not job.get("webhook_secret"):
+            # Nothing will be delivered, so record the final state in one write.
+            update_job(
+                job_id,
+                status=JobStatus.WEBHOOK_FAILED,
+                error="Webhook secret was configured but is unavailable after reload; refusing to send unsigned webhook",
+                **completed,
+            )
+            return
+
+        update_job(job_id, status=JobStatus.COMPLETED, **completed)
 
         # Build webhook payload
         webhook_payload = {
@@ -374,19 +460,11 @@ async def run_council_async(
             "metadata": job.get("metadata"),
             "timing": {
                 "created_at": job["created_at"],
-                "started_at": _jobs[job_id]["started_at"],
-                "completed_at": _jobs[job_id]["completed_at"],
+                "started_at": started_at,
+                "completed_at": completed_at,
             },
         }
 
-        if job.get("webhook_secret_configured") and not job.get("webhook_secret"):
-            update_job(
-                job_id,
-                status=JobStatus.WEBHOOK_FAILED,
-                error="Webhook secret was configured but is unavailable after reload; refusing to send unsigned webhook",
-            )
-            return
-
         # Send webhook
         success = await send_webhook(
             job["webhook_url"],
@@ -430,14 +508,65 @@ async def run_council_async(
             )
 
 
+# Async council jobs run concurrently; further submissions wait in FIFO order.
+ASYNC_JOB_WORKERS = int(_os.getenv("ASYNC_JOB_WORKERS", "8"))
+
+
+class JobWorkerPool:
+    """Fixed set of worker tasks draining a FIFO queue of async council job IDs.
+
+    Must be created inside a running event loop; the workers are bound to it.
+    """
+
+    def __init__(self, handle_council_command, workers: int = ASYNC_JOB_WORKERS) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.workers = workers
+        self._handler = handle_council_command
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    @property
+    def depth(self) -> int:
+        """Jobs accepted but not yet picked up by a worker."""
+        return self._queue.qsize()
+
+    def submit(self, job_id: str) -> None:
+        self._queue.put_nowait(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await run_council_async(job_id, self._handler)
+            except Exception:
+                logger.exception("Async council job %s crashed", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def aclose(self) -> None:
+        """Stop the workers; queued jobs stay PENDING."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def _created_ts(job: dict[str, Any]) -> float:
+    """Job creation time as a Unix timestamp, parsed once for jobs persisted without it."""
+    created_ts = job.get("created_ts")
+    if created_ts is None:
+        created = datetime.fromisoformat(job["created_at"].replace("Z", "+00:00"))
+        created_ts = job["created_ts"] = created.timestamp()
+    return created_ts
+
+
 def cleanup_old_jobs(max_age_hours: int = 24):
-    """Remove jobs older than max_age_hours (from memory and disk)."""
+    """Remove jobs older than max_age_hours (from memory and disk).
+
+    Jobs evicted from memory are found by scanning JOBS_DIR; their age is the
+    file mtime, so the files do not have to be parsed.
+    """
     cutoff = time.time() - (max_age_hours * 3600)
-    to_remove = []
-    for job_id, job in _jobs.items():
-        created = datetime.fromisoformat(job["created_at"].replace("Z", "+00:00"))
-        if created.timestamp() < cutoff:
-            to_remove.append(job_id)
+    to_remove = [job_id for job_id, job in _jobs.items() if _created_ts(job) < cutoff]
     for job_id in to_remove:
         del _jobs[job_id]
         # Remove from disk too
@@ -447,4 +576,18 @@ def cleanup_old_jobs(max_age_hours: int = 24):
                 _os.remove(path)
         except Exception:
             pass  # Best effort
-    return len(to_remove)
+
+    # Files of jobs no longer held in memory (evicted, or written by another instance)
+    removed_from_disk = 0
+    with contextlib.suppress(FileNotFoundError), _os.scandir(JOBS_DIR) as entries:
+        for entry in entries:
+            job_id, ext = _os.path.splitext(entry.name)
+            if ext != ".json" or job_id in _jobs or not _VALID_JOB_ID_RE.match(job_id):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    _os.remove(entry.path)
+                    removed_from_disk += 1
+            except OSError:
+                pass  # Best effort
+    return len(to_remove) + removed_from_disk
@@ -2,10 +2,13 @@
 
 import logging
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
+from . import json_codec
+from .http_clients import get_client, phase_timeout
 from .provider_errors import XAIInvalidUsageError
 from .secrets import GROK_API_KEY
 
@@ -13,6 +16,15 @@ logger = logging.getLogger("llm-council.xai")
 
 XAI_API_URL = "https://api.x.ai/v1"
 
+
+@lru_cache(maxsize=4)
+def _xai_headers(api_key: str) -> httpx.Headers:
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+
+
 # Model ID mapping: council ID -> xAI API model ID
 # Note: xAI API uses hyphens (grok-4-1-fast-reasoning), not dots (grok-4.1-fast)
 XAI_MODEL_MAP = {
@@ -30,7 +42,7 @@ XAI_MODEL_MAP = {
 
 def get_xai_model_id(council_model_id: str) -> str:
     """Convert council model ID to xAI's model ID."""
-    return XAI_MODEL_MAP.get(council_model_id, council_model_id.replace("x-ai/", ""))
+    return XAI_MODEL_MAP.get(council_model_id) or council_model_id.removeprefix("x-ai/")
 
 
 def normalize_xai_usage(usage: object) -> dict[str, Any]:
@@ -77,46 +89,43 @@ async def query_xai_model(
 
     xai_model = get_xai_model_id(model_id)
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            response = await client.post(
-                f"{XAI_API_URL}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {GROK_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": xai_model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            return {
-                "content": data["choices"][0]["message"]["content"],
-                "usage": normalize_xai_usage(data.get("usage")),
-                "model": model_id,
-                "provider": "xai",
-            }
-        except XAIInvalidUsageError:
-            logger.error("xAI request failed category=invalid_usage model=%s", model_id)
-            raise
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                "xAI request failed category=http_status status=%s model=%s",
-                e.response.status_code,
-                model_id,
-            )
-            return None
-        except httpx.TimeoutException:
-            logger.error("xAI request failed category=timeout model=%s", model_id)
-            return None
-        except httpx.RequestError:
-            logger.error("xAI request failed category=transport_error model=%s", model_id)
-            return None
-        except Exception:
-            logger.error("xAI request failed category=unexpected_error model=%s", model_id)
-            return None
+    try:
+        response = await get_client("xai").post(
+            f"{XAI_API_URL}/chat/completions",
+            headers=_xai_headers(GROK_API_KEY),
+            content=json_codec.dumps({
+                "model": xai_model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+            }),
+            timeout=phase_timeout(timeout),
+        )
+        response.raise_for_status()
+        data = json_codec.loads(response.content)
+
+        return {
+            "content": data["choices"][0]["message"]["content"],
+            "usage": normalize_xai_usage(data.get("usage")),
+            "model": model_id,
+            "provider": "xai",
+        }
+    except XAIInvalidUsageError:
+        logger.error("xAI request failed category=invalid_usage model=%s", model_id)
+        raise
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            "xAI request failed category=http_status status=%s model=%s",
+            e.response.status_code,
+            model_id,
+        )
+        return None
+    except httpx.TimeoutException:
+        logger.error("xAI request failed category=timeout model=%s", model_id)
+        return None
+    except httpx.RequestError:
+        logger.error("xAI request failed category=transport_error model=%s", model_id)
+        return None
+    except Exception:
+        logger.error("xAI request failed category=unexpected_error model=%s", model_id)
+        return None
@@ -186,6 +186,36 @@ function App() {
             });
             break;
 
+          case 'stage1_token':
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const responses = lastMsg.stage1 || [];
+              const existing = responses.find((r) => r.model === event.model);
+              const streamed = {
+                model: event.model,
+                response: (existing?.response || '') + event.delta,
+              };
+              lastMsg.stage1 = existing
+                ? responses.map((r) => (r === existing ? streamed : r))
+                : [...responses, streamed];
+              return { ...prev, messages };
+            });
+            break;
+
+          case 'stage1_partial':
+            // The finished result replaces any tokens streamed for this model.
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const responses = lastMsg.stage1 || [];
+              lastMsg.stage1 = responses.some((r) => r.model === event.data.model)
+                ? responses.map((r) => (r.model === event.data.model ? event.data : r))
+                : [...responses, event.data];
+              return { ...prev, messages };
+            });
+            break;
+
           case 'stage1_complete':
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];
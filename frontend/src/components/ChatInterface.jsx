@@ -257,7 +257,7 @@ export default function ChatInterface({
                     {/* Stage Progress Timeline (Shown when loading OR when message is complete) */}
                     {(isMsgLoading || hasData) && (
                       <div className="deliberation-timeline">
-                        <div className={`timeline-step ${msg.stage1 ? 'completed' : msg.loading?.stage1 ? 'active' : ''}`}>
+                        <div className={`timeline-step ${msg.loading?.stage1 ? 'active' : msg.stage1 ? 'completed' : ''}`}>
                           <div className="step-number">1</div>
                           <div className="step-label">Stage 1: Collection</div>
                         </div>
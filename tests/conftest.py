@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from backend.resilience import reset_breakers
+
+
+@pytest.fixture(autouse=True)
+def _fresh_circuit_breakers():
+    """Provider breakers are process-wide; keep failures from leaking across tests."""
+    reset_breakers()
+    yield
+    reset_breakers()
@@ -1,12 +1,15 @@
 """Integration tests for FastAPI endpoints."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from backend import json_codec, storage
 from backend.auth import _is_tailscale_ip
-from backend.main import app
+from backend.main import CodecJSONResponse, CouncilRequest, _coalesced_council, app
+from backend.opencode_integration import format_council_markdown
 
 
 # Disable API key auth for all tests
@@ -99,6 +102,26 @@ class TestApiAuth:
 
         assert response.status_code == 401
 
+    def test_wrong_and_non_ascii_api_keys_are_rejected(self):
+        with patch("backend.auth.COUNCIL_API_KEY", "test-key"):
+            wrong = client.get("/api/info", headers={"X-Council-Key": "test-kez"})
+            non_ascii = client.get(
+                "/api/info", headers={"X-Council-Key": "tést-key".encode()}
+            )
+            valid = client.get("/api/info", headers={"X-Council-Key": "test-key"})
+
+        assert wrong.status_code == 403
+        assert non_ascii.status_code == 403
+        assert valid.status_code == 200
+
+    def test_options_request_skips_api_key_check(self):
+        # No Access-Control-Request-Method header, so CORSMiddleware passes this
+        # through and ApiKeyMiddleware's OPTIONS bypass is what lets it reach routing.
+        with patch("backend.auth.COUNCIL_API_KEY", "test-key"):
+            response = client.options("/api/info")
+
+        assert response.status_code == 405
+
     def test_monitor_ingest_has_dedicated_fail_closed_auth(self):
         event = {"schema_version":"1.0","event_id":"e1","provider":"p","model":"m","version":"1","source":{"id":"s","url":"https://example.com"},"routes":["p/m"],"confidence":0.9}
         with patch.dict("os.environ", {}, clear=True):
@@ -575,6 +598,11 @@ class TestConversationModelSelection:
             assert call_kwargs["council_models"] == override_models
             assert mock_run.call_args.args[0] == "AUGMENTED QUERY"
             assert response.json()["metadata"]["tool_context"]["enabled"] is True
+            stored = client.get(
+                f"/api/conversations/{conversation['id']}",
+                headers={"X-Council-Key": "test-key"},
+            ).json()
+            assert stored["title"] == "Test Title"
 
     @patch("backend.main.generate_conversation_title")
     @patch("backend.main.augment_query_with_tool_context")
@@ -609,3 +637,113 @@ class TestConversationModelSelection:
             assert response.status_code == 200
             call_kwargs = mock_run.call_args.kwargs
             assert call_kwargs["council_models"] == active_models
+
+    def test_unchanged_title_update_skips_rewrite(self, tmp_path):
+        with patch("backend.storage.CONVERSATIONS_DIR", tmp_path):
+            storage.create_conversation("00000000-0000-0000-0000-000000000001")
+            asyncio.run(storage.update_conversation_title(
+                "00000000-0000-0000-0000-000000000001", "Renamed"
+            ))
+
+            with patch("backend.storage.save_conversation") as save:
+                asyncio.run(storage.update_conversation_title(
+                    "00000000-0000-0000-0000-000000000001", "Renamed"
+                ))
+
+            save.assert_not_called()
+            stored = storage.get_conversation("00000000-0000-0000-0000-000000000001")
+            assert stored["title"] == "Renamed"
+
+
+def test_json_responses_render_through_json_codec():
+    payload = {"title": "Café", "stage1": [{"model": "A", "usage": {"total_tokens": 3}}]}
+
+    assert CodecJSONResponse(payload).body == json_codec.dumps(payload)
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_council_requests_share_one_run():
+    release = asyncio.Event()
+
+    async def slow_council(**kwargs):
+        await release.wait()
+        return {"stage3": {"response": kwargs["query"]}}
+
+    with patch("backend.main.handle_council_command", side_effect=slow_council) as mock_council:
+        first = asyncio.create_task(_coalesced_council(CouncilRequest(query="same")))
+        second = asyncio.create_task(_coalesced_council(CouncilRequest(query="same")))
+        other = asyncio.create_task(_coalesced_council(CouncilRequest(query="same", compact=True)))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, other)
+
+    assert mock_council.call_count == 2
+    assert results[0] is results[1]
+    assert results[2] is not results[0]
+
+
+def test_council_markdown_tolerates_null_usage():
+    markdown = format_council_markdown(
+        "q",
+        [{"model": "A", "response": "a", "usage": None}, {"model": "B", "usage": {"total_tokens": 5}}],
+        [],
+        {"model": "C", "response": "final", "usage": {"total_tokens": 7}},
+        {},
+    )
+
+    assert "(unknown, N/A tokens)" in markdown
+    assert markdown.endswith("using 2 models | ~12 tokens*")
+
+
+def test_lifespan_warms_clients_on_startup_and_closes_them_on_shutdown():
+    with (
+        patch("backend.main.warm_clients", new_callable=AsyncMock) as warm,
+        patch("backend.main.aclose_clients", new_callable=AsyncMock) as close,
+        TestClient(app) as lifespan_client,
+    ):
+        assert lifespan_client.get("/health").status_code == 200
+        close.assert_not_awaited()
+
+    warm.assert_awaited_once()
+    close.assert_awaited_once()
+
+
+async def test_send_message_cancels_title_task_when_council_fails(tmp_path):
+    from backend import main
+
+    title_started = asyncio.Event()
+    title_cancelled = asyncio.Event()
+
+    async def slow_title(_content):
+        title_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            title_cancelled.set()
+            raise
+
+    async def augment(content, enabled):
+        await title_started.wait()
+        return content, {}
+
+    with (
+        patch("backend.storage.CONVERSATIONS_DIR", tmp_path),
+        patch("backend.main.generate_conversation_title", slow_title),
+        patch("backend.main.augment_query_with_tool_context", augment),
+        patch("backend.main.run_full_council", AsyncMock(side_effect=RuntimeError("down"))),
+    ):
+        conversation = storage.create_conversation("12345678-1234-4234-9234-00000000007e")
+        with pytest.raises(RuntimeError):
+            await main.send_message(conversation["id"], main.SendMessageRequest(content="q"))
+        await asyncio.sleep(0)
+
+    assert title_cancelled.is_set()
+
+
+def test_health_reads_the_shared_registry_snapshot():
+    from backend.model_registry import current_registry
+
+    with patch("backend.main.current_registry", wraps=current_registry) as registry:
+        assert client.get("/health").status_code == 200
+
+    registry.assert_called_once_with()
@@ -0,0 +1,119 @@
+"""Tests for the AIMD provider concurrency limiter."""
+
+import asyncio
+import time
+
+from backend.backpressure import MAX_THROTTLE_SECONDS, AimdLimiter
+
+
+def test_fast_success_increases_limit_additively_up_to_max():
+    limiter = AimdLimiter(initial=2, c_max=3, alpha=0.5)
+
+    limiter.record(100, 200)
+    limiter.record(100, 200)
+    assert limiter.limit == 3
+
+    limiter.record(100, 200)
+    limiter.record(100, 200)
+    assert limiter.limit == 3
+
+
+def test_slow_success_holds_limit():
+    limiter = AimdLimiter(initial=4, target_ms=1000)
+
+    limiter.record(5000, 200)
+
+    assert limiter.limit == 4
+
+
+def test_overload_status_decreases_limit_multiplicatively_to_min():
+    limiter = AimdLimiter(initial=8, c_min=2, beta=0.5)
+
+    limiter.record(100, 429)
+    assert limiter.limit == 4
+
+    limiter.record(100, 503)
+    limiter.on_error()
+    assert limiter.limit == 2
+
+
+async def test_acquire_blocks_beyond_limit_until_release():
+    limiter = AimdLimiter(initial=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
+
+
+def test_retry_after_header_pauses_acquisition_with_cap():
+    limiter = AimdLimiter()
+
+    limiter.observe_headers({"retry-after": "2"})
+    assert 1.5 < limiter._paused_until - time.monotonic() <= 2
+
+    limiter.observe_headers({"retry-after": "86400"})
+    assert limiter._paused_until - time.monotonic() <= MAX_THROTTLE_SECONDS
+
+
+def test_low_remaining_quota_throttles_until_reset():
+    limiter = AimdLimiter()
+
+    limiter.observe_headers({
+        "x-ratelimit-remaining-requests": "50",
+        "x-ratelimit-limit-requests": "100",
+        "x-ratelimit-reset-requests": "5s",
+    })
+    assert limiter._paused_until == 0.0
+
+    limiter.observe_headers({
+        "x-ratelimit-remaining-requests": "5",
+        "x-ratelimit-limit-requests": "100",
+        "x-ratelimit-reset-requests": "5s",
+    })
+    assert limiter._paused_until > time.monotonic()
+
+
+def test_malformed_rate_limit_headers_are_ignored():
+    limiter = AimdLimiter()
+
+    limiter.observe_headers({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    limiter.observe_headers({"x-ratelimit-remaining-requests": "lots"})
+
+    assert limiter._paused_until == 0.0
+
+
+async def test_cancelled_release_still_returns_the_permit():
+    limiter = AimdLimiter(initial=1)
+    await limiter.acquire()
+    cond = limiter._condition()
+
+    async with cond:
+        # Lock held elsewhere: release must wait for it to notify waiters.
+        releasing = asyncio.create_task(limiter.release())
+        await asyncio.sleep(0)
+        releasing.cancel()
+        await asyncio.sleep(0)
+
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+def test_limiter_is_usable_from_successive_event_loops():
+    limiter = AimdLimiter(initial=1)
+
+    async def hold():
+        async with limiter:
+            await asyncio.sleep(0)
+
+    async def contend():
+        # The second task waits on the condition, binding it to this loop.
+        await asyncio.gather(hold(), hold())
+
+    asyncio.run(contend())
+    asyncio.run(contend())
+    assert limiter.in_flight == 0
@@ -0,0 +1,105 @@
+"""Tests for the Cerebras client streaming path."""
+
+import json
+from contextlib import asynccontextmanager
+
+from backend import cerebras
+
+
+class FakeStreamResponse:
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, lines):
+        self._lines = lines
+
+    def raise_for_status(self):
+        return None
+
+    async def aiter_lines(self):
+        for line in self._lines:
+            yield line
+
+
+class FakeClient:
+    def __init__(self, lines):
+        self.lines = lines
+        self.calls = []
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        yield FakeStreamResponse(self.lines)
+
+
+def _sse(chunk):
+    return f"data: {json.dumps(chunk)}"
+
+
+async def test_streamed_completion_is_assembled(monkeypatch):
+    client = FakeClient([
+        _sse({"choices": [{"delta": {"content": "Hello"}}]}),
+        "",
+        _sse({"choices": [{"delta": {"content": ", world"}}]}),
+        _sse({"choices": [], "usage": {"prompt_tokens": 3, "completion_tokens": 2}}),
+        "data: [DONE]",
+    ])
+    monkeypatch.setattr(cerebras, "CEREBRAS_API_KEY", "test-key")
+    monkeypatch.setattr(cerebras, "get_client", lambda name: client)
+
+    result = await cerebras.query_cerebras_model(
+        "zai-glm-4.7", [{"role": "user", "content": "hi"}]
+    )
+
+    assert result == {
+        "content": "Hello, world",
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2},
+        "model": "zai-glm-4.7",
+        "provider": "cerebras",
+    }
+    method, url, kwargs = client.calls[0]
+    assert (method, url) == ("POST", f"{cerebras.CEREBRAS_API_URL}/chat/completions")
+    assert json.loads(kwargs["content"])["stream"] is True
+
+
+async def test_streamed_reasoning_only_response_falls_back_to_reasoning(monkeypatch):
+    client = FakeClient([
+        _sse({"choices": [{"delta": {"reasoning": "thinking out loud"}}]}),
+        "data: [DONE]",
+    ])
+    monkeypatch.setattr(cerebras, "CEREBRAS_API_KEY", "test-key")
+    monkeypatch.setattr(cerebras, "get_client", lambda name: client)
+
+    result = await cerebras.query_cerebras_model(
+        "zai-glm-4.7", [{"role": "user", "content": "hi"}]
+    )
+
+    assert result["content"] == "thinking out loud"
+
+
+async def test_request_uses_phase_timeouts(monkeypatch):
+    client = FakeClient(["data: [DONE]"])
+    monkeypatch.setattr(cerebras, "CEREBRAS_API_KEY", "test-key")
+    monkeypatch.setattr(cerebras, "get_client", lambda name: client)
+
+    await cerebras.query_cerebras_model(
+        "zai-glm-4.7", [{"role": "user", "content": "hi"}], timeout=900.0
+    )
+
+    timeout = client.calls[0][2]["timeout"]
+    assert timeout.read == 900.0
+    assert timeout.connect == cerebras.phase_timeout(900.0).connect < 900.0
+
+
+async def test_request_headers_use_the_key_in_effect_at_request_time(monkeypatch):
+    client = FakeClient(["data: [DONE]"])
+    monkeypatch.setattr(cerebras, "get_client", lambda name: client)
+
+    for key in ("first-key", "rotated-key"):
+        monkeypatch.setattr(cerebras, "CEREBRAS_API_KEY", key)
+        await cerebras.query_cerebras_model("zai-glm-4.7", [{"role": "user", "content": "hi"}])
+
+    assert [call[2]["headers"]["Authorization"] for call in client.calls] == [
+        "Bearer first-key",
+        "Bearer rotated-key",
+    ]
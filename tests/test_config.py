@@ -9,6 +9,7 @@ from backend.config import (
     FIREWORKS_MODEL_IDS,
     MODEL_ALIASES,
     VERTEX_ANTHROPIC_MODEL_IDS,
+    get_direct_provider,
     get_model_reasoning_effort,
     get_openrouter_fallback,
     get_vertex_anthropic_model_id,
@@ -327,6 +328,22 @@ class TestFireworksModelIds:
         assert "fireworks/glm-5" in FIREWORKS_MODEL_IDS
 
 
+class TestDirectProvider:
+    """Test single-lookup direct provider routing."""
+
+    def test_fireworks_models_route_to_fireworks(self):
+        assert get_direct_provider("fireworks/glm-5.2") == "fireworks"
+
+    def test_cerebras_models_route_to_cerebras(self):
+        assert get_direct_provider("zai-glm-4.7") == "cerebras"
+
+    def test_vertex_models_route_to_vertex(self):
+        assert all(get_direct_provider(model) == "vertex" for model in VERTEX_ANTHROPIC_MODEL_IDS)
+
+    def test_unknown_models_have_no_direct_provider(self):
+        assert get_direct_provider("unknown/model") is None
+
+
 class TestOpenRouterFallbackMap:
     """Test current and legacy model fallback metadata."""
 
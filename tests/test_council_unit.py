@@ -522,6 +522,24 @@ class TestAggregateRankings:
         assert by_model["model-a"]["positions"] == [1, 2]
         assert by_model["model-b"]["positions"] == [2, 1]
 
+    def test_prefers_stage2_parsed_ranking_over_reparsing_text(self, monkeypatch):
+        from backend import council
+
+        def fail_parse(_text):
+            raise AssertionError("ranking text should not be re-parsed")
+
+        monkeypatch.setattr(council, "parse_ranking_from_text", fail_parse)
+        stage2 = [
+            {"ranking": "FINAL RANKING:\n1. Response A", "parsed_ranking": ["Response B", "Response A"]},
+            {"ranking": "no ranking", "parsed_ranking": []},
+        ]
+
+        aggregate = council.calculate_aggregate_rankings(
+            stage2, {"Response A": "model-a", "Response B": "model-b"}
+        )
+
+        assert [entry["model"] for entry in aggregate] == ["model-b", "model-a"]
+
 
 @pytest.mark.asyncio
 async def test_stream_stage2_uses_shared_evaluator_semantics(monkeypatch):
@@ -664,6 +682,71 @@ async def test_chairman_timeout_returns_error_synthesis(monkeypatch):
     assert result["response"] == "Error: Unable to generate final synthesis."
 
 
+@pytest.mark.asyncio
+async def test_quorum_cancels_stragglers_after_soft_deadline(monkeypatch):
+    import asyncio
+
+    from backend.council import query_models_parallel
+
+    async def fake_query(model_id, *args, **kwargs):
+        if model_id == "slow":
+            await asyncio.sleep(10)
+        return {"content": model_id}
+
+    monkeypatch.setattr("backend.council.query_single_model", fake_query)
+
+    results = await asyncio.wait_for(
+        query_models_parallel(
+            ["fast-a", "slow", "fast-b"],
+            [{"role": "user", "content": "q"}],
+            quorum=2,
+            soft_deadline=0.01,
+        ),
+        timeout=1,
+    )
+
+    assert results == {"fast-a": {"content": "fast-a"}, "slow": None, "fast-b": {"content": "fast-b"}}
+
+
+@pytest.mark.asyncio
+async def test_without_quorum_every_model_is_awaited(monkeypatch):
+    import asyncio
+
+    from backend.council import query_models_parallel
+
+    async def fake_query(model_id, *args, **kwargs):
+        await asyncio.sleep(0.05 if model_id == "slow" else 0)
+        return {"content": model_id}
+
+    monkeypatch.setattr("backend.council.query_single_model", fake_query)
+
+    results = await query_models_parallel(["fast", "slow"], [{"role": "user", "content": "q"}])
+
+    assert results == {"fast": {"content": "fast"}, "slow": {"content": "slow"}}
+
+
+@pytest.mark.asyncio
+async def test_identical_stage1_answers_skip_peer_ranking():
+    from backend.council import run_full_council
+
+    stages = []
+
+    async def executor(stage, operation):
+        stages.append(stage)
+        return {"content": "Hello!", "provider": "test"}
+
+    stage1, stage2, stage3, metadata = await run_full_council(
+        "hello", compact=True, operation_executor=executor
+    )
+
+    assert "stage2" not in stages
+    assert stages.count("stage3") == 1
+    assert stage2 == []
+    assert metadata["stage2_skipped"] is True
+    assert metadata["final_only"] is False
+    assert stage3["response"] == "Hello!"
+
+
 def test_stage1_cache_eviction_is_bounded(monkeypatch):
     from backend import council
 
@@ -778,3 +861,31 @@ class TestTruncateForPrompt:
         result = _truncate_for_prompt(text, max_chars=1000)
         # Should not have unclosed code blocks
         assert result.count("```") % 2 == 0 or "```" not in result
+
+
+@pytest.mark.asyncio
+async def test_short_single_line_query_is_used_as_title_without_llm_call(monkeypatch):
+    from backend import council
+
+    async def fail_query(*args, **kwargs):
+        raise AssertionError("short titles must not call a model")
+
+    monkeypatch.setattr(council, "query_single_model", fail_query)
+
+    assert await council.generate_conversation_title("  What is CRDT merge order?  ") == (
+        "What is CRDT merge order"
+    )
+
+
+@pytest.mark.asyncio
+async def test_long_or_multiline_query_still_generates_title(monkeypatch):
+    from backend import council
+
+    async def fake_query(model_id, messages, max_tokens=None, **kwargs):
+        return {"content": '"Distributed Merge Ordering"'}
+
+    monkeypatch.setattr(council, "query_single_model", fake_query)
+
+    assert await council.generate_conversation_title("Line one\nline two") == (
+        "Distributed Merge Ordering"
+    )
@@ -1,9 +1,13 @@
 """Tests for Fireworks request construction and response parsing."""
 
+import asyncio
 import json
+import logging
 
+import httpx
 import pytest
 
+from backend import fireworks_client
 from backend.fireworks_client import get_fireworks_model_id, query_fireworks_model
 
 
@@ -14,8 +18,9 @@ class FakeResponse:
     def raise_for_status(self):
         return None
 
-    def json(self):
-        return self.payload
+    @property
+    def content(self):
+        return json.dumps(self.payload).encode()
 
 
 def test_kimi_k2_7_code_maps_to_fireworks_account_slug():
@@ -28,18 +33,9 @@ def test_kimi_k2_7_code_maps_to_fireworks_account_slug():
 async def test_non_streaming_payload_includes_reasoning_effort_when_passed(monkeypatch):
     calls = []
 
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, headers, json):
-            calls.append({"url": url, "headers": headers, "json": json, "timeout": self.timeout})
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
+            calls.append({"url": url, "headers": headers, "json": json.loads(content), "timeout": timeout})
             return FakeResponse(
                 {
                     "choices": [{"message": {"content": "visible answer"}}],
@@ -48,7 +44,7 @@ async def test_non_streaming_payload_includes_reasoning_effort_when_passed(monke
             )
 
     monkeypatch.setattr("backend.fireworks_client.FIREWORKS_API_KEY", "test-key")
-    monkeypatch.setattr("backend.fireworks_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.fireworks_client.get_client", lambda name: FakeClient())
 
     result = await query_fireworks_model(
         "fireworks/glm-5.2",
@@ -85,19 +81,10 @@ async def test_large_request_streams_without_capping_max_tokens(monkeypatch):
         async def __aexit__(self, exc_type, exc, traceback):
             return False
 
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        def stream(self, method, url, headers, json):
+    class FakeClient:
+        def stream(self, method, url, headers, content, timeout):
             stream_calls.append(
-                {"method": method, "url": url, "headers": headers, "json": json, "timeout": self.timeout}
+                {"method": method, "url": url, "headers": headers, "json": json.loads(content), "timeout": timeout}
             )
             return FakeStreamContext()
 
@@ -105,7 +92,7 @@ async def test_large_request_streams_without_capping_max_tokens(monkeypatch):
             raise AssertionError("large Fireworks requests must use streaming")
 
     monkeypatch.setattr("backend.fireworks_client.FIREWORKS_API_KEY", "test-key")
-    monkeypatch.setattr("backend.fireworks_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.fireworks_client.get_client", lambda name: FakeClient())
 
     result = await query_fireworks_model(
         "fireworks/glm-5.2",
@@ -143,21 +130,12 @@ async def test_streaming_response_aggregates_reasoning_and_visible_content(monke
         async def __aexit__(self, exc_type, exc, traceback):
             return False
 
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        def stream(self, method, url, headers, json):
+    class FakeClient:
+        def stream(self, method, url, headers, content, timeout):
             return FakeStreamContext()
 
     monkeypatch.setattr("backend.fireworks_client.FIREWORKS_API_KEY", "test-key")
-    monkeypatch.setattr("backend.fireworks_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.fireworks_client.get_client", lambda name: FakeClient())
 
     result = await query_fireworks_model(
         "fireworks/glm-5.2",
@@ -174,17 +152,8 @@ async def test_streaming_response_aggregates_reasoning_and_visible_content(monke
 
 @pytest.mark.asyncio
 async def test_sparse_non_streaming_response_merges_reasoning_content(monkeypatch):
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, headers, json):
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
             return FakeResponse(
                 {
                     "choices": [
@@ -200,7 +169,7 @@ async def test_sparse_non_streaming_response_merges_reasoning_content(monkeypatc
             )
 
     monkeypatch.setattr("backend.fireworks_client.FIREWORKS_API_KEY", "test-key")
-    monkeypatch.setattr("backend.fireworks_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.fireworks_client.get_client", lambda name: FakeClient())
 
     result = await query_fireworks_model(
         "fireworks/glm-5.2",
@@ -212,3 +181,115 @@ async def test_sparse_non_streaming_response_merges_reasoning_content(monkeypatc
     assert "short" in result["content"]
     assert "important reasoning answer" in result["content"]
     assert result["provider"] == "fireworks"
+
+
+@pytest.mark.asyncio
+async def test_parallel_queries_respect_process_concurrency_cap(monkeypatch):
+    in_flight = peak = 0
+
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FakeResponse({"choices": [{"message": {"content": "x" * 60}}]})
+
+    monkeypatch.setattr(fireworks_client, "FIREWORKS_API_KEY", "test-key")
+    monkeypatch.setattr(fireworks_client, "get_client", lambda name: FakeClient())
+    monkeypatch.setattr(fireworks_client, "FIREWORKS_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(fireworks_client, "_fireworks_sem", None)
+
+    results = await fireworks_client.query_fireworks_models_parallel(
+        [f"fireworks/model-{i}" for i in range(6)],
+        [{"role": "user", "content": "test"}],
+        max_tokens=1024,
+    )
+
+    assert len(results) == 6 and all(results.values())
+    assert peak == 2
+
+
+def test_concurrency_cap_survives_successive_event_loops(monkeypatch):
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
+            await asyncio.sleep(0)
+            return FakeResponse({"choices": [{"message": {"content": "x" * 60}}]})
+
+    monkeypatch.setattr(fireworks_client, "FIREWORKS_API_KEY", "test-key")
+    monkeypatch.setattr(fireworks_client, "get_client", lambda name: FakeClient())
+    monkeypatch.setattr(fireworks_client, "FIREWORKS_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(fireworks_client, "_fireworks_sem", None)
+
+    def run_contended():
+        return asyncio.run(fireworks_client.query_fireworks_models_parallel(
+            ["fireworks/a", "fireworks/b", "fireworks/c"],
+            [{"role": "user", "content": "test"}],
+            max_tokens=1024,
+        ))
+
+    assert all(run_contended().values())
+    assert all(run_contended().values())
+
+
+@pytest.mark.asyncio
+async def test_on_delta_streams_small_requests_and_forwards_visible_content(monkeypatch):
+    class FakeStreamResponse:
+        def raise_for_status(self):
+            return None
+
+        async def aiter_lines(self):
+            yield 'data: {"choices":[{"delta":{"reasoning_content":"hmm"}}]}'
+            yield 'data: {"choices":[{"delta":{"content":"a"}}]}'
+            yield 'data: {"choices":[{"delta":{"content":"b"}}]}'
+            yield "data: [DONE]"
+
+    class FakeStreamContext:
+        async def __aenter__(self):
+            return FakeStreamResponse()
+
+        async def __aexit__(self, exc_type, exc, traceback):
+            return False
+
+    class FakeClient:
+        def stream(self, method, url, headers, content, timeout):
+            assert json.loads(content)["stream"] is True
+            return FakeStreamContext()
+
+    monkeypatch.setattr(fireworks_client, "FIREWORKS_API_KEY", "test-key")
+    monkeypatch.setattr(fireworks_client, "get_client", lambda name: FakeClient())
+    deltas = []
+
+    await query_fireworks_model(
+        "fireworks/glm-5.2",
+        [{"role": "user", "content": "test"}],
+        max_tokens=1024,
+        on_delta=deltas.append,
+    )
+
+    assert deltas == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_http_error_returns_none_without_reading_body(monkeypatch, caplog):
+    async def handler(request):
+        async def body():
+            yield b"upstream exploded"
+
+        return httpx.Response(500, content=body())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(fireworks_client, "FIREWORKS_API_KEY", "test-key")
+    monkeypatch.setattr(fireworks_client, "get_client", lambda name: client)
+
+    with caplog.at_level(logging.DEBUG, logger="llm-council.fireworks"):
+        result = await query_fireworks_model(
+            "fireworks/kimi-k2.7-code",
+            [{"role": "user", "content": "hi"}],
+            on_delta=lambda delta: None,
+        )
+
+    assert result is None
+    assert "500" in caplog.text
+    await client.aclose()
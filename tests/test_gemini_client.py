@@ -0,0 +1,133 @@
+"""Tests for Gemini request construction and response parsing."""
+
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend import gemini_client, http_clients
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    @property
+    def content(self):
+        return json.dumps(self.payload).encode()
+
+
+class FakeClient:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+
+    async def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse(self.payload)
+
+
+@pytest.mark.asyncio
+async def test_query_uses_shared_client_and_maps_messages(monkeypatch):
+    client = FakeClient({
+        "candidates": [{"content": {"parts": [{"text": "Hi "}, {"text": "there"}]}}],
+        "usageMetadata": {"promptTokenCount": 4, "candidatesTokenCount": 2, "totalTokenCount": 6},
+    })
+    monkeypatch.setattr(gemini_client, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini_client, "get_client", lambda name: client)
+
+    result = await gemini_client.query_gemini_model(
+        "google/gemini-3.1-pro-preview",
+        [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "hey"},
+        ],
+        max_tokens=100,
+        timeout=5.0,
+    )
+
+    assert result == {
+        "content": "Hi there",
+        "usage": {"prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6},
+        "model": "google/gemini-3.1-pro-preview",
+        "provider": "gemini",
+    }
+    url, kwargs = client.calls[0]
+    assert url.endswith("/models/gemini-3.1-pro:generateContent")
+    assert kwargs["timeout"].read == 5.0
+    assert kwargs["timeout"].connect == http_clients.CONNECT_TIMEOUT_SECONDS
+    body = json.loads(kwargs["content"])
+    assert body["contents"] == [
+        {"role": "user", "parts": [{"text": "hello"}]},
+        {"role": "model", "parts": [{"text": "hey"}]},
+    ]
+    assert body["systemInstruction"] == {"parts": [{"text": "be brief"}]}
+
+
+@pytest.mark.asyncio
+async def test_no_candidates_returns_none(monkeypatch):
+    monkeypatch.setattr(gemini_client, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini_client, "get_client", lambda name: FakeClient({"candidates": []}))
+
+    result = await gemini_client.query_gemini_model(
+        "google/gemini-3.1-pro-preview", [{"role": "user", "content": "hello"}]
+    )
+
+    assert result is None
+
+
+def test_split_messages_keeps_first_system_prompt():
+    contents, system_text = gemini_client._split_messages([
+        {"role": "system", "content": "first"},
+        {"role": "user", "content": "q"},
+        {"role": "system", "content": "evidence"},
+    ])
+
+    assert system_text == "first"
+    assert contents == [{"role": "user", "parts": [{"text": "q"}]}]
+
+
+@pytest.mark.asyncio
+async def test_on_delta_uses_sse_endpoint_and_assembles_stream(monkeypatch):
+    chunks = [
+        {"candidates": [{"content": {"parts": [{"text": "Hi "}]}}]},
+        {
+            "candidates": [{"content": {"parts": [{"text": "there"}]}}],
+            "usageMetadata": {"promptTokenCount": 4, "candidatesTokenCount": 2, "totalTokenCount": 6},
+        },
+    ]
+    calls = []
+
+    class FakeStreamResponse:
+        def raise_for_status(self):
+            return None
+
+        async def aiter_lines(self):
+            for chunk in chunks:
+                yield "data: " + json.dumps(chunk)
+                yield ""
+
+    class FakeStreamClient:
+        @asynccontextmanager
+        async def stream(self, method, url, **kwargs):
+            calls.append(url)
+            yield FakeStreamResponse()
+
+    monkeypatch.setattr(gemini_client, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini_client, "get_client", lambda name: FakeStreamClient())
+    deltas = []
+
+    result = await gemini_client.query_gemini_model(
+        "google/gemini-3.1-pro-preview",
+        [{"role": "user", "content": "hello"}],
+        on_delta=deltas.append,
+    )
+
+    assert calls[0].endswith("/models/gemini-3.1-pro:streamGenerateContent?alt=sse")
+    assert deltas == ["Hi ", "there"]
+    assert result["content"] == "Hi there"
+    assert result["usage"] == {"prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6}
@@ -0,0 +1,65 @@
+"""Tests for the shared pooled httpx clients."""
+
+import importlib.util
+
+from backend import http_clients
+
+
+async def test_get_client_reuses_client_per_pool_name():
+    first = http_clients.get_client("test-pool")
+    assert http_clients.get_client("test-pool") is first
+    assert http_clients.get_client("other-pool") is not first
+
+    await http_clients.aclose_clients()
+
+    assert first.is_closed
+    assert http_clients.get_client("test-pool") is not first
+    await http_clients.aclose_clients()
+
+
+async def test_get_client_replaces_closed_client():
+    client = http_clients.get_client("test-pool")
+    await client.aclose()
+
+    assert http_clients.get_client("test-pool") is not client
+    await http_clients.aclose_clients()
+
+
+async def test_pooled_clients_request_compressed_responses():
+    encodings = http_clients.get_client("test-pool").headers["accept-encoding"]
+
+    assert "gzip" in encodings
+    if importlib.util.find_spec("brotli") is not None:
+        assert "br" in encodings
+    await http_clients.aclose_clients()
+
+
+def test_phase_timeout_bounds_connect_separately_from_read():
+    timeout = http_clients.phase_timeout(900.0)
+
+    assert timeout.read == 900.0
+    assert timeout.connect == http_clients.CONNECT_TIMEOUT_SECONDS
+    assert timeout.pool == http_clients.POOL_TIMEOUT_SECONDS
+    assert http_clients.phase_timeout(900.0) is timeout
+
+
+async def test_warm_clients_opens_pooled_connection_and_tolerates_failures(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def __init__(self, name):
+            self.name = name
+
+        async def head(self, url, timeout):
+            calls.append((self.name, url, timeout))
+            if self.name == "down":
+                raise http_clients.httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(http_clients, "get_client", FakeClient)
+
+    await http_clients.warm_clients({"up": "https://up.example/", "down": "https://down.example/"})
+
+    assert calls == [
+        ("up", "https://up.example/", http_clients.WARMUP_TIMEOUT_SECONDS),
+        ("down", "https://down.example/", http_clients.WARMUP_TIMEOUT_SECONDS),
+    ]
@@ -0,0 +1,59 @@
+"""Tests for the JSON codec helpers and their stdlib fallback."""
+
+import json
+
+import pytest
+
+from backend import json_codec
+
+PAYLOAD = {"model": "zai-glm-4.7", "messages": [{"role": "user", "content": "héllo"}], "n": 1}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip_is_compact_utf8(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+
+    encoded = json_codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert b": " not in encoded and b", " not in encoded
+    assert "héllo".encode() in encoded
+    assert json_codec.loads(encoded) == PAYLOAD
+    assert json_codec.loads(encoded.decode()) == PAYLOAD
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_non_string_keys_are_coerced_like_stdlib(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+
+    assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_indented_output_matches_stdlib_layout(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+
+    encoded = json_codec.dumps(PAYLOAD, indent=True)
+
+    assert encoded.decode() == json.dumps(PAYLOAD, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_sorted_output_is_canonical(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+
+    assert json_codec.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == (
+        b'{"a":{"c":3,"d":2},"b":1}'
+    )
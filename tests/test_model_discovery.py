@@ -0,0 +1,107 @@
+"""Tests for model discovery fetching and caching."""
+
+import asyncio
+
+from backend import model_discovery
+
+
+async def test_cache_round_trips_through_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_discovery, "CACHE_FILE", tmp_path / "models.json")
+    discovery = model_discovery.ModelDiscovery()
+    discovery._cache["openrouter"] = {
+        "models": [{"id": "a/b", "pricing": {"prompt": 0.000001}}],
+        "last_fetch": 123.5,
+    }
+
+    await discovery._save_cache()
+
+    assert model_discovery.ModelDiscovery()._cache == discovery._cache
+
+
+def test_corrupt_cache_file_falls_back_to_empty(tmp_path, monkeypatch):
+    cache_file = tmp_path / "models.json"
+    cache_file.write_bytes(b"{not json")
+    monkeypatch.setattr(model_discovery, "CACHE_FILE", cache_file)
+
+    assert model_discovery.ModelDiscovery()._cache == {"openrouter": {}, "cerebras": {}}
+
+
+async def test_all_models_fetches_providers_concurrently(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_discovery, "CACHE_FILE", tmp_path / "models.json")
+    discovery = model_discovery.ModelDiscovery()
+    both_started = asyncio.Event()
+    started = []
+
+    def fetcher(provider):
+        async def fetch(force_refresh=False):
+            started.append(provider)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return [{"id": f"{provider}/model"}]
+
+        return fetch
+
+    monkeypatch.setattr(discovery, "fetch_openrouter_models", fetcher("openrouter"))
+    monkeypatch.setattr(discovery, "fetch_cerebras_models", fetcher("cerebras"))
+
+    models = await discovery.get_all_models()
+
+    assert [model["id"] for model in models] == ["openrouter/model", "cerebras/model"]
+
+
+async def test_concurrent_stale_reads_refresh_provider_once(tmp_path, monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        content = b'{"data": [{"id": "a/b"}]}'
+
+        def raise_for_status(self):
+            return None
+
+    class FakeClient:
+        async def get(self, url, headers, timeout):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return FakeResponse()
+
+    monkeypatch.setattr(model_discovery, "CACHE_FILE", tmp_path / "models.json")
+    monkeypatch.setattr(model_discovery, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(model_discovery, "get_client", lambda name: FakeClient())
+    discovery = model_discovery.ModelDiscovery()
+
+    results = await asyncio.gather(*(discovery.fetch_openrouter_models() for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(models == [{"id": "a/b", "provider": "openrouter"}] for models in results)
+
+
+async def test_openrouter_models_are_projected_before_caching(tmp_path, monkeypatch):
+    class FakeResponse:
+        content = (
+            b'{"data": [{"id": "a/b", "name": "B", "context_length": 8192,'
+            b' "pricing": {"prompt": "0.1"}, "description": "long text",'
+            b' "architecture": {"modality": "text->text"}}]}'
+        )
+
+        def raise_for_status(self):
+            return None
+
+    class FakeClient:
+        async def get(self, url, headers, timeout):
+            return FakeResponse()
+
+    monkeypatch.setattr(model_discovery, "CACHE_FILE", tmp_path / "models.json")
+    monkeypatch.setattr(model_discovery, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(model_discovery, "get_client", lambda name: FakeClient())
+
+    models = await model_discovery.ModelDiscovery().fetch_openrouter_models()
+
+    assert models == [{
+        "id": "a/b",
+        "name": "B",
+        "pricing": {"prompt": "0.1"},
+        "context_length": 8192,
+        "provider": "openrouter",
+    }]
+    assert b"long text" not in (tmp_path / "models.json").read_bytes()
@@ -530,5 +530,58 @@ async def test_invalid_xai_usage_is_bounded_terminal_failure_without_fallback():
     assert result["attempts"][0]["reason"] == "invalid_usage"
 
 
+def test_dispatchers_share_parsed_registry_until_file_changes(monkeypatch):
+    from backend import model_registry
+
+    first = ModelDispatcher().registry
+    assert ModelDispatcher().registry is first
+
+    monkeypatch.setattr(model_registry, "_registry_cache", (-1, first))
+    assert ModelDispatcher().registry is not first
+
+
+@pytest.mark.asyncio
+async def test_open_provider_circuit_fails_over_without_calling_provider():
+    from backend.resilience import breaker_for
+
+    breaker = breaker_for("xai:x-ai/grok-4.5")
+    for _ in range(breaker.min_calls):
+        breaker.record(False)
+    xai_calls = []
+
+    async def xai(*_args, **_kwargs):
+        xai_calls.append(1)
+        return {"content": "unreachable"}
+
+    async def openrouter(*_args, **_kwargs):
+        return {"content": "fallback answer"}
+
+    dispatcher = ModelDispatcher(adapters={"xai": xai, "openrouter": openrouter})
+    result = await dispatcher.query(DispatchRequest("x-ai/grok-4.5", MESSAGES))
+
+    assert xai_calls == []
+    assert result["content"] == "fallback answer"
+    assert result["attempts"][0] == {
+        "route_id": "xai:x-ai/grok-4.5", "attempt": 1, "status": "failed", "reason": "circuit_open",
+    }
+    assert result["primary_failure_reason"] == "circuit_open"
+
+
 async def _done():
     return None
+
+
+@pytest.mark.asyncio
+async def test_empty_responses_do_not_open_circuits_for_other_models():
+    from backend.resilience import breaker_for
+
+    async def openrouter(model_id, *_args, **_kwargs):
+        return {"content": "" if model_id == "openai/gpt-5.5" else "answer"}
+
+    dispatcher = ModelDispatcher(adapters={"openrouter": openrouter})
+    for _ in range(breaker_for("openrouter:openai/gpt-5.5").min_calls + 1):
+        await dispatcher.query(DispatchRequest("openai/gpt-5.5", MESSAGES))
+
+    assert breaker_for("openrouter:openai/gpt-5.5").allow()
+    result = await dispatcher.query(DispatchRequest("anthropic/claude-fable-5", MESSAGES))
+    assert result["content"] == "answer"
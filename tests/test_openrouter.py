@@ -1,8 +1,10 @@
 """Tests for OpenRouter request construction."""
 
+import json
+
 import pytest
 
-from backend.openrouter import build_chat_payload, query_model
+from backend.openrouter import build_chat_payload, query_model, query_models_parallel
 
 
 def test_benchmark_no_fallback_payload_sets_allow_fallbacks_false():
@@ -41,8 +43,9 @@ async def test_query_model_normalizes_null_content_to_empty_string(monkeypatch):
         def raise_for_status(self):
             return None
 
-        def json(self):
-            return {
+        @property
+        def content(self):
+            return json.dumps({
                 "choices": [
                     {
                         "finish_reason": "length",
@@ -60,23 +63,14 @@ async def test_query_model_normalizes_null_content_to_empty_string(monkeypatch):
                     "total_tokens": 1,
                     "completion_tokens_details": {"reasoning_tokens": 16},
                 },
-            }
-
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
+            }).encode()
 
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, headers, json):
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
             return FakeResponse()
 
     monkeypatch.setattr("backend.openrouter.OPENROUTER_API_KEY", "test-key")
-    monkeypatch.setattr("backend.openrouter.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.openrouter.get_client", lambda name: FakeClient())
 
     result = await query_model(
         "openai/gpt-5.5",
@@ -93,3 +87,19 @@ async def test_query_model_normalizes_null_content_to_empty_string(monkeypatch):
     assert result["native_finish_reason"] == "max_output_tokens"
     assert result["reasoning"] == "hidden reasoning"
     assert result["reasoning_details"] == [{"type": "summary", "text": "detail"}]
+
+
+@pytest.mark.asyncio
+async def test_query_models_parallel_isolates_a_failing_model(monkeypatch):
+    async def fake_query_model(model, messages, max_tokens, temperature):
+        if model == "broken/model":
+            raise RuntimeError("provider exploded")
+        return {"content": model}
+
+    monkeypatch.setattr("backend.openrouter.query_model", fake_query_model)
+
+    results = await query_models_parallel(
+        ["good/model", "broken/model"], [{"role": "user", "content": "test"}]
+    )
+
+    assert results == {"good/model": {"content": "good/model"}, "broken/model": None}
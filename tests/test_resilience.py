@@ -0,0 +1,81 @@
+"""Tests for the per-route circuit breaker."""
+
+from backend.resilience import CircuitBreaker, breaker_for, reset_breakers
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_failure_ratio_reached_with_enough_calls():
+    breaker = CircuitBreaker("p", window=10, min_calls=4, failure_ratio=0.5, clock=FakeClock())
+
+    breaker.record(True)
+    breaker.record(False)
+    breaker.record(True)
+    assert breaker.allow()
+
+    breaker.record(False)
+    assert not breaker.allow()
+
+
+def test_half_open_probe_decides_close_or_reopen():
+    clock = FakeClock()
+    breaker = CircuitBreaker("p", min_calls=2, failure_ratio=0.6, open_seconds=30, clock=clock)
+    breaker.record(False)
+    breaker.record(False)
+    assert not breaker.allow()
+
+    clock.now = 31
+    assert breaker.allow()
+    breaker.record(False)
+    assert not breaker.allow()
+
+    clock.now = 62
+    breaker.record(True)
+    breaker.record(False)
+    breaker.record(True)
+    breaker.record(True)
+    assert breaker.allow()
+
+
+def test_results_recorded_while_open_are_ignored():
+    clock = FakeClock()
+    breaker = CircuitBreaker("p", min_calls=2, open_seconds=30, clock=clock)
+    breaker.record(False)
+    breaker.record(False)
+
+    breaker.record(True)
+    clock.now = 31
+    breaker.record(False)
+
+    assert not breaker.allow()
+
+
+def test_failures_older_than_the_time_window_stop_counting():
+    clock = FakeClock()
+    breaker = CircuitBreaker("p", min_calls=2, failure_ratio=0.6, window_seconds=60, clock=clock)
+    breaker.record(False)
+
+    clock.now = 120
+    breaker.record(True)
+    breaker.record(False)
+    assert breaker.allow()
+
+    breaker.record(False)
+    assert not breaker.allow()
+
+
+def test_breakers_are_shared_per_route_until_reset():
+    route_id = "fireworks:z-ai/glm-5.2"
+    assert breaker_for(route_id) is breaker_for(route_id)
+    assert breaker_for(route_id) is not breaker_for("fireworks:moonshotai/kimi-k2.7-code")
+    first = breaker_for(route_id)
+
+    reset_breakers()
+
+    assert breaker_for(route_id) is not first
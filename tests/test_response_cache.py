@@ -0,0 +1,53 @@
+"""Tests for the disk-backed Stage 1 response cache."""
+
+import os
+import time
+
+from backend import config, council, response_cache
+
+
+def test_round_trip_and_expiry(monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_DIR", tmp_path)
+
+    response_cache.store("abc", {"content": "hello", "usage": {"total_tokens": 3}})
+    assert response_cache.load("abc", ttl_seconds=60) == {
+        "content": "hello",
+        "usage": {"total_tokens": 3},
+    }
+
+    stale = time.time() - 120
+    os.utime(tmp_path / "abc.json", (stale, stale))
+    assert response_cache.load("abc", ttl_seconds=60) is None
+    assert not (tmp_path / "abc.json").exists()
+
+
+def test_corrupt_entry_is_a_miss(monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_DIR", tmp_path)
+    (tmp_path / "bad.json").write_text("{not json")
+
+    assert response_cache.load("bad", ttl_seconds=60) is None
+
+
+def test_stage1_cache_survives_process_restart(monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(config, "PERSIST_RESPONSE_CACHE", True)
+    council._stage1_cache.clear()
+
+    council._cache_response("model-a", "prompt", {"content": "answer"})
+    council._cache_response("model-b", "prompt", {})
+    council._stage1_cache.clear()
+
+    assert council._get_cached_response("model-a", "prompt") == {"content": "answer"}
+    assert council._get_cached_response("model-b", "prompt") is None
+    council._stage1_cache.clear()
+
+
+def test_disk_cache_is_unused_unless_enabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(config, "PERSIST_RESPONSE_CACHE", False)
+    council._stage1_cache.clear()
+
+    council._cache_response("model-a", "prompt", {"content": "answer"})
+
+    assert list(tmp_path.iterdir()) == []
+    council._stage1_cache.clear()
@@ -1,5 +1,6 @@
 """Focused runtime contracts for immutable execution plans."""
 
+import asyncio
 from dataclasses import replace
 from unittest.mock import AsyncMock
 
@@ -59,7 +60,7 @@ async def test_stream_without_explicit_plan_executes_captured_operations(monkeyp
     })
     dispatcher = ModelDispatcher()
     dispatcher.execute = execute
-    monkeypatch.setattr(council, "load_registry", lambda: load_registry())
+    monkeypatch.setattr(council, "current_registry", lambda: load_registry())
     monkeypatch.setattr(council, "build_execution_plan", lambda *_args, **_kwargs: plan)
     monkeypatch.setattr(council, "_dispatcher", lambda: dispatcher)
     rank = AsyncMock(return_value=([], {}))
@@ -413,3 +414,127 @@ def test_planner_curation_is_score_first_deterministic_and_provider_diverse():
     providers = {plan.stage1[[op.logical_id for op in plan.stage1].index(item["model"])].route.provider for item in selected}
     assert len(providers) > 1
     assert selected == curate_responses(plan, list(reversed(responses)), rankings)
+
+
+@pytest.mark.asyncio
+async def test_stage1_iter_yields_seats_in_completion_order():
+    plan = _plan(compact=True, mode="stream")
+    delays = {op.logical_id: 0.01 * (len(plan.stage1) - index) for index, op in enumerate(plan.stage1)}
+
+    async def execute(stage, operation):
+        await asyncio.sleep(delays[operation.logical_id])
+        return {"content": operation.logical_id, "provider": operation.route.provider}
+
+    streamed = [
+        event["data"]["model"]
+        async for event in council.stage1_iter_events(
+            "planned question", plan, operation_executor=execute
+        )
+    ]
+
+    seats = [op.logical_id for op in plan.stage1]
+    assert streamed == seats[::-1]
+    ordered = council.order_stage1_results(
+        [{"model": model} for model in streamed], plan
+    )
+    assert [result["model"] for result in ordered] == seats
+
+
+@pytest.mark.asyncio
+async def test_stage1_iter_forwards_tokens_before_each_seat_result(monkeypatch):
+    plan = _plan(compact=True, mode="stream")
+
+    class StreamingDispatcher:
+        async def execute(self, operation, *, on_delta=None):
+            for delta in ("Hello", " world"):
+                on_delta(delta)
+                await asyncio.sleep(0)
+            return {"content": "Hello world", "provider": operation.route.provider}
+
+    monkeypatch.setattr(council, "_dispatcher", StreamingDispatcher)
+    monkeypatch.setattr(council, "_stage1_cache", {})
+
+    events = [event async for event in council.stage1_iter_events("token question", plan)]
+
+    for operation in plan.stage1:
+        seat_events = [
+            event for event in events
+            if event.get("model") == operation.logical_id
+            or event.get("data", {}).get("model") == operation.logical_id
+        ]
+        assert [event["type"] for event in seat_events] == [
+            "stage1_token", "stage1_token", "stage1_partial"
+        ]
+        assert "".join(event["delta"] for event in seat_events[:2]) == seat_events[2]["data"]["response"]
+
+
+def _quorum_executor(plan, slow):
+    async def execute(stage, operation):
+        if operation.logical_id == slow:
+            await asyncio.sleep(10)
+        return {"content": operation.logical_id, "provider": operation.route.provider}
+
+    return execute
+
+
+@pytest.mark.asyncio
+async def test_planned_stage1_quorum_projects_cut_off_seats():
+    plan = _plan(compact=True)
+    slow = plan.stage1[-1].logical_id
+
+    results = await asyncio.wait_for(
+        council.stage1_collect_responses(
+            "planned question",
+            execution_plan=plan,
+            operation_executor=_quorum_executor(plan, slow),
+            quorum=len(plan.stage1) - 1,
+            soft_deadline=0.01,
+        ),
+        timeout=1,
+    )
+
+    assert [result["model"] for result in results] == [op.logical_id for op in plan.stage1]
+    cut = results[-1]
+    assert cut["response"] == ""
+    assert "quorum_cutoff" in str(cut)
+    assert all(result["response"] for result in results[:-1])
+
+
+@pytest.mark.asyncio
+async def test_streamed_stage1_quorum_reports_cut_off_seats():
+    plan = _plan(compact=True, mode="stream")
+    slow = plan.stage1[0].logical_id
+
+    async def collect():
+        return [
+            event["data"]
+            async for event in council.stage1_iter_events(
+                "planned question",
+                plan,
+                operation_executor=_quorum_executor(plan, slow),
+                quorum=len(plan.stage1) - 1,
+                soft_deadline=0.01,
+            )
+        ]
+
+    partials = await asyncio.wait_for(collect(), timeout=1)
+
+    assert len(partials) == len(plan.stage1)
+    assert partials[-1]["model"] == slow and partials[-1]["response"] == ""
+    assert "quorum_cutoff" in str(partials[-1])
+
+
+@pytest.mark.asyncio
+async def test_run_full_council_applies_configured_stage1_quorum(monkeypatch):
+    plan = _plan(compact=True)
+    stage1 = [{"model": op.logical_id, "response": op.logical_id} for op in plan.stage1]
+    collect = AsyncMock(return_value=stage1)
+    monkeypatch.setattr(council, "stage1_collect_responses", collect)
+    monkeypatch.setattr(council, "stage2_collect_rankings", AsyncMock(return_value=([], {})))
+    monkeypatch.setattr(council, "stage3_synthesize_final", AsyncMock(return_value={"response": "done"}))
+    monkeypatch.setattr(council, "STAGE1_QUORUM", 3)
+    monkeypatch.setattr(council, "STAGE1_SOFT_DEADLINE", 45.0)
+
+    await council.run_full_council("planned question", execution_plan=plan)
+
+    assert collect.await_args.kwargs == {"quorum": 3, "soft_deadline": 45.0}
@@ -0,0 +1,95 @@
+"""Tests for the in-process ~/.bash_secrets parser."""
+
+from backend import secrets
+
+
+def _fail_if_spawned(*_args, **_kwargs):
+    raise AssertionError("bash must not be spawned to read ~/.bash_secrets")
+
+
+def test_parse_assignment_handles_export_quotes_and_comments():
+    assert secrets._parse_assignment("export GROK_API_KEY=abc") == ("GROK_API_KEY", "abc")
+    assert secrets._parse_assignment('FIREWORKS_API_KEY="fw key" # work') == (
+        "FIREWORKS_API_KEY",
+        "fw key",
+    )
+    assert secrets._parse_assignment("export GEMINI_API_KEY='lit$eral'") == (
+        "GEMINI_API_KEY",
+        "lit$eral",
+    )
+    assert secrets._parse_assignment("CEREBRAS_API_KEY=plain # note") == (
+        "CEREBRAS_API_KEY",
+        "plain",
+    )
+    assert secrets._parse_assignment("# export OPENROUTER_API_KEY=x") is None
+    assert secrets._parse_assignment("alias ll='ls -l'") is None
+
+
+def test_parse_assignment_flags_values_needing_shell_expansion():
+    assert secrets._parse_assignment('export GROK_API_KEY="$(pass show grok)"') == (
+        "GROK_API_KEY",
+        None,
+    )
+    assert secrets._parse_assignment("GROK_API_KEY=$OTHER_KEY") == ("GROK_API_KEY", None)
+
+
+def test_load_from_bash_secrets_keeps_known_literal_keys(tmp_path, monkeypatch):
+    (tmp_path / ".bash_secrets").write_text(
+        "#!/bin/bash\n"
+        "export OPENROUTER_API_KEY=or-key\n"
+        "export UNRELATED_TOKEN=ignored\n"
+        'export GROK_API_KEY="$(pass show grok)"\n'
+        "export FIREWORKS_API_KEY='fw-key'\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(secrets.Path, "home", lambda: tmp_path)
+    monkeypatch.delenv("SOURCE_BASH_SECRETS", raising=False)
+    monkeypatch.setattr(secrets.subprocess, "run", _fail_if_spawned)
+
+    assert secrets._load_from_bash_secrets() == {
+        "OPENROUTER_API_KEY": "or-key",
+        "FIREWORKS_API_KEY": "fw-key",
+    }
+
+
+def test_key_constants_load_secrets_on_first_access(monkeypatch):
+    loads = []
+
+    def fake_load():
+        loads.append(1)
+        return {"GOOGLE_AI_API_KEY": "google-key", "OPENROUTER_API_KEY": "or-key"}
+
+    monkeypatch.setattr(secrets, "_secrets", None)
+    monkeypatch.setattr(secrets, "_load_secrets", fake_load)
+    for name in ("GEMINI_API_KEY", "GROK_API_KEY"):
+        # setitem first so teardown also drops the value cached by __getattr__.
+        monkeypatch.setitem(vars(secrets), name, None)
+        monkeypatch.delitem(vars(secrets), name)
+
+    assert loads == []
+    assert secrets.GEMINI_API_KEY == "google-key"
+    assert secrets.GROK_API_KEY is None
+    assert secrets.get_secret("OPENROUTER_API_KEY") == "or-key"
+    assert loads == [1]
+
+
+def test_load_from_env_skips_unset_and_empty_keys(monkeypatch):
+    for key in secrets._API_KEY_NAMES:
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("GROK_API_KEY", "grok-key")
+    monkeypatch.setenv("FIREWORKS_API_KEY", "")
+
+    assert secrets._load_from_env() == {"GROK_API_KEY": "grok-key"}
+
+
+def test_bash_secrets_path_overrides_or_disables_the_file(tmp_path, monkeypatch):
+    custom = tmp_path / "council.env"
+    custom.write_text("export GROK_API_KEY=grok-key\n", encoding="utf-8")
+    monkeypatch.setattr(secrets.Path, "home", lambda: tmp_path / "no-home")
+    monkeypatch.delenv("SOURCE_BASH_SECRETS", raising=False)
+
+    monkeypatch.setenv("BASH_SECRETS_PATH", str(custom))
+    assert secrets._load_from_bash_secrets() == {"GROK_API_KEY": "grok-key"}
+
+    monkeypatch.setenv("BASH_SECRETS_PATH", "")
+    assert secrets._load_from_bash_secrets() == {}
@@ -1,9 +1,17 @@
 """Security tests for async council webhooks."""
 
+import asyncio
+import hashlib
+import hmac
 import json
+import os
+import threading
+import time
 
+import httpx
 import pytest
 
+from backend import webhooks
 from backend.webhooks import CouncilAsyncRequest, JobStatus, create_job, run_council_async
 
 
@@ -128,3 +136,257 @@ async def test_reloaded_secret_backed_failed_job_preserves_original_error(tmp_pa
 
     assert webhooks._jobs[job_id]["status"] == JobStatus.FAILED
     assert webhooks._jobs[job_id]["error"] == "model failed before webhook"
+
+
+@pytest.mark.asyncio
+async def test_job_worker_pool_bounds_concurrent_jobs(monkeypatch):
+    running = peak = 0
+    done = []
+
+    async def fake_run(job_id, handler):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        done.append(job_id)
+
+    monkeypatch.setattr(webhooks, "run_council_async", fake_run)
+    pool = webhooks.JobWorkerPool(handle_council_command=None, workers=2)
+    for index in range(5):
+        pool.submit(f"job-{index}")
+    assert pool.depth == 5
+
+    await asyncio.wait_for(pool._queue.join(), timeout=1)
+    await pool.aclose()
+
+    assert peak == 2
+    assert done == [f"job-{index}" for index in range(5)]
+
+
+async def test_send_webhook_retries_through_one_pooled_client(monkeypatch):
+    statuses = iter([503, 204])
+    clients = []
+
+    def handler(request):
+        return httpx.Response(next(statuses))
+
+    def pooled(name):
+        if not clients:
+            clients.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return clients[0]
+
+    async def no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr(webhooks, "_validate_webhook_url", lambda url: None)
+    monkeypatch.setattr(webhooks, "get_client", pooled)
+    monkeypatch.setattr(webhooks.asyncio, "sleep", no_sleep)
+
+    assert await webhooks.send_webhook("https://hooks.example.com/done", {"ok": True})
+    assert len(clients) == 1 and not clients[0].is_closed
+    await clients[0].aclose()
+
+
+async def test_send_webhook_signature_covers_the_sent_bytes(monkeypatch):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(webhooks, "_validate_webhook_url", lambda url: None)
+    monkeypatch.setattr(webhooks, "get_client", lambda name: client)
+
+    assert await webhooks.send_webhook(
+        "https://hooks.example.com/done", {"b": 1, "a": "é"}, secret="shh"
+    )
+
+    body = seen[0].content
+    expected = hmac.new(b"shh", body, hashlib.sha256).hexdigest()
+    assert seen[0].headers["X-Webhook-Signature"] == f"sha256={expected}"
+    assert json.loads(body) == {"a": "é", "b": 1}
+    assert "X-Webhook-Signature" not in webhooks._WEBHOOK_HEADERS
+    await client.aclose()
+
+
+def test_list_jobs_returns_newest_matching_jobs_first(monkeypatch):
+    def job(job_id, created_at, status):
+        return {
+            "job_id": job_id, "status": status, "query": "q", "webhook_url": "https://h",
+            "created_at": created_at, "started_at": None, "completed_at": None, "error": None,
+        }
+
+    monkeypatch.setattr(webhooks, "_jobs", {
+        "b": job("b", "2026-01-02T00:00:00Z", JobStatus.COMPLETED),
+        "c": job("c", "2026-01-03T00:00:00Z", JobStatus.PENDING),
+        "a": job("a", "2026-01-01T00:00:00Z", JobStatus.COMPLETED),
+        "d": job("d", "2026-01-04T00:00:00Z", JobStatus.COMPLETED),
+    })
+
+    assert [j.job_id for j in webhooks.list_jobs(limit=2)] == ["d", "c"]
+    assert [j.job_id for j in webhooks.list_jobs(status=JobStatus.COMPLETED)] == ["d", "b", "a"]
+
+
+def test_cleanup_old_jobs_uses_stored_timestamps_and_parses_legacy_jobs(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(webhooks, "_jobs", {
+        "fresh": {"created_at": "1970-01-01T00:00:00Z", "created_ts": now},
+        "stale": {"created_at": "2026-01-01T00:00:00Z", "created_ts": now - 90_000},
+        "legacy": {"created_at": "2000-01-01T00:00:00Z"},
+    })
+    monkeypatch.setattr(webhooks, "JOBS_DIR", tmp_path)
+    monkeypatch.setattr(webhooks, "_job_path", lambda job_id: str(tmp_path / f"{job_id}.json"))
+
+    assert webhooks.cleanup_old_jobs(max_age_hours=24) == 2
+    assert list(webhooks._jobs) == ["fresh"]
+
+
+def test_in_memory_jobs_evict_oldest_settled_first(monkeypatch):
+    monkeypatch.setattr(webhooks, "MAX_CACHED_JOBS", 3)
+    monkeypatch.setattr(webhooks, "_jobs", {
+        "running": {"status": JobStatus.RUNNING},
+        "delivering": {"status": JobStatus.COMPLETED},
+        "old-done": {"status": JobStatus.WEBHOOK_SENT},
+        "new-done": {"status": "webhook_failed"},
+        "pending": {"status": JobStatus.PENDING},
+    })
+
+    webhooks._evict_settled_jobs()
+
+    assert list(webhooks._jobs) == ["running", "delivering", "pending"]
+
+
+def test_cleanup_old_jobs_deletes_files_of_evicted_jobs(tmp_path, monkeypatch):
+    old_id = "12345678-1234-4234-9234-000000000001"
+    new_id = "12345678-1234-4234-9234-000000000002"
+    for job_id in (old_id, new_id):
+        (tmp_path / f"{job_id}.json").write_text("{}")
+    stale = time.time() - 90_000
+    os.utime(tmp_path / f"{old_id}.json", (stale, stale))
+    (tmp_path / "notes.txt").write_text("keep")
+    monkeypatch.setattr(webhooks, "JOBS_DIR", tmp_path)
+    monkeypatch.setattr(webhooks, "_jobs", {})
+
+    assert webhooks.cleanup_old_jobs(max_age_hours=24) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"{new_id}.json", "notes.txt"]
+
+
+@pytest.mark.parametrize(
+    ("responses", "delivered", "sleeps"),
+    [
+        ([httpx.Response(404)], False, []),
+        ([httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)], True, [7.0]),
+        ([httpx.Response(503, headers={"Retry-After": "86400"}), httpx.Response(200)], True, [60.0]),
+    ],
+)
+async def test_send_webhook_stops_on_permanent_errors_and_honours_retry_after(
+    monkeypatch, responses, delivered, sleeps
+):
+    pending = iter(responses)
+    attempts = []
+    slept = []
+
+    def handler(request):
+        attempts.append(request)
+        return next(pending)
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(webhooks, "_validate_webhook_url", lambda url: None)
+    monkeypatch.setattr(webhooks, "get_client", lambda name: client)
+    monkeypatch.setattr(webhooks.asyncio, "sleep", fake_sleep)
+
+    assert await webhooks.send_webhook("https://hooks.example.com/done", {}) is delivered
+    assert len(attempts) == len(responses)
+    assert slept == sleeps
+    await client.aclose()
+
+
+def test_retry_delay_jitters_exponential_backoff():
+    delays = {webhooks._retry_delay(2, None) for _ in range(20)}
+
+    assert all(2.0 <= delay <= 6.0 for delay in delays)
+    assert len(delays) > 1
+
+
+async def test_send_webhook_logs_one_aggregated_failure(monkeypatch, caplog):
+    statuses = iter([503, 502, 500])
+
+    def handler(request):
+        return httpx.Response(next(statuses))
+
+    async def no_sleep(_seconds):
+        return None
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(webhooks, "_validate_webhook_url", lambda url: None)
+    monkeypatch.setattr(webhooks, "get_client", lambda name: client)
+    monkeypatch.setattr(webhooks.asyncio, "sleep", no_sleep)
+
+    with caplog.at_level("WARNING", logger="llm-council.webhooks"):
+        assert not await webhooks.send_webhook("https://hooks.example.com/done?t=secret", {})
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "Webhook delivery to hooks.example.com failed after 3 attempt(s): "
+        "HTTP 503, HTTP 502, HTTP 500"
+    ]
+    await client.aclose()
+
+
+async def test_unsendable_webhook_job_records_final_state_in_one_write(tmp_path, monkeypatch):
+    job_id = "12345678-1234-4234-9234-123456789abe"
+    statuses = []
+    monkeypatch.setattr(webhooks, "JOBS_DIR", tmp_path)
+    monkeypatch.setattr(webhooks, "_save_job", lambda job: statuses.append(job["status"]))
+    monkeypatch.setattr(webhooks, "_jobs", {
+        job_id: {
+            "job_id": job_id, "status": JobStatus.PENDING, "query": "q",
+            "webhook_url": "https://example.com/webhook", "webhook_secret_configured": True,
+            "final_only": False, "models": None, "chairman": None, "include_details": True,
+            "created_at": "2026-07-04T00:00:00Z",
+        }
+    })
+
+    async def fake_handler(**_kwargs):
+        return {"stage1": {"model": "ok"}}
+
+    await run_council_async(job_id, fake_handler)
+
+    assert statuses == [JobStatus.RUNNING, JobStatus.WEBHOOK_FAILED]
+    assert webhooks._jobs[job_id]["result"] == {"stage1": {"model": "ok"}}
+    assert webhooks._jobs[job_id]["completed_at"]
+
+
+async def test_send_webhook_resolves_target_off_the_event_loop(monkeypatch):
+    loop_thread = threading.get_ident()
+    validated_on = []
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+    monkeypatch.setattr(
+        webhooks, "_validate_webhook_url", lambda url: validated_on.append(threading.get_ident())
+    )
+    monkeypatch.setattr(webhooks, "get_client", lambda name: client)
+
+    assert await webhooks.send_webhook("https://hooks.example.com/done", {})
+    assert len(validated_on) == 1 and validated_on[0] != loop_thread
+    await client.aclose()
+
+
+async def test_acreate_job_validates_webhook_url_off_the_event_loop(tmp_path, monkeypatch):
+    loop_thread = threading.get_ident()
+    validated_on = []
+    monkeypatch.setattr(webhooks, "JOBS_DIR", tmp_path)
+    monkeypatch.setattr(webhooks, "_jobs", {})
+    monkeypatch.setattr(
+        webhooks, "_validate_webhook_url", lambda url: validated_on.append(threading.get_ident())
+    )
+
+    job_id = await webhooks.acreate_job(
+        CouncilAsyncRequest(query="q", webhook_url="https://hooks.example.com/done")
+    )
+
+    assert webhooks._jobs[job_id]["status"] == JobStatus.PENDING
+    assert len(validated_on) == 1 and validated_on[0] != loop_thread
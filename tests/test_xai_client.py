@@ -1,11 +1,12 @@
 """Tests for xAI response usage normalization."""
 
+import json
 import logging
 
 import pytest
 
 from backend.provider_errors import XAIInvalidUsageError
-from backend.xai_client import normalize_xai_usage, query_xai_model
+from backend.xai_client import get_xai_model_id, normalize_xai_usage, query_xai_model
 
 
 class FakeResponse:
@@ -15,11 +16,17 @@ class FakeResponse:
     def raise_for_status(self):
         return None
 
-    def json(self):
-        return {
+    @property
+    def content(self):
+        return json.dumps({
             "choices": [{"message": {"content": "visible answer"}}],
             "usage": self._usage,
-        }
+        }).encode()
+
+
+def test_get_xai_model_id_strips_only_the_leading_provider_prefix():
+    assert get_xai_model_id("x-ai/grok-custom") == "grok-custom"
+    assert get_xai_model_id("grok-custom/x-ai/") == "grok-custom/x-ai/"
 
 
 def test_normalize_xai_usage_preserves_consistent_counts_and_metadata():
@@ -93,21 +100,12 @@ async def test_query_xai_model_returns_normalized_usage(monkeypatch):
         "completion_tokens_details": {"reasoning_tokens": 138},
     }
 
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, headers, json):
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
             return FakeResponse(usage)
 
     monkeypatch.setattr("backend.xai_client.GROK_API_KEY", "test-key")
-    monkeypatch.setattr("backend.xai_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.xai_client.get_client", lambda name: FakeClient())
 
     result = await query_xai_model("x-ai/grok-4.5", [{"role": "user", "content": "test"}])
 
@@ -122,23 +120,14 @@ async def test_query_xai_model_returns_normalized_usage(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_query_xai_model_propagates_bounded_invalid_usage(monkeypatch):
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, headers, json):
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
             return FakeResponse(
                 {"prompt_tokens": 240, "completion_tokens": 13, "total_tokens": 200}
             )
 
     monkeypatch.setattr("backend.xai_client.GROK_API_KEY", "test-key")
-    monkeypatch.setattr("backend.xai_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.xai_client.get_client", lambda name: FakeClient())
 
     with pytest.raises(XAIInvalidUsageError):
         await query_xai_model("x-ai/grok-4.5", [{"role": "user", "content": "test"}])
@@ -148,21 +137,12 @@ async def test_query_xai_model_propagates_bounded_invalid_usage(monkeypatch):
 async def test_query_xai_model_redacts_unexpected_exception_text(monkeypatch, caplog):
     sentinel = "secret-response-fragment"
 
-    class FakeAsyncClient:
-        def __init__(self, timeout):
-            self.timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, headers, json):
+    class FakeClient:
+        async def post(self, url, headers, content, timeout):
             raise RuntimeError(sentinel)
 
     monkeypatch.setattr("backend.xai_client.GROK_API_KEY", "test-key")
-    monkeypatch.setattr("backend.xai_client.httpx.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr("backend.xai_client.get_client", lambda name: FakeClient())
 
     with caplog.at_level(logging.ERROR, logger="llm-council.xai"):
         assert await query_xai_model(